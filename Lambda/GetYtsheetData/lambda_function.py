@@ -1,24 +1,49 @@
 # -*- coding: utf-8 -*-
 
-from json import dumps, loads
-from time import sleep
+from __future__ import annotations
+
+from hashlib import sha256
+from json import dumps
+from time import perf_counter, sleep
+from typing import TYPE_CHECKING, Union
+from urllib.parse import urlparse
 
-from aws_lambda_powertools.utilities.typing import LambdaContext
 from MyLibrary.CommonFunction import (
-    ConvertDynamoDBToJson,
+    ConvertDynamoDBToView,
     ConvertJsonToDynamoDB,
     GetCurrentDateTimeForDynamoDB,
     InitDb,
-    MakeYtsheetUrl,
+    QueryItems,
 )
-from MyLibrary.Constant import TableName
-from mypy_boto3_dynamodb.client import DynamoDBClient
-from requests import Response, get
+from MyLibrary.Constant import TableName, Ytsheet
+from MyLibrary.FetchPlan import FetchPlan
+from MyLibrary.TokenBucket import TokenBucket
+from MyLibrary.YtsheetClient import FetchYtsheetWithRetry, YtsheetResponse
+from MyLibrary.YtsheetCodec import EncodeCharacter
+from MyLibrary.YtsheetCrawler import YtsheetCrawler
+from MyLibrary.YtsheetProjection import IsCurrentProjection, ProjectYtsheetData
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.typing import LambdaContext
+    from mypy_boto3_dynamodb.client import DynamoDBClient
+    from mypy_boto3_dynamodb.type_defs import (
+        BatchGetItemOutputTypeDef,
+        GetItemOutputTypeDef,
+    )
 
 """
 ゆとシートからデータを取得
 """
 
+# タイムアウト前に処理を打ち切るための余裕(ミリ秒)
+DEADLINE_MARGIN_MILLISECONDS: int = 10000
+
+# 1シートあたりの処理時間の見積もり初期値(ミリ秒)
+SHEET_ESTIMATED_MILLISECONDS: int = 6000
+
+# BatchGetItemで1回に取得できる最大件数
+BATCH_GET_ITEM_MAX_KEYS: int = 100
+
 
 def lambda_handler(event: dict, context: LambdaContext):
     """
@@ -30,67 +55,792 @@ def lambda_handler(event: dict, context: LambdaContext):
         context LambdaContext: コンテキスト
     """
 
+    fullRefresh: bool = bool(event.get("FullRefresh", False))
+    baseUrl: str = event.get("BaseUrl", Ytsheet.BASE_URL)
+    if "Seasons" in event:
+        # 複数シーズンを一括取得
+        return crawlSeasons(
+            list(
+                map(
+                    lambda x: (
+                        int(x["SeasonId"]),
+                        ConvertDynamoDBToView(x["Players"]),
+                    ),
+                    event["Seasons"],
+                )
+            ),
+            event.get("Crawler", {}),
+            fullRefresh,
+            event.get("RateLimit"),
+            baseUrl,
+        )
+
     seasonId: int = int(event["SeasonId"])
-    index: int = event["Index"]
-    player: dict = ConvertDynamoDBToJson(event["Players"][index])
+    if event.get("Migrate", False):
+        # 圧縮されていないPC情報を圧縮して保存し直す
+        return migrateCharacters(seasonId)
+
+    if "Index" in event:
+        # 1プレイヤーずつ取得
+        index: int = event["Index"]
+        player: dict = ConvertDynamoDBToView(event["Players"][index])
+
+        dynamoDb: DynamoDBClient = InitDb()
+        failedSheets: list[dict] = updatePlayers(
+            dynamoDb,
+            seasonId,
+            player,
+            fullRefresh,
+            rateLimiter=makeRateLimiter(
+                dynamoDb, event.get("RateLimit"), baseUrl
+            ),
+            baseUrl=baseUrl,
+        )
+        if len(failedSheets) > 0:
+            # 取得できたPCは保存済み、失敗したシートを通知する
+            raise Exception(dumps(failedSheets, ensure_ascii=False))
+
+        return
+
+    if "StartIndex" in event:
+        # 指定範囲のプレイヤーをまとめて取得
+        startIndex: int = int(event["StartIndex"])
+        count: int = int(event.get("Count", len(event["Players"])))
+        players: list[dict] = ConvertDynamoDBToView(
+            event["Players"][startIndex : startIndex + count]
+        )
+        result: dict = updatePlayersBatch(
+            seasonId,
+            players,
+            context,
+            fullRefresh,
+            event.get("RateLimit"),
+            baseUrl,
+        )
+        result["NextIndex"] = startIndex + result.pop("ProcessedCount")
+        return result
+
+    if "PlayerIds" in event:
+        # 指定IDのプレイヤーをまとめて取得
+        playerIds: set[int] = set(map(int, event["PlayerIds"]))
+        players: list[dict] = [
+            x
+            for x in ConvertDynamoDBToView(event["Players"])
+            if int(x["id"]) in playerIds
+        ]
+        result: dict = updatePlayersBatch(
+            seasonId,
+            players,
+            context,
+            fullRefresh,
+            event.get("RateLimit"),
+            baseUrl,
+        )
+        result["RemainingPlayerIds"] = list(
+            map(
+                lambda x: int(x["id"]),
+                players[result.pop("ProcessedCount") :],
+            )
+        )
+        return result
+
+    # シーズン全体を一括取得
+    return crawlSeasons(
+        [(seasonId, ConvertDynamoDBToView(event["Players"]))],
+        event.get("Crawler", {}),
+        fullRefresh,
+        event.get("RateLimit"),
+        baseUrl,
+    )
+
+
+def updatePlayersBatch(
+    seasonId: int,
+    players: "list[dict]",
+    context: LambdaContext,
+    fullRefresh: bool = False,
+    rateLimit: Union[dict, None] = None,
+    baseUrl: str = Ytsheet.BASE_URL,
+) -> dict:
+    """複数プレイヤーのPCを順番に更新する
+    タイムアウトしそうな場合は途中で打ち切る
+
+    Args:
+        seasonId int: シーズンID
+        players list[dict]: プレイヤー情報
+        context LambdaContext: コンテキスト
+        fullRefresh bool:
+            True 前回取得時のETagとLast-Modifiedを使わずに全件取得し直す
+        rateLimit Union[dict, None]: 他のLambdaと共有する流量制限の設定
+        baseUrl str: ゆとシートのURL
+    Returns:
+        dict: 処理結果
+    """
+
+    dynamoDb: DynamoDBClient = InitDb()
+    rateLimiter: Union[TokenBucket, None] = makeRateLimiter(
+        dynamoDb, rateLimit, baseUrl
+    )
+    sheetMilliseconds: float = SHEET_ESTIMATED_MILLISECONDS
+
+    # 複数プレイヤーに登録されたシートは1回だけ取得する
+    fetchedCharacters: dict[str, Union[dict, None]] = {}
+    failedPlayers: list[dict] = []
+    failedSheets: list[dict] = []
+    processedCount: int = 0
+    for player in players:
+        # 1人目は必ず処理する
+        requiredMilliseconds: float = (
+            DEADLINE_MARGIN_MILLISECONDS
+            + len(player["ytsheet_ids"]) * sheetMilliseconds
+        )
+        if (
+            processedCount > 0
+            and context.get_remaining_time_in_millis() < requiredMilliseconds
+        ):
+            break
+
+        startTime: float = perf_counter()
+        try:
+            failedSheets += updatePlayers(
+                dynamoDb,
+                seasonId,
+                player,
+                fullRefresh,
+                fetchedCharacters,
+                rateLimiter,
+                baseUrl,
+            )
+        except Exception as e:
+            # 失敗したプレイヤーは記録して次へ
+            failedPlayers.append(
+                {
+                    "PlayerId": int(player["id"]),
+                    "Error": type(e).__name__,
+                    "Cause": str(e),
+                }
+            )
+
+        # 1シートあたりの処理時間の見積もりを更新
+        if len(player["ytsheet_ids"]) > 0:
+            sheetMilliseconds = max(
+                sheetMilliseconds,
+                (perf_counter() - startTime)
+                * 1000
+                / len(player["ytsheet_ids"]),
+            )
+
+        processedCount += 1
+
+    return {
+        "ProcessedCount": processedCount,
+        "FailedPlayers": failedPlayers,
+        "FailedSheets": failedSheets,
+    }
+
+
+def crawlSeasons(
+    seasons: "list[tuple[int, list[dict]]]",
+    config: dict,
+    fullRefresh: bool = False,
+    rateLimit: Union[dict, None] = None,
+    baseUrl: str = Ytsheet.BASE_URL,
+) -> dict:
+    """複数シーズンのPCを一括取得して更新する
+    同じゆとシートは1回だけ取得し、所有する全てのプレイヤーに反映する
+
+    Args:
+        seasons list[tuple[int, list[dict]]]: シーズンIDとプレイヤー情報
+        config dict: クローラーの設定
+        fullRefresh bool:
+            True 前回取得時のETagとLast-Modifiedを使わずに全件取得し直す
+        rateLimit Union[dict, None]: 他のLambdaと共有する流量制限の設定
+        baseUrl str: ゆとシートのURL、クローラーの設定で上書きできる
+    Returns:
+        dict: 処理結果
+    """
+
+    dynamoDb: DynamoDBClient = InitDb()
+    baseUrl = config.get("BaseUrl", baseUrl)
+    crawler: YtsheetCrawler = YtsheetCrawler(
+        int(config.get("MaxConcurrency", Ytsheet.CRAWLER_MAX_CONCURRENCY)),
+        int(config.get("HostConcurrency", Ytsheet.CRAWLER_HOST_CONCURRENCY)),
+        float(config.get("HostInterval", Ytsheet.CRAWLER_HOST_INTERVAL)),
+        baseUrl,
+        makeRateLimiter(dynamoDb, rateLimit, baseUrl),
+    )
+
+    fetchPlan: FetchPlan = FetchPlan()
+    for seasonId, players in seasons:
+        fetchPlan.AddSeason(seasonId, players)
+
+    # 前回取得時のデータ
+    # 全件取得し直す場合も、取得に失敗したシートに使うため読み込む
+    seasonCharacters: dict[tuple[int, int], list[dict]] = {}
+    for seasonId, players in seasons:
+        for playerId, characters in loadSeasonCharacters(
+            dynamoDb, seasonId, players
+        ).items():
+            seasonCharacters[(seasonId, playerId)] = characters
+
+    storedCharacters: dict[str, dict] = {}
+    for characters in seasonCharacters.values():
+        storedCharacters.update(indexCharacters(characters))
+
+    startTime: float = perf_counter()
+    responses: dict[str, YtsheetResponse] = crawler.Run(
+        fetchPlan.GetYtsheetIds(),
+        (
+            {}
+            if fullRefresh
+            else {
+                ytsheetId: getValidators(character)
+                for ytsheetId, character in storedCharacters.items()
+            }
+        ),
+    )
+    crawlSeconds: float = perf_counter() - startTime
+
+    # 取得できたシートのみ反映
+    characters: dict[str, Union[dict, None]] = {
+        ytsheetId: makeCharacter(
+            ytsheetId, response, storedCharacters.get(ytsheetId)
+        )
+        for ytsheetId, response in responses.items()
+    }
+
+    # 更新
+    updatedPlayerCount: int = 0
+    for seasonId, player in fetchPlan.Players:
+        updateCharacters: list[dict] = [
+            characters[x]
+            for x in player["ytsheet_ids"]
+            if characters[x] is not None
+        ]
+        if putCharacters(
+            dynamoDb,
+            seasonId,
+            player["id"],
+            updateCharacters,
+            seasonCharacters.get((seasonId, player["id"]), []),
+        ):
+            updatedPlayerCount += 1
 
-    updatePlayers(seasonId, player)
+    return {
+        "PlayerCount": len(fetchPlan.Players),
+        "UpdatedPlayerCount": updatedPlayerCount,
+        "CharacterCount": len(responses),
+        "DuplicateCount": fetchPlan.CountDuplicates(),
+        "NotModifiedCount": len(
+            [x for x in responses.values() if x.IsNotModified()]
+        ),
+        "CrawlSeconds": round(crawlSeconds, 3),
+        "FailedSheets": [
+            makeFailedSheet(ytsheetId, response)
+            for ytsheetId, response in responses.items()
+            if response.IsFailed()
+        ],
+    }
 
 
-def updatePlayers(seasonId: int, player: dict):
+def updatePlayers(
+    dynamoDb: DynamoDBClient,
+    seasonId: int,
+    player: dict,
+    fullRefresh: bool = False,
+    fetchedCharacters: "Union[dict[str, Union[dict, None]], None]" = None,
+    rateLimiter: Union[TokenBucket, None] = None,
+    baseUrl: str = Ytsheet.BASE_URL,
+) -> "list[dict]":
     """PCを更新する
+    取得に失敗したシートは前回取得時のデータを使い、ない場合は除いて保存する
 
     Args:
+        dynamoDb DynamoDBClient: DynamoDBクライアント
         seasonId id: シーズンID
         player dict: プレイヤー情報
+        fullRefresh bool:
+            True 前回取得時のETagとLast-Modifiedを使わずに全件取得し直す
+        fetchedCharacters Union[dict[str, Union[dict, None]], None]:
+            同じ処理内で取得済みのPC情報、取得したPC情報を追加する
+        rateLimiter Union[TokenBucket, None]: 他のLambdaと共有する流量制限
+        baseUrl str: ゆとシートのURL
+    Returns:
+        list[dict]: 取得に失敗したシート
     """
 
+    if fetchedCharacters is None:
+        fetchedCharacters = {}
+
+    # 前回取得時のデータ
+    # 全件取得し直す場合も、取得に失敗したシートに使うため読み込む
+    characters: list[dict] = loadCharacters(dynamoDb, seasonId, player)
+    storedCharacters: dict[str, dict] = indexCharacters(characters)
+
     updateCharacters: list = []
+    failedSheets: list[dict] = []
     for ytsheetId in player["ytsheet_ids"]:
-        character: dict = {
-            "ytsheet_id": ytsheetId,
-            "ytsheet_json": dumps(
-                getYtsheetData(ytsheetId), ensure_ascii=False
-            ),
-        }
-        updateCharacters.append(character)
+        if ytsheetId not in fetchedCharacters:
+            # 取得済みでない場合のみ取得
+            storedCharacter: Union[dict, None] = storedCharacters.get(
+                ytsheetId
+            )
+            etag, lastModified = (
+                ("", "") if fullRefresh else getValidators(storedCharacter)
+            )
+            response: YtsheetResponse = getYtsheetData(
+                ytsheetId, etag, lastModified, rateLimiter, baseUrl
+            )
+            if response.IsFailed():
+                failedSheets.append(makeFailedSheet(ytsheetId, response))
+
+            fetchedCharacters[ytsheetId] = makeCharacter(
+                ytsheetId, response, storedCharacter
+            )
+
+        character: Union[dict, None] = fetchedCharacters[ytsheetId]
+        if character is None and ytsheetId in storedCharacters:
+            # 他のプレイヤーの処理で取得に失敗したシートは前回取得時のデータを残す
+            character = EncodeCharacter(storedCharacters[ytsheetId])
+
+        if character is not None:
+            updateCharacters.append(character)
 
     # 更新
+    putCharacters(
+        dynamoDb, seasonId, player["id"], updateCharacters, characters
+    )
+
+    return failedSheets
+
+
+def loadCharacters(
+    dynamoDb: DynamoDBClient, seasonId: int, player: dict
+) -> "list[dict]":
+    """DBに登録済みのPC情報を取得する
+
+    Args:
+        dynamoDb DynamoDBClient: DynamoDBクライアント
+        seasonId int: シーズンID
+        player dict: プレイヤー情報
+    Returns:
+        list[dict]: PC情報
+    """
+
+    if Ytsheet.STORE_CHARACTERS_SEPARATELY:
+        # PCごとの項目から取得
+        storedCharacters: dict[str, dict] = batchGetCharacters(
+            dynamoDb, seasonId, player["ytsheet_ids"]
+        )
+        return [
+            storedCharacters[x]
+            for x in player["ytsheet_ids"]
+            if x in storedCharacters
+        ]
+
+    response: GetItemOutputTypeDef = dynamoDb.get_item(
+        TableName=TableName.PLAYERS,
+        Key=ConvertJsonToDynamoDB({"season_id": seasonId, "id": player["id"]}),
+        ProjectionExpression="characters",
+    )
+    item: dict = ConvertDynamoDBToView(response.get("Item", {}))
+
+    return item.get("characters", [])
+
+
+def loadSeasonCharacters(
+    dynamoDb: DynamoDBClient, seasonId: int, players: "list[dict]"
+) -> "dict[int, list[dict]]":
+    """シーズン全体のDBに登録済みのPC情報を取得する
+
+    Args:
+        dynamoDb DynamoDBClient: DynamoDBクライアント
+        seasonId int: シーズンID
+        players list[dict]: プレイヤー情報
+    Returns:
+        dict[int, list[dict]]: プレイヤーIDごとのPC情報
+    """
+
+    expressionAttributeValues: dict = ConvertJsonToDynamoDB(
+        {":season_id": seasonId}
+    )
+    if Ytsheet.STORE_CHARACTERS_SEPARATELY:
+        # PCごとの項目から取得してプレイヤーごとにまとめる
+        storedCharacters: dict[str, dict] = {}
+        for item in QueryItems(
+            dynamoDb,
+            TableName=TableName.CHARACTERS,
+            KeyConditionExpression="season_id = :season_id",
+            ExpressionAttributeValues=expressionAttributeValues,
+        ):
+            character: dict = toCharacter(item)
+            storedCharacters[character["ytsheet_id"]] = character
+
+        return {
+            player["id"]: [
+                storedCharacters[x]
+                for x in player["ytsheet_ids"]
+                if x in storedCharacters
+            ]
+            for player in players
+        }
+
+    return {
+        player["id"]: player.get("characters", [])
+        for player in ConvertDynamoDBToView(
+            list(
+                QueryItems(
+                    dynamoDb,
+                    TableName=TableName.PLAYERS,
+                    ProjectionExpression="id, characters",
+                    KeyConditionExpression="season_id = :season_id",
+                    ExpressionAttributeValues=expressionAttributeValues,
+                )
+            )
+        )
+    }
+
+
+def batchGetCharacters(
+    dynamoDb: DynamoDBClient, seasonId: int, ytsheetIds: "list[str]"
+) -> "dict[str, dict]":
+    """charactersテーブルからPC情報をまとめて取得する
+
+    Args:
+        dynamoDb DynamoDBClient: DynamoDBクライアント
+        seasonId int: シーズンID
+        ytsheetIds list[str]: ゆとシートのID
+    Returns:
+        dict[str, dict]: ゆとシートのIDごとのPC情報
+    """
+
+    characters: dict[str, dict] = {}
+    uniqueYtsheetIds: list[str] = list(dict.fromkeys(ytsheetIds))
+
+    # 1回で取得できる件数ごとに分割
+    for i in range(0, len(uniqueYtsheetIds), BATCH_GET_ITEM_MAX_KEYS):
+        requestItems: dict = {
+            TableName.CHARACTERS: {
+                "Keys": list(
+                    map(
+                        lambda x: ConvertJsonToDynamoDB(
+                            {"season_id": seasonId, "ytsheet_id": x}
+                        ),
+                        uniqueYtsheetIds[i : i + BATCH_GET_ITEM_MAX_KEYS],
+                    )
+                )
+            }
+        }
+        while len(requestItems) > 0:
+            response: BatchGetItemOutputTypeDef = dynamoDb.batch_get_item(
+                RequestItems=requestItems
+            )
+            for item in response["Responses"].get(TableName.CHARACTERS, []):
+                character: dict = toCharacter(item)
+                characters[character["ytsheet_id"]] = character
+
+            requestItems = response["UnprocessedKeys"]
+
+    return characters
+
+
+def toCharacter(item: dict) -> dict:
+    """charactersテーブルの項目をPC情報に変換する
+
+    Args:
+        item dict: charactersテーブルから取得した変換前の項目
+    Returns:
+        dict: PC情報
+    """
+
+    return ConvertDynamoDBToView(
+        {
+            key: value
+            for key, value in item.items()
+            if key not in ("season_id", "update_time")
+        }
+    )
+
+
+def indexCharacters(characters: "list[dict]") -> "dict[str, dict]":
+    """PC情報をゆとシートのIDで引けるようにする
+
+    Args:
+        characters list[dict]: PC情報
+    Returns:
+        dict[str, dict]: ゆとシートのIDごとのPC情報
+    """
+
+    return {character["ytsheet_id"]: character for character in characters}
+
+
+def getValidators(character: Union[dict, None]) -> "tuple[str, str]":
+    """前回取得時のETagとLast-Modifiedを取得する
+
+    Args:
+        character Union[dict, None]: DBに登録済みのPC情報
+    Returns:
+        tuple[str, str]: ETagとLast-Modified
+    """
+
+    if character is None or not IsCurrentProjection(character):
+        # 保存するキーの定義が変わった場合は取得し直す
+        return ("", "")
+
+    return (character.get("etag", ""), character.get("last_modified", ""))
+
+
+def makeCharacter(
+    ytsheetId: str,
+    response: YtsheetResponse,
+    storedCharacter: Union[dict, None] = None,
+) -> Union[dict, None]:
+    """DBに登録するPC情報を作成する
+
+    Args:
+        ytsheetId str: ゆとシートのID
+        response YtsheetResponse: ゆとシートの取得結果
+        storedCharacter Union[dict, None]: DBに登録済みのPC情報
+    Returns:
+        Union[dict, None]: PC情報、取得に失敗して前回取得時のデータもない場合はNone
+    """
+
+    if response.IsFailed():
+        # 失敗した場合は前回取得時のデータを残す
+        if storedCharacter is None:
+            return None
+
+        return EncodeCharacter(storedCharacter)
+
+    if response.IsNotModified():
+        # 未更新の場合は前回取得時のデータをそのまま使う
+        if storedCharacter is None:
+            raise Exception("前回取得時のデータがありません")
+
+        # 圧縮されていない場合は圧縮して保存し直す
+        return EncodeCharacter(storedCharacter)
+
+    # 集計に使うキーのみ保存する
+    ytsheetJson: str = dumps(
+        ProjectYtsheetData(response.Data or {}), ensure_ascii=False
+    )
+    character: dict = {
+        "ytsheet_id": ytsheetId,
+        "ytsheet_json": ytsheetJson,
+        "ytsheet_hash": sha256(ytsheetJson.encode()).hexdigest(),
+        "projection_version": Ytsheet.PROJECTION_VERSION,
+    }
+    if response.ETag != "":
+        character["etag"] = response.ETag
+    if response.LastModified != "":
+        character["last_modified"] = response.LastModified
+
+    return EncodeCharacter(character)
+
+
+def makeFailedSheet(ytsheetId: str, response: YtsheetResponse) -> dict:
+    """取得に失敗したシートの情報を作成する
+
+    Args:
+        ytsheetId str: ゆとシートのID
+        response YtsheetResponse: ゆとシートの取得結果
+    Returns:
+        dict: 取得に失敗したシートの情報
+    """
+
+    return {
+        "YtsheetId": ytsheetId,
+        "Error": response.Error,
+        "Cause": response.Cause,
+    }
+
+
+def migrateCharacters(seasonId: int) -> dict:
+    """DBに登録済みのPC情報を現在の圧縮形式で保存し直す
+    ゆとシートへのアクセスと更新日時の変更は行わない
+
+    Args:
+        seasonId int: シーズンID
+    Returns:
+        dict: 処理結果
+    """
+
     dynamoDb: DynamoDBClient = InitDb()
+    if Ytsheet.STORE_CHARACTERS_SEPARATELY:
+        # PCごとの項目を保存し直す
+        migratedCharacterCount: int = 0
+        for item in QueryItems(
+            dynamoDb,
+            TableName=TableName.CHARACTERS,
+            KeyConditionExpression="season_id = :season_id",
+            ExpressionAttributeValues=ConvertJsonToDynamoDB(
+                {":season_id": seasonId}
+            ),
+        ):
+            character: dict = ConvertDynamoDBToView(item)
+            encodedCharacter: dict = EncodeCharacter(character)
+            if encodedCharacter == character:
+                continue
+
+            dynamoDb.put_item(
+                TableName=TableName.CHARACTERS,
+                Item=ConvertJsonToDynamoDB(encodedCharacter),
+            )
+            migratedCharacterCount += 1
+
+        return {"MigratedCharacterCount": migratedCharacterCount}
+
+    migratedPlayerCount: int = 0
+    for playerId, characters in loadSeasonCharacters(
+        dynamoDb, seasonId, []
+    ).items():
+        encodedCharacters: list[dict] = list(map(EncodeCharacter, characters))
+        if encodedCharacters == characters:
+            continue
+
+        dynamoDb.update_item(
+            TableName=TableName.PLAYERS,
+            Key=ConvertJsonToDynamoDB({"season_id": seasonId, "id": playerId}),
+            UpdateExpression="SET characters = :characters",
+            ExpressionAttributeValues=ConvertJsonToDynamoDB(
+                {":characters": encodedCharacters}
+            ),
+        )
+        migratedPlayerCount += 1
+
+    return {"MigratedPlayerCount": migratedPlayerCount}
+
+
+def putCharacters(
+    dynamoDb: DynamoDBClient,
+    seasonId: int,
+    playerId: int,
+    characters: "list[dict]",
+    storedCharacters: "list[dict]",
+) -> bool:
+    """プレイヤーのPC情報を更新する
+    DBに登録済みのPC情報から変化がない場合は更新しない
+
+    Args:
+        dynamoDb DynamoDBClient: DynamoDBクライアント
+        seasonId int: シーズンID
+        playerId int: プレイヤーID
+        characters list[dict]: PC情報
+        storedCharacters list[dict]: DBに登録済みのPC情報
+    Returns:
+        bool: True 更新した
+    """
+
+    if characters == storedCharacters:
+        return False
+
     updateTime: str = GetCurrentDateTimeForDynamoDB()
+    if Ytsheet.STORE_CHARACTERS_SEPARATELY:
+        # 変化があったPCのみ保存
+        indexedStoredCharacters: dict[str, dict] = indexCharacters(
+            storedCharacters
+        )
+        for character in characters:
+            if (
+                indexedStoredCharacters.get(character["ytsheet_id"])
+                == character
+            ):
+                continue
+
+            item: dict = {"season_id": seasonId, "update_time": updateTime}
+            item.update(character)
+            dynamoDb.put_item(
+                TableName=TableName.CHARACTERS,
+                Item=ConvertJsonToDynamoDB(item),
+            )
+
+        # プレイヤーには更新日時のみ保存
+        dynamoDb.update_item(
+            TableName=TableName.PLAYERS,
+            Key=ConvertJsonToDynamoDB({"season_id": seasonId, "id": playerId}),
+            UpdateExpression="SET update_time = :update_time REMOVE characters",
+            ExpressionAttributeValues=ConvertJsonToDynamoDB(
+                {":update_time": updateTime}
+            ),
+        )
+        return True
+
     dynamoDb.update_item(
         TableName=TableName.PLAYERS,
-        Key=ConvertJsonToDynamoDB({"season_id": seasonId, "id": player["id"]}),
+        Key=ConvertJsonToDynamoDB({"season_id": seasonId, "id": playerId}),
         UpdateExpression="SET characters = :characters, "
         " update_time = :update_time",
         ExpressionAttributeValues=ConvertJsonToDynamoDB(
             {
-                ":characters": updateCharacters,
+                ":characters": characters,
                 ":update_time": updateTime,
             }
         ),
     )
 
+    return True
 
-def getYtsheetData(ytsheetId: str) -> dict:
-    """
 
-    メイン処理
+def makeRateLimiter(
+    dynamoDb: DynamoDBClient,
+    rateLimit: Union[dict, None],
+    baseUrl: str = Ytsheet.BASE_URL,
+) -> Union[TokenBucket, None]:
+    """他のLambdaと共有する流量制限を作成する
 
     Args:
-        ytsheetId str: ゆとシートのID
+        dynamoDb DynamoDBClient: DynamoDBクライアント
+        rateLimit Union[dict, None]: 流量制限の設定
+        baseUrl str: ゆとシートのURL
     Returns:
-        dict: ゆとシートから取得したデータ
+        Union[TokenBucket, None]: 流量制限、設定がない場合はNone
     """
 
-    # 連続リクエスト抑制
-    sleep(5)
+    if rateLimit is None:
+        return None
 
-    # ゆとシートにアクセス
-    url: str = f"{MakeYtsheetUrl(ytsheetId)}&mode=json"
-    response: Response = get(url)
+    # アクセス先のホストごとに制限する
+    return TokenBucket(
+        dynamoDb,
+        urlparse(baseUrl).netloc,
+        float(rateLimit.get("Rate", Ytsheet.RATE_LIMIT_PER_SECOND)),
+        float(rateLimit.get("Capacity", Ytsheet.RATE_LIMIT_CAPACITY)),
+    )
+
+
+def getYtsheetData(
+    ytsheetId: str,
+    etag: str = "",
+    lastModified: str = "",
+    rateLimiter: Union[TokenBucket, None] = None,
+    baseUrl: str = Ytsheet.BASE_URL,
+) -> YtsheetResponse:
+    """
 
-    # ステータスコード200以外は例外発生
-    response.raise_for_status()
+    メイン処理
 
-    return loads(response.text)
+    Args:
+        ytsheetId str: ゆとシートのID
+        etag str: 前回取得時のETag
+        lastModified str: 前回取得時のLast-Modified
+        rateLimiter Union[TokenBucket, None]: 他のLambdaと共有する流量制限
+        baseUrl str: ゆとシートのURL
+    Returns:
+        YtsheetResponse: ゆとシートの取得結果、失敗した場合も例外は発生させない
+    """
+
+    try:
+        # 毎回のリクエスト前に連続リクエスト抑制
+        return FetchYtsheetWithRetry(
+            ytsheetId,
+            baseUrl,
+            etag=etag,
+            lastModified=lastModified,
+            beforeRequest=(
+                rateLimiter.Acquire
+                if rateLimiter is not None
+                else lambda: sleep(5)
+            ),
+        )
+    except Exception as e:
+        return YtsheetResponse.Failed(e)
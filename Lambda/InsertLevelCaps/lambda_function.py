@@ -1,20 +1,23 @@
 # -*- coding: utf-8 -*-
 
+from __future__ import annotations
+
 from datetime import datetime
-from zoneinfo import ZoneInfo
+from typing import TYPE_CHECKING
 
-from aws_lambda_powertools.utilities.typing import LambdaContext
+from MyLibrary.BatchWriter import BatchWriter
 from MyLibrary.CommonFunction import (
+    JST,
     ConvertJsonToDynamoDB,
     DateTimeToStrForDynamoDB,
     InitDb,
 )
 from MyLibrary.Constant import TableName
-from mypy_boto3_dynamodb.client import DynamoDBClient
-from mypy_boto3_dynamodb.type_defs import (
-    BatchWriteItemOutputTypeDef,
-    WriteRequestTypeDef,
-)
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.typing import LambdaContext
+    from mypy_boto3_dynamodb.client import DynamoDBClient
+    from mypy_boto3_dynamodb.type_defs import WriteRequestTypeDef
 
 """
 level_capsに登録
@@ -34,18 +37,21 @@ def lambda_handler(event: dict, context: LambdaContext):
     seasonId: int = int(event["SeasonId"])
     levelCaps: list[dict[str, str]] = event["LevelCaps"]
 
-    insertLevelCaps(levelCaps, seasonId)
+    return {"ConsumedCapacityUnits": insertLevelCaps(levelCaps, seasonId)}
 
 
 def insertLevelCaps(
     levelCaps: "list[dict[str, str]]",
     seasonId: int,
-):
+) -> float:
     """レベルキャップを挿入する
 
     Args:
         levelCaps: list[dict[str, str]]: レベルキャップ
         seasonId: int: シーズンID
+
+    Returns:
+        float: 消費したキャパシティユニット
     """
 
     dynamoDb: DynamoDBClient = InitDb()
@@ -55,7 +61,7 @@ def insertLevelCaps(
         # JSTをGMTに変換
         startDatetimeInJst: datetime = datetime.strptime(
             levelCap["startDatetime"], r"%Y/%m/%d"
-        ).replace(tzinfo=ZoneInfo("Asia/Tokyo"))
+        ).replace(tzinfo=JST)
 
         requestItem: WriteRequestTypeDef = {}
         requestItem["PutRequest"] = {"Item": {}}
@@ -68,11 +74,4 @@ def insertLevelCaps(
         requestItem["PutRequest"]["Item"] = ConvertJsonToDynamoDB(item)
         requestItems.append(requestItem)
 
-    response: BatchWriteItemOutputTypeDef = dynamoDb.batch_write_item(
-        RequestItems={TableName.LEVEL_CAPS: requestItems}
-    )
-
-    while response["UnprocessedItems"] != {}:
-        response = dynamoDb.batch_write_item(
-            RequestItems=response["UnprocessedItems"]
-        )
+    return BatchWriter(dynamoDb, TableName.LEVEL_CAPS).Write(requestItems)
@@ -1,26 +1,33 @@
 # -*- coding: utf-8 -*-
 
-from typing import Union
+from __future__ import annotations
 
-from aws_lambda_powertools.utilities.typing import LambdaContext
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Union
+
+from MyLibrary.BatchWriter import BatchWriter
 from MyLibrary.CommonFunction import (
     ConvertDynamoDBToJson,
+    ConvertDynamoDBToView,
     ConvertJsonToDynamoDB,
     GetCurrentDateTimeForDynamoDB,
     InitDb,
+    QueryItems,
 )
 from MyLibrary.Constant import IndexName, TableName
-from mypy_boto3_dynamodb.client import DynamoDBClient
-from mypy_boto3_dynamodb.type_defs import (
-    BatchWriteItemOutputTypeDef,
-    QueryOutputTypeDef,
-    WriteRequestTypeDef,
-)
+from MyLibrary.IdAllocator import IdAllocator
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.typing import LambdaContext
+    from mypy_boto3_dynamodb.client import DynamoDBClient
+    from mypy_boto3_dynamodb.type_defs import QueryOutputTypeDef
 
 """
 Playersに登録
 """
 
+# 一括登録時の同時書き込み数
+WRITE_CONCURRENCY: int = 8
 
 DynamoDb: Union[DynamoDBClient, None] = None
 
@@ -41,8 +48,11 @@ def lambda_handler(event: dict, context: LambdaContext):
     players: list[dict] = event["Players"]
 
     DynamoDb = InitDb()
-    maxId: int = GetMaxId(seasonId)
-    putPlayers(players, seasonId, maxId)
+    if not event.get("BulkSync", True):
+        # 1プレイヤーずつ存在チェックして登録
+        return {"ConsumedCapacityUnits": putPlayers(players, seasonId)}
+
+    return {"ConsumedCapacityUnits": syncPlayers(players, seasonId)}
 
 
 def GetMaxId(seasonId: int) -> int:
@@ -54,61 +64,203 @@ def GetMaxId(seasonId: int) -> int:
     Returns:
         int: 最大ID
     """
+
+    players: list[dict] = loadSeasonPlayers(seasonId, "id")
+    if len(players) == 0:
+        return 0
+
+    maxId: dict = max(players, key=(lambda player: player["id"]))
+
+    return int(maxId["id"])
+
+
+def makeIdAllocator(seasonId: int) -> IdAllocator:
+    """シーズンのプレイヤーIDの採番を作成する
+
+    Args:
+        seasonId int: シーズンID
+
+    Returns:
+        IdAllocator: プレイヤーIDの採番
+    """
     global DynamoDb
 
     if DynamoDb is None:
         raise Exception("DynamoDBが初期化されていません")
 
-    projectionExpression: str = "id"
-    KeyConditionExpression: str = "season_id = :season_id"
-    expressionAttributeValues: dict = ConvertJsonToDynamoDB(
-        {":season_id": seasonId}
-    )
-    response: QueryOutputTypeDef = DynamoDb.query(
-        TableName=TableName.PLAYERS,
-        ProjectionExpression=projectionExpression,
-        KeyConditionExpression=KeyConditionExpression,
-        ExpressionAttributeValues=expressionAttributeValues,
+    return IdAllocator(
+        DynamoDb,
+        f"{TableName.PLAYERS}:{seasonId}",
+        lambda: GetMaxId(seasonId),
     )
 
-    # ページ分割分を取得
-    players: "list[dict]" = []
-    while "LastEvaluatedKey" in response:
-        players += response["Items"]
-        response = DynamoDb.query(
+
+def loadSeasonPlayers(
+    seasonId: int,
+    projectionExpression: str,
+    expressionAttributeNames: Union[dict, None] = None,
+) -> "list[dict]":
+    """シーズンの全プレイヤーを取得する
+
+    Args:
+        seasonId int: シーズンID
+        projectionExpression str: 取得する属性
+        expressionAttributeNames Union[dict, None]: 属性名の置換
+
+    Returns:
+        list[dict]: プレイヤー情報
+    """
+    global DynamoDb
+
+    if DynamoDb is None:
+        raise Exception("DynamoDBが初期化されていません")
+
+    queryArguments: dict = {}
+    if expressionAttributeNames is not None:
+        queryArguments["ExpressionAttributeNames"] = expressionAttributeNames
+
+    players: list[dict] = list(
+        QueryItems(
+            DynamoDb,
             TableName=TableName.PLAYERS,
             ProjectionExpression=projectionExpression,
-            KeyConditionExpression=KeyConditionExpression,
-            ExpressionAttributeValues=expressionAttributeValues,
-            ExclusiveStartKey=response["LastEvaluatedKey"],
+            KeyConditionExpression="season_id = :season_id",
+            ExpressionAttributeValues=ConvertJsonToDynamoDB(
+                {":season_id": seasonId}
+            ),
+            **queryArguments,
         )
+    )
 
-    players += response["Items"]
+    return ConvertDynamoDBToView(players)
 
-    if len(players) == 0:
-        return 0
 
-    players = ConvertDynamoDBToJson(players)
-    maxId: dict = max(players, key=(lambda player: player["id"]))
+def syncPlayers(players: "list[dict]", seasonId: int) -> float:
+    """シーズンの全プレイヤーを1回で取得し、差分のみ登録する
 
-    return int(maxId["id"])
+    Args:
+        players: list[dict]: PC情報
+        seasonId: int: シーズンID
+
+    Returns:
+        float: 新規作成で消費したキャパシティユニット
+    """
+    global DynamoDb
+
+    if DynamoDb is None:
+        raise Exception("DynamoDBが初期化されていません")
+
+    # 登録済みのプレイヤー名ごとのプレイヤー
+    existsPlayers: dict[str, dict] = {}
+    for existsPlayer in loadSeasonPlayers(
+        seasonId, "id, #name, ytsheet_ids", {"#name": "name"}
+    ):
+        existsPlayers.setdefault(existsPlayer["name"], existsPlayer)
+
+    # プレイヤー名ごとに追加するゆとシートのIDをまとめる
+    newYtsheetIds: dict[str, list[str]] = {}
+    for player in players:
+        ytsheetIds: list[str] = newYtsheetIds.setdefault(player["Name"], [])
+        existsYtsheetIds: list[str] = existsPlayers.get(
+            player["Name"], {}
+        ).get("ytsheet_ids", [])
+        if (
+            player["YtsheetId"] not in ytsheetIds
+            and player["YtsheetId"] not in existsYtsheetIds
+        ):
+            ytsheetIds.append(player["YtsheetId"])
+
+    updateTime: str = GetCurrentDateTimeForDynamoDB()
+    newPlayers: list[dict] = []
+    appendPlayers: list[tuple[int, list[str]]] = []
+    for name, ytsheetIds in newYtsheetIds.items():
+        if len(ytsheetIds) == 0:
+            continue
+
+        if name in existsPlayers:
+            # 更新
+            appendPlayers.append((int(existsPlayers[name]["id"]), ytsheetIds))
+            continue
+
+        # 新規作成
+        newPlayer: dict = {
+            "season_id": seasonId,
+            "name": name,
+            "ytsheet_ids": ytsheetIds,
+            "characters": [],
+            "update_time": updateTime,
+        }
+        newPlayers.append(newPlayer)
+
+    # 新規作成する人数分のIDをまとめて確保
+    for id, newPlayer in zip(
+        makeIdAllocator(seasonId).Reserve(len(newPlayers)), newPlayers
+    ):
+        newPlayer["id"] = id
+
+    with ThreadPoolExecutor(WRITE_CONCURRENCY) as executor:
+        # 新規作成と並行して追記する
+        futures: list = [
+            executor.submit(
+                appendYtsheetIds, seasonId, playerId, ytsheetIds, updateTime
+            )
+            for playerId, ytsheetIds in appendPlayers
+        ]
+        consumedCapacityUnits: float = BatchWriter(
+            DynamoDb, TableName.PLAYERS, WRITE_CONCURRENCY
+        ).PutItems(newPlayers)
+
+        # 失敗した場合は例外を発生させる
+        for future in futures:
+            future.result()
+
+    return consumedCapacityUnits
 
 
-def putPlayers(players: "list[dict]", seasonId: int, maxId: int):
+def appendYtsheetIds(
+    seasonId: int, playerId: int, ytsheetIds: "list[str]", updateTime: str
+):
+    """登録済みのプレイヤーにゆとシートのIDを追加する
+
+    Args:
+        seasonId: int: シーズンID
+        playerId: int: プレイヤーID
+        ytsheetIds: list[str]: 追加するゆとシートのID
+        updateTime: str: 更新日時
+    """
+    global DynamoDb
+
+    if DynamoDb is None:
+        raise Exception("DynamoDBが初期化されていません")
+
+    DynamoDb.update_item(
+        TableName=TableName.PLAYERS,
+        Key=ConvertJsonToDynamoDB({"season_id": seasonId, "id": playerId}),
+        UpdateExpression="SET ytsheet_ids = "
+        " list_append(ytsheet_ids, :new_ytsheet_id), "
+        " update_time = :update_time",
+        ExpressionAttributeValues=ConvertJsonToDynamoDB(
+            {":new_ytsheet_id": ytsheetIds, ":update_time": updateTime}
+        ),
+    )
+
+
+def putPlayers(players: "list[dict]", seasonId: int) -> float:
     """Playersを挿入する
 
     Args:
         players: list[dict]: PC情報
         seasonId: int: シーズンID
-        maxId: int: 既存IDの最大値
+
+    Returns:
+        float: 新規作成で消費したキャパシティユニット
     """
     global DynamoDb
 
     if DynamoDb is None:
         raise Exception("DynamoDBが初期化されていません")
 
-    id: int = maxId
-    requestItems: list[WriteRequestTypeDef] = []
+    newPlayers: list[dict] = []
     for player in players:
         # プレイヤー名で存在チェック
         queryResult: QueryOutputTypeDef = DynamoDb.query(
@@ -143,28 +295,19 @@ def putPlayers(players: "list[dict]", seasonId: int, maxId: int):
             continue
 
         # 新規作成
-        id += 1
         newPlayer: dict = {
             "season_id": seasonId,
-            "id": id,
             "name": player["Name"],
             "ytsheet_ids": [player["YtsheetId"]],
             "characters": [],
             "update_time": GetCurrentDateTimeForDynamoDB(),
         }
-        requestItem: WriteRequestTypeDef = {}
-        requestItem["PutRequest"] = {"Item": {}}
-        requestItem["PutRequest"]["Item"] = ConvertJsonToDynamoDB(newPlayer)
-        requestItems.append(requestItem)
+        newPlayers.append(newPlayer)
 
-    if len(requestItems) == 0:
-        return
+    # 新規作成する人数分のIDをまとめて確保
+    for id, newPlayer in zip(
+        makeIdAllocator(seasonId).Reserve(len(newPlayers)), newPlayers
+    ):
+        newPlayer["id"] = id
 
-    response: BatchWriteItemOutputTypeDef = DynamoDb.batch_write_item(
-        RequestItems={TableName.PLAYERS: requestItems}
-    )
-
-    while response["UnprocessedItems"] != {}:
-        response = DynamoDb.batch_write_item(
-            RequestItems=response["UnprocessedItems"]
-        )
+    return BatchWriter(DynamoDb, TableName.PLAYERS).PutItems(newPlayers)
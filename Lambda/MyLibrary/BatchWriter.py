@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from random import uniform
+from time import sleep
+from typing import TYPE_CHECKING
+
+from MyLibrary.CommonFunction import ConvertJsonToDynamoDB
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.client import DynamoDBClient
+    from mypy_boto3_dynamodb.type_defs import (
+        BatchWriteItemOutputTypeDef,
+        WriteRequestTypeDef,
+    )
+
+"""
+DynamoDBへの一括書き込み
+"""
+
+# BatchWriteItemで1回に書き込める最大件数
+BATCH_WRITE_MAX_ITEMS: int = 25
+
+# 同時に書き込む件数の初期値
+_DEFAULT_CONCURRENCY: int = 4
+
+# 未処理の項目を再送する最大回数
+_DEFAULT_MAX_RETRIES: int = 8
+
+# 再送までの待ち時間の基準(秒)、再送するごとに倍にする
+_RETRY_BASE_SECONDS: float = 0.05
+
+# 再送までの最大待ち時間(秒)
+_RETRY_MAX_SECONDS: float = 5.0
+
+
+class BatchWriter:
+    """
+    DynamoDBへの一括書き込み
+    25件ずつに分割して並列に書き込み、未処理の項目は間隔を空けて再送する
+    """
+
+    def __init__(
+        self,
+        dynamoDb: DynamoDBClient,
+        tableName: str,
+        concurrency: int = _DEFAULT_CONCURRENCY,
+        maxRetries: int = _DEFAULT_MAX_RETRIES,
+    ):
+        """
+        コンストラクタ
+
+        dynamoDb DynamoDBClient: DynamoDBクライアント
+        tableName str: テーブル名
+        concurrency int: 同時に書き込む件数
+        maxRetries int: 未処理の項目を再送する最大回数
+        """
+
+        self._dynamoDb: DynamoDBClient = dynamoDb
+        self.TableName: str = tableName
+        self.Concurrency: int = concurrency
+        self.MaxRetries: int = maxRetries
+
+        # 書き込みで消費したキャパシティユニット
+        self.ConsumedCapacityUnits: float = 0.0
+
+    def PutItems(self, items: "list[dict]") -> float:
+        """
+
+        項目をまとめて登録する
+
+        Args:
+            items list[dict]: 登録する項目
+        Returns:
+            float: 消費したキャパシティユニット
+        """
+
+        return self.Write(
+            list(
+                map(
+                    lambda x: {
+                        "PutRequest": {"Item": ConvertJsonToDynamoDB(x)}
+                    },
+                    items,
+                )
+            )
+        )
+
+    def Write(self, requestItems: "list[WriteRequestTypeDef]") -> float:
+        """
+
+        書き込み内容をまとめて書き込む
+
+        Args:
+            requestItems list[WriteRequestTypeDef]: 書き込み内容
+        Returns:
+            float: 消費したキャパシティユニット
+        """
+
+        chunks: list[list[WriteRequestTypeDef]] = [
+            requestItems[i : i + BATCH_WRITE_MAX_ITEMS]
+            for i in range(0, len(requestItems), BATCH_WRITE_MAX_ITEMS)
+        ]
+        if len(chunks) == 0:
+            return 0.0
+
+        with ThreadPoolExecutor(
+            min(self.Concurrency, len(chunks))
+        ) as executor:
+            consumedCapacityUnits: float = sum(
+                executor.map(self._WriteChunk, chunks)
+            )
+
+        self.ConsumedCapacityUnits += consumedCapacityUnits
+        return consumedCapacityUnits
+
+    def _WriteChunk(self, requestItems: "list[WriteRequestTypeDef]") -> float:
+        """
+
+        25件以内の書き込み内容を書き込む
+        未処理の項目は間隔を空けて再送する
+
+        Args:
+            requestItems list[WriteRequestTypeDef]: 書き込み内容
+        Returns:
+            float: 消費したキャパシティユニット
+        """
+
+        consumedCapacityUnits: float = 0.0
+        retryCount: int = 0
+        while True:
+            response: BatchWriteItemOutputTypeDef = (
+                self._dynamoDb.batch_write_item(
+                    RequestItems={self.TableName: requestItems},
+                    ReturnConsumedCapacity="TOTAL",
+                )
+            )
+            consumedCapacityUnits += sum(
+                map(
+                    lambda x: x.get("CapacityUnits", 0.0),
+                    response.get("ConsumedCapacity", []),
+                )
+            )
+
+            requestItems = response["UnprocessedItems"].get(self.TableName, [])
+            if len(requestItems) == 0:
+                return consumedCapacityUnits
+
+            if retryCount >= self.MaxRetries:
+                raise Exception("書き込めなかった項目があります")
+
+            # スロットリング中に連続で再送しないよう揺らぎを加えて待つ
+            sleep(
+                uniform(
+                    0,
+                    min(
+                        _RETRY_MAX_SECONDS,
+                        _RETRY_BASE_SECONDS * 2**retryCount,
+                    ),
+                )
+            )
+            retryCount += 1
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+
+from threading import Lock
+from time import monotonic
+
+from MyLibrary.Constant import Ytsheet
+
+"""
+接続先ごとのサーキットブレーカー
+"""
+
+
+class CircuitOpenError(Exception):
+    """
+    接続先が停止中と判断してリクエストを送らなかった
+    """
+
+
+class CircuitBreaker:
+    """
+    接続先ごとのサーキットブレーカー
+    連続して失敗した接続先へは一定時間リクエストを送らない
+    """
+
+    def __init__(
+        self,
+        host: str,
+        failureThreshold: int = Ytsheet.CIRCUIT_FAILURE_THRESHOLD,
+        resetSeconds: float = Ytsheet.CIRCUIT_RESET_SECONDS,
+    ):
+        """
+        コンストラクタ
+
+        host str: 接続先
+        failureThreshold int: 遮断するまでの連続失敗回数
+        resetSeconds float: 遮断してから試しに1回送るまでの時間(秒)
+        """
+
+        self.Host: str = host
+        self.FailureThreshold: int = failureThreshold
+        self.ResetSeconds: float = resetSeconds
+        self._lock: Lock = Lock()
+        self._failureCount: int = 0
+        self._openUntil: float = 0.0
+        self._trialRunning: bool = False
+
+    def Before(self) -> None:
+        """
+
+        リクエストを送ってよいか確認する
+        遮断中の場合は例外を発生させる
+        遮断時間を過ぎた後は、結果が出るまで1回だけ試しに送らせる
+        """
+
+        with self._lock:
+            if self._failureCount < self.FailureThreshold:
+                return
+
+            if monotonic() < self._openUntil or self._trialRunning:
+                raise self.MakeOpenError()
+
+            self._trialRunning = True
+
+    def RecordSuccess(self) -> None:
+        """
+
+        成功を記録して遮断を解除する
+        """
+
+        with self._lock:
+            self._failureCount = 0
+            self._trialRunning = False
+
+    def RecordFailure(self, openSeconds: float = 0.0) -> None:
+        """
+
+        失敗を記録する
+        連続失敗回数が上限に達した場合は遮断する
+
+        Args:
+            openSeconds float: 遮断する最低時間(秒)、Retry-Afterの指定など
+        """
+
+        with self._lock:
+            self._failureCount += 1
+            self._trialRunning = False
+            if openSeconds > 0:
+                # 接続先から待つよう指示された場合はすぐに遮断
+                self._failureCount = max(
+                    self._failureCount, self.FailureThreshold
+                )
+
+            if self._failureCount >= self.FailureThreshold:
+                self._openUntil = monotonic() + max(
+                    self.ResetSeconds, openSeconds
+                )
+
+    def MakeOpenError(self) -> CircuitOpenError:
+        """
+
+        遮断中を表す例外を作成する
+
+        Returns:
+            CircuitOpenError: 遮断中を表す例外
+        """
+
+        return CircuitOpenError(f"{self.Host} への接続を遮断中です")
+
+    def IsOpen(self) -> bool:
+        """
+
+        遮断中かを返す
+
+        Returns:
+            bool: True 遮断中
+        """
+
+        with self._lock:
+            return (
+                self._failureCount >= self.FailureThreshold
+                and monotonic() < self._openUntil
+            )
+
+
+# コンテナ内で共有する接続先ごとのサーキットブレーカー
+_circuitBreakers: dict[str, CircuitBreaker] = {}
+_circuitBreakersLock: Lock = Lock()
+
+
+def GetCircuitBreaker(host: str) -> CircuitBreaker:
+    """
+
+    接続先のサーキットブレーカーを返す
+
+    Args:
+        host str: 接続先
+    Returns:
+        CircuitBreaker: サーキットブレーカー
+    """
+
+    with _circuitBreakersLock:
+        if host not in _circuitBreakers:
+            _circuitBreakers[host] = CircuitBreaker(host)
+
+        return _circuitBreakers[host]
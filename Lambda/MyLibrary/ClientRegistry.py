@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+from threading import Lock
+from typing import TYPE_CHECKING, Union
+
+from MyLibrary.Constant import Aws
+
+if TYPE_CHECKING:
+    from botocore.config import Config
+
+"""
+コンテナ内で使い回すAWSクライアント
+"""
+
+# サービス名ごとに作成済みのクライアント
+_clients: dict[str, object] = {}
+_clientsLock: Lock = Lock()
+
+# 全てのクライアントに共通の設定、初めてクライアントを作成するときに作成する
+_config: Union[Config, None] = None
+
+
+def _CreateConfig() -> Config:
+    """
+
+    全てのクライアントに共通の設定を作成する
+
+    Returns:
+        Config: クライアントの設定
+    """
+
+    from botocore.config import Config
+
+    return Config(
+        region_name=Aws.REGION_NAME,
+        max_pool_connections=Aws.CLIENT_MAX_POOL_CONNECTIONS,
+        tcp_keepalive=True,
+        connect_timeout=Aws.CLIENT_CONNECT_TIMEOUT,
+        read_timeout=Aws.CLIENT_READ_TIMEOUT,
+        retries={
+            "mode": Aws.CLIENT_RETRY_MODE,
+            "total_max_attempts": Aws.CLIENT_RETRY_MAX_ATTEMPTS,
+        },
+    )
+
+
+def GetClient(serviceName: str):
+    """
+
+    AWSクライアントを返す
+    コンテナ内で初めて呼ばれたときのみ作成し、以降は同じクライアントを返す
+    boto3は初めてクライアントを作成するときに読み込む
+
+    Args:
+        serviceName str: サービス名
+    Returns:
+        AWSクライアント
+    """
+
+    # 作成済みの場合はロックを取らずに返す
+    if serviceName in _clients:
+        return _clients[serviceName]
+
+    global _config
+
+    with _clientsLock:
+        if serviceName not in _clients:
+            from boto3 import client
+
+            if _config is None:
+                _config = _CreateConfig()
+
+            _clients[serviceName] = client(serviceName, config=_config)
+
+        return _clients[serviceName]
@@ -1,23 +1,63 @@
 # -*- coding: utf-8 -*-
 
+from __future__ import annotations
 
-from datetime import datetime
-from functools import singledispatch
-from typing import Union
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Iterator
 
-from boto3 import client
-from mypy_boto3_dynamodb.client import DynamoDBClient
-from pytz import timezone
+from MyLibrary.ClientRegistry import GetClient
+from MyLibrary.Constant import Ytsheet
+from MyLibrary.DynamoDBCodec import DecodeItem, EncodeItem, LazyItem
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.client import DynamoDBClient
+    from mypy_boto3_dynamodb.type_defs import QueryOutputTypeDef
 
 """
 汎用関数
 """
 
+# 協定世界時
+UTC: timezone = timezone.utc
+
+# 日本標準時
+# 1951年以降は夏時間がないため固定のオフセットで扱う
+JST: timezone = timezone(timedelta(hours=9), "JST")
+
+# スプレッドシートが理解できる日時の形式
+SPREADSHEET_DATETIME_FORMAT: str = "%Y/%m/%d %H:%M:%S"
+
 
 def InitDb() -> DynamoDBClient:
-    """DBに接続する"""
+    """DBに接続する
+    クライアントはコンテナ内で使い回す
+    """
 
-    return client("dynamodb", region_name="ap-northeast-1")
+    return GetClient("dynamodb")
+
+
+def QueryItems(dynamoDb: DynamoDBClient, **queryArguments) -> Iterator[dict]:
+    """
+
+    ページ分割分も含めてクエリ結果を1件ずつ返す
+
+    Args:
+        dynamoDb DynamoDBClient: DynamoDBクライアント
+        queryArguments: queryの引数
+    Returns:
+        Iterator[dict]: 取得した項目
+    """
+
+    response: QueryOutputTypeDef = dynamoDb.query(**queryArguments)
+    yield from response["Items"]
+
+    # ページ分割分を取得
+    while "LastEvaluatedKey" in response:
+        response = dynamoDb.query(
+            **queryArguments, ExclusiveStartKey=response["LastEvaluatedKey"]
+        )
+        yield from response["Items"]
 
 
 def ConvertToVerticalHeaders(horizontalHeaders: list[str]) -> list[str]:
@@ -41,7 +81,6 @@ def ConvertToVerticalHeaders(horizontalHeaders: list[str]) -> list[str]:
     )
 
 
-@singledispatch
 def ConvertDynamoDBToJson(dynamoDBData):
     """
 
@@ -49,179 +88,163 @@ def ConvertDynamoDBToJson(dynamoDBData):
     未対応の型の場合、例外を発生させる
 
     Args:
-        dynamoDBData: DynamoDBから取得したデータ
+        dynamoDBData Union[dict, list]: DynamoDBから取得した項目か項目のリスト
+    Returns:
+        Union[dict, list]: 変換後のJSON
     """
+
+    if isinstance(dynamoDBData, dict):
+        return DecodeItem(dynamoDBData)
+    elif isinstance(dynamoDBData, list):
+        return list(map(DecodeItem, dynamoDBData))
+
     raise Exception("未対応の型です")
 
 
-@ConvertDynamoDBToJson.register  # type: ignore
-def _(dynamoDBData: dict) -> dict:
+def ConvertDynamoDBToView(dynamoDBData):
     """
 
-    DynamoDBから取得したデータを適切な型に変換する
+    DynamoDBから取得したデータを読み込んだ属性のみ変換するビューにする
+    大きな項目の一部の属性のみ使う場合に変換の手間とメモリを抑える
 
     Args:
-        dynamoDBData dict: DynamoDBから取得したデータ
+        dynamoDBData Union[dict, list]: DynamoDBから取得した項目か項目のリスト
     Returns:
-        dict: 変換後のJSON
+        Union[LazyItem, list[LazyItem]]: 変換前のデータのビュー
     """
 
-    convertedJson: dict = {}
-    for key, value in dynamoDBData.items():
-        if isinstance(value, dict):
-            # 適切な型に変換する
-            convertedJson[key] = _ConvertDynamoDBToJsonByTypeKey(value)
-        else:
-            raise Exception("未対応の型です")
+    if isinstance(dynamoDBData, dict):
+        return LazyItem(dynamoDBData)
+    elif isinstance(dynamoDBData, list):
+        return list(map(LazyItem, dynamoDBData))
 
-    return convertedJson
+    raise Exception("未対応の型です")
 
 
-@ConvertDynamoDBToJson.register  # type: ignore
-def _(dynamoDBData: list) -> list:
+def ConvertJsonToDynamoDB(json: dict) -> dict:
     """
 
-    DynamoDBから取得したデータを適切な型に変換する
+    データをDynamoDBで扱える型に変換する
 
     Args:
-        dynamoDBData list: DynamoDBから取得したデータ
+        json dict: 変換するデータ
     Returns:
-        list: 変換後のJSON
+        dict: 変換後のデータ
     """
-    return list(map(ConvertDynamoDBToJson, dynamoDBData))
 
+    return EncodeItem(json)
 
-def _ConvertDynamoDBToJsonByTypeKey(
-    dynamoDBData: dict,
-) -> Union[str, float, list, dict]:
+
+def GetCurrentDateTimeForDynamoDB() -> str:
     """
 
-    DynamoDBから取得したデータを適切な型に変換する
+    DynamoDBに登録するための現在日時文字列を取得
 
-    Args:
-        dynamoDBData dict: DynamoDBから取得したデータ
     Returns:
-        Union[str, float, list, dict]: 変換後のJSON
-    """
-
-    key = next(iter(dynamoDBData.keys()))
-    value = next(iter(dynamoDBData.values()))
-    if key == "S":
-        # 文字列
-        return value
-    elif key == "N":
-        # 数値
-        return float(value)
-    elif key == "M":
-        # 辞書
-        return ConvertDynamoDBToJson(value)
-    elif key == "L":
-        # リスト
-        return list(map(_ConvertDynamoDBToJsonByTypeKey, value))
+        str: 現在日時文字列
+    """
 
-    raise Exception("未対応の型です")
+    return DateTimeToStrForDynamoDB(datetime.now(UTC))
 
 
-def ConvertJsonToDynamoDB(json: dict) -> dict:
+def DateTimeToStrForDynamoDB(target: datetime) -> str:
     """
 
-    データをDynamoDBで扱える型に変換する
+    DynamoDBに登録するための日時文字列を取得
+    タイムゾーンがない日時はGMTとして扱う
 
     Args:
-        json dict: 変換するデータ
+        target datetime: 変換する日時
     Returns:
-        dict: 変換後のデータ
+        str: 日時文字列
     """
-    convertedJson: dict = {}
-    for key, value in json.items():
-        convertedJson[key] = _ConvertJsonToDynamoDBByTypeKey(value)
 
-    return convertedJson
+    gmt: datetime = target
+    if target.tzinfo is not None:
+        if target.tzinfo is not UTC:
+            gmt = target.astimezone(UTC)
+        gmt = gmt.replace(tzinfo=None)
+
+    return f"{gmt.isoformat(timespec='milliseconds')}Z"
 
 
-def _ConvertJsonToDynamoDBByTypeKey(
-    value: Union[str, int, float, dict, list]
-) -> dict:
+def DateTimesToStrsForDynamoDB(targets: Iterable[datetime]) -> list[str]:
     """
 
-    データをDynamoDBで扱える型に変換する
+    DynamoDBに登録するための日時文字列をまとめて取得
 
     Args:
-        json dict: 変換するデータ
+        targets Iterable[datetime]: 変換する日時
     Returns:
-        dict: 変換後のデータ
+        list[str]: 日時文字列
     """
-    # 適切な型に変換する
-    if isinstance(value, str):
-        # 文字列
-        return {"S": value}
-    elif isinstance(value, (int, float)):
-        # 数値
-        return {"N": str(value)}
-    elif isinstance(value, dict):
-        # 辞書
-        return {"M": ConvertJsonToDynamoDB(value)}
-    elif isinstance(value, list):
-        # リスト
-        return {
-            "L": list(map(lambda x: _ConvertJsonToDynamoDBByTypeKey(x), value))
-        }
-    else:
-        raise Exception("未対応の型です")
 
+    return list(map(DateTimeToStrForDynamoDB, targets))
 
-def GetCurrentDateTimeForDynamoDB() -> str:
+
+def StrForDynamoDBToDateTime(target: str) -> datetime:
     """
 
-    DynamoDBに登録するための現在日時文字列を取得
+    DynamoDBに登録された日時文字列からdatetimeを取得
 
+    Args:
+        target str: 日時文字列
     Returns:
-        str: 現在日時文字列
+        datetime: 日本標準時の日時
     """
 
-    return DateTimeToStrForDynamoDB(datetime.now())
+    # 末尾のZをオフセットに置き換えて、GMTの日時として1回で読み込む
+    if target.endswith("Z"):
+        target = f"{target[:-1]}+00:00"
 
+    utc: datetime = datetime.fromisoformat(target)
+    if utc.tzinfo is None:
+        utc = utc.replace(tzinfo=UTC)
 
-def DateTimeToStrForDynamoDB(target: datetime) -> str:
+    return utc.astimezone(JST)
+
+
+def StrsForDynamoDBToDateTimes(targets: Iterable[str]) -> list[datetime]:
     """
 
-    DynamoDBに登録するための日時文字列を取得
+    DynamoDBに登録された日時文字列からまとめてdatetimeを取得
 
     Args:
-        target datetime: 変換する日時
+        targets Iterable[str]: 日時文字列
     Returns:
-        str: 日時文字列
+        list[datetime]: 日本標準時の日時
     """
-    gmt = target
-    if target.tzinfo is not None:
-        gmt = target.astimezone(None).replace(tzinfo=None)
 
-    return f"{gmt.isoformat(timespec='milliseconds')}Z"
+    return list(map(StrForDynamoDBToDateTime, targets))
 
 
-def StrForDynamoDBToDateTime(target: str) -> datetime:
+@lru_cache(maxsize=1024)
+def StrForDynamoDBToStrForSpreadsheet(target: str) -> str:
     """
 
-    DynamoDBに登録された日時文字列からdatetimeを取得
+    DynamoDBに登録された日時文字列をスプレッドシートが理解できる形式に変換
+    同じ処理で更新したPLは更新日時が同じため、変換結果を使い回す
 
     Args:
         target str: 日時文字列
     Returns:
-        datetime: 日時
+        str: 日本標準時の日時文字列
     """
-    isoStr = target.removesuffix("Z")
-    utc: datetime = datetime.fromisoformat(isoStr)
-    return utc.astimezone(timezone("Asia/Tokyo"))
+
+    return StrForDynamoDBToDateTime(target).strftime(
+        SPREADSHEET_DATETIME_FORMAT
+    )
 
 
-def MakeYtsheetUrl(id: str) -> str:
+def MakeYtsheetUrl(id: str, baseUrl: str = Ytsheet.BASE_URL) -> str:
     """
 
     ゆとシートのURLを作成
 
     Args:
         id str: ゆとシートのID
+        baseUrl str: ゆとシートのURL
     Returns:
         str: URL
     """
-    return f"https://yutorize.2-d.jp/ytsheet/sw2.5/?id={id}"
+    return f"{baseUrl}?id={id}"
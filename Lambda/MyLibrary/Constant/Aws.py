@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+
+"""
+AWS関係の定数
+"""
+
+# リージョン
+REGION_NAME: str = "ap-northeast-1"
+
+# 1クライアントあたりの接続プールの接続数
+# 並列に書き込む処理のスレッド数以上にする
+CLIENT_MAX_POOL_CONNECTIONS: int = 16
+
+# 接続のタイムアウト(秒)
+CLIENT_CONNECT_TIMEOUT: float = 3.0
+
+# 読み込みのタイムアウト(秒)
+CLIENT_READ_TIMEOUT: float = 10.0
+
+# 再試行の方式
+# adaptiveはスロットリングを検知すると送信頻度を下げる
+CLIENT_RETRY_MODE: str = "adaptive"
+
+# 最大試行回数(初回を含む)
+CLIENT_RETRY_MAX_ATTEMPTS: int = 5
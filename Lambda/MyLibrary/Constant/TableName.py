@@ -5,5 +5,8 @@
 """
 
 
+CHARACTERS: str = "characters"
+COUNTERS: str = "counters"
 LEVEL_CAPS: str = "level_caps"
 PLAYERS: str = "players"
+RATE_LIMITS: str = "rate_limits"
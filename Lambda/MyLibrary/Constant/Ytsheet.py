@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+from MyLibrary.Constant import SwordWorld
+
+"""
+ゆとシート関係の定数
+"""
+
+# ゆとシートのURL
+BASE_URL: str = "https://yutorize.2-d.jp/ytsheet/sw2.5/"
+
+# クローラー全体の同時ダウンロード数
+CRAWLER_MAX_CONCURRENCY: int = 4
+
+# 同一ホストへの同時接続数
+CRAWLER_HOST_CONCURRENCY: int = 2
+
+# 同一ホストへのリクエスト開始間隔(秒)
+CRAWLER_HOST_INTERVAL: float = 1.0
+
+# ゆとシートへのリクエスト頻度の上限(1秒あたり)
+RATE_LIMIT_PER_SECOND: float = 0.2
+
+# ゆとシートへの連続リクエスト数の上限
+RATE_LIMIT_CAPACITY: float = 1.0
+
+# 接続プールに保持する接続数
+HTTP_POOL_SIZE: int = 10
+
+# 接続のタイムアウト(秒)
+HTTP_CONNECT_TIMEOUT: float = 5.0
+
+# 読み込みのタイムアウト(秒)
+HTTP_READ_TIMEOUT: float = 30.0
+
+# 一時的なエラーの場合に1シートへ送る最大リクエスト数
+RETRY_MAX_ATTEMPTS: int = 4
+
+# 再試行までの待ち時間の基準(秒)、失敗するごとに倍にする
+RETRY_BASE_SECONDS: float = 1.0
+
+# 再試行までの最大待ち時間(秒)
+# Retry-Afterの指定がこれより長い場合は再試行しない
+RETRY_MAX_SECONDS: float = 30.0
+
+# 接続を遮断するまでの連続失敗回数
+CIRCUIT_FAILURE_THRESHOLD: int = 5
+
+# 接続を遮断してから試しに1回送るまでの時間(秒)
+CIRCUIT_RESET_SECONDS: float = 60.0
+
+# DBに保存するときの圧縮形式(none, zlib, zstd)
+STORAGE_CODEC: str = "zlib"
+
+# PCごとにcharactersテーブルへ保存するか
+# Falseの場合はplayersテーブルのcharactersにまとめて保存する
+STORE_CHARACTERS_SEPARATELY: bool = False
+
+# 保存するキーの定義のバージョン
+# PROJECTION_KEYSかPROJECTION_KEY_PATTERNを変更した場合は上げる
+PROJECTION_VERSION: int = 1
+
+# 保存するキー
+# PlayerCharacterで読み込むキーはここに追加する
+PROJECTION_KEYS: "frozenset[str]" = frozenset(
+    [
+        "aka",
+        "age",
+        "birth",
+        "characterName",
+        "combatFeatsAuto",
+        "combatFeatsLv1",
+        "combatFeatsLv1bat",
+        "combatFeatsLv3",
+        "combatFeatsLv5",
+        "combatFeatsLv7",
+        "combatFeatsLv9",
+        "combatFeatsLv11",
+        "combatFeatsLv13",
+        "expTotal",
+        "faith",
+        "faithOther",
+        "freeNote",
+        "gender",
+        "historyGrowTotal",
+        "historyHonorTotal",
+        "historyMoneyTotal",
+        "hpTotal",
+        "initiative",
+        "level",
+        "mndResistTotal",
+        "monsterLore",
+        "mpTotal",
+        "race",
+        "rank",
+        "sin",
+        "vitResistTotal",
+        # 数
+        "armourNum",
+        "commonClassNum",
+        "dishonorItemsNum",
+        "historyNum",
+        "honorItemsNum",
+        "mysticArtsNum",
+        "mysticMagicNum",
+        "weaponNum",
+        # 所持品
+        "items",
+        # 能力値
+        "sttBaseA",
+        "sttBaseB",
+        "sttBaseC",
+        "sttBaseD",
+        "sttBaseE",
+        "sttBaseF",
+        "sttDex",
+        "sttAgi",
+        "sttStr",
+        "sttVit",
+        "sttInt",
+        "sttMnd",
+        "sttAddA",
+        "sttAddB",
+        "sttAddC",
+        "sttAddD",
+        "sttAddE",
+        "sttAddF",
+        "sttEquipA",
+        "sttEquipB",
+        "sttEquipC",
+        "sttEquipD",
+        "sttEquipE",
+        "sttEquipF",
+    ]
+    + list(SwordWorld.SKILLS.keys())
+)
+
+# 保存する連番付きのキー
+PROJECTION_KEY_PATTERN: str = (
+    r"(?:mysticArts|mysticMagic|honorItem|dishonorItem|commonClass|lvCommon)"
+    r"\d+"
+    r"|(?:weapon|armour)\d+(?:Name|Note)"
+    r"|history\d+(?:Gm|Date|Note)"
+)
@@ -0,0 +1,396 @@
+# -*- coding: utf-8 -*-
+
+from collections.abc import Mapping, Sequence
+from decimal import Decimal
+from typing import Callable, Iterable, Iterator, Union
+
+"""
+DynamoDBの属性値の変換
+"""
+
+
+def _DecodeNumber(value: str) -> Union[int, float]:
+    """
+
+    数値を変換する
+    整数はintのまま返す
+
+    Args:
+        value str: DynamoDBの数値
+    Returns:
+        Union[int, float]: 変換後の数値
+    """
+
+    if "." in value or "e" in value or "E" in value:
+        return float(value)
+
+    return int(value)
+
+
+def _DecodeBinary(value: Union[bytes, bytearray]) -> bytes:
+    """
+
+    バイナリを変換する
+
+    Args:
+        value Union[bytes, bytearray]: DynamoDBのバイナリ
+    Returns:
+        bytes: 変換後のバイナリ
+    """
+
+    return value if type(value) is bytes else bytes(value)
+
+
+# 型ごとの変換処理(辞書とリスト以外)
+_SCALAR_DECODERS: dict[str, Callable] = {
+    "S": str,
+    "N": _DecodeNumber,
+    "B": _DecodeBinary,
+    "BOOL": bool,
+    "NULL": lambda _: None,
+    "SS": set,
+    "NS": lambda x: set(map(_DecodeNumber, x)),
+    "BS": lambda x: set(map(_DecodeBinary, x)),
+}
+
+
+def DecodeItem(item: dict) -> dict:
+    """
+
+    DynamoDBから取得した項目を適切な型に変換する
+    未対応の型の場合、例外を発生させる
+
+    Args:
+        item dict: DynamoDBから取得した項目
+    Returns:
+        dict: 変換後のJSON
+    """
+
+    decodedItem: dict = {}
+
+    # 再帰せずに入れ子の辞書とリストを順番に変換する
+    stack: list[tuple[Union[dict, list], Iterable]] = [
+        (decodedItem, item.items())
+    ]
+    decoders: dict[str, Callable] = _SCALAR_DECODERS
+    while len(stack) > 0:
+        target, pairs = stack.pop()
+        for key, attribute in pairs:
+            try:
+                ((typeKey, value),) = attribute.items()
+            except (AttributeError, ValueError):
+                raise Exception("未対応の型です")
+
+            # 出現頻度の高い文字列と数値を先に判定する
+            if typeKey == "S":
+                target[key] = value
+            elif typeKey == "N":
+                target[key] = _DecodeNumber(value)
+            elif typeKey == "M":
+                # 辞書
+                child: Union[dict, list] = {}
+                target[key] = child
+                stack.append((child, value.items()))
+            elif typeKey == "L":
+                # リスト
+                child = [None] * len(value)
+                target[key] = child
+                stack.append((child, enumerate(value)))
+            elif typeKey in decoders:
+                target[key] = decoders[typeKey](value)
+            else:
+                raise Exception("未対応の型です")
+
+    return decodedItem
+
+
+def DecodeValue(attribute: dict):
+    """
+
+    DynamoDBから取得した属性値を適切な型に変換する
+
+    Args:
+        attribute dict: DynamoDBから取得した属性値
+    Returns:
+        変換後の値
+    """
+
+    return DecodeItem({"": attribute})[""]
+
+
+class LazyItem(Mapping):
+    """
+    DynamoDBから取得した項目の読み取り専用のビュー
+    属性は初めて読み込んだときに変換して保持する
+    """
+
+    __slots__ = ("Raw", "_cache")
+
+    def __init__(self, raw: dict):
+        """
+        コンストラクタ
+
+        raw dict: DynamoDBから取得した項目
+        """
+
+        self.Raw: dict = raw
+        self._cache: dict = {}
+
+    def __getitem__(self, key: str):
+        if key in self._cache:
+            return self._cache[key]
+
+        value = _DecodeLazy(self.Raw[key])
+        self._cache[key] = value
+        return value
+
+    def __contains__(self, key) -> bool:
+        # 存在チェックでは変換しない
+        return key in self.Raw
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.Raw)
+
+    def __len__(self) -> int:
+        return len(self.Raw)
+
+    def __eq__(self, other) -> bool:
+        if other is self:
+            return True
+        if type(other) is LazyItem:
+            # 変換前の項目同士はそのまま比較する
+            return self.Raw == other.Raw
+
+        return super().__eq__(other)
+
+    def __repr__(self) -> str:
+        return f"LazyItem({self.Raw!r})"
+
+    def ToDict(self) -> dict:
+        """
+
+        全ての属性を変換した辞書を返す
+
+        Returns:
+            dict: 変換後のJSON
+        """
+
+        return DecodeItem(self.Raw)
+
+
+class LazyList(Sequence):
+    """
+    DynamoDBから取得したリストの読み取り専用のビュー
+    要素は初めて読み込んだときに変換して保持する
+    """
+
+    __slots__ = ("Raw", "_cache")
+
+    def __init__(self, raw: list):
+        """
+        コンストラクタ
+
+        raw list: DynamoDBから取得したリストの要素
+        """
+
+        self.Raw: list = raw
+        self._cache: list = [_NOT_DECODED] * len(raw)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[x] for x in range(*index.indices(len(self.Raw)))]
+
+        value = self._cache[index]
+        if value is _NOT_DECODED:
+            value = _DecodeLazy(self.Raw[index])
+            self._cache[index] = value
+
+        return value
+
+    def __len__(self) -> int:
+        return len(self.Raw)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (list, tuple, LazyList)):
+            return NotImplemented
+
+        if type(other) is LazyList:
+            return self.Raw == other.Raw
+
+        return len(self) == len(other) and all(
+            x is y or x == y for x, y in zip(self, other)
+        )
+
+    def __repr__(self) -> str:
+        return f"LazyList({self.Raw!r})"
+
+
+# 未変換の要素を表す
+_NOT_DECODED: object = object()
+
+
+def _DecodeLazy(attribute: dict):
+    """
+
+    属性値を変換する
+    辞書とリストは中身を変換せずにビューを返す
+
+    Args:
+        attribute dict: DynamoDBから取得した属性値
+    Returns:
+        変換後の値
+    """
+
+    try:
+        ((typeKey, value),) = attribute.items()
+    except (AttributeError, ValueError):
+        raise Exception("未対応の型です")
+
+    if typeKey == "M":
+        return LazyItem(value)
+    elif typeKey == "L":
+        return LazyList(value)
+    elif typeKey in _SCALAR_DECODERS:
+        return _SCALAR_DECODERS[typeKey](value)
+
+    raise Exception("未対応の型です")
+
+
+def _EncodeSet(value: Union[set, frozenset]) -> dict:
+    """
+
+    セットを変換する
+    要素の型で文字列、数値、バイナリのセットを使い分ける
+
+    Args:
+        value Union[set, frozenset]: 変換するセット
+    Returns:
+        dict: DynamoDBのセット
+    """
+
+    if len(value) == 0:
+        raise Exception("空のセットは登録できません")
+
+    if all(isinstance(x, str) for x in value):
+        return {"SS": list(value)}
+    if all(
+        isinstance(x, (int, float, Decimal)) and not isinstance(x, bool)
+        for x in value
+    ):
+        return {"NS": list(map(str, value))}
+    if all(isinstance(x, (bytes, bytearray)) for x in value):
+        return {"BS": list(map(bytes, value))}
+
+    raise Exception("未対応の型です")
+
+
+# 型ごとの変換処理(辞書とリスト以外)
+_SCALAR_ENCODERS: dict[type, Callable] = {
+    str: lambda x: {"S": x},
+    int: lambda x: {"N": str(x)},
+    float: lambda x: {"N": str(x)},
+    Decimal: lambda x: {"N": str(x)},
+    bool: lambda x: {"BOOL": x},
+    type(None): lambda _: {"NULL": True},
+    bytes: lambda x: {"B": x},
+    bytearray: lambda x: {"B": bytes(x)},
+    set: _EncodeSet,
+    frozenset: _EncodeSet,
+}
+
+
+def EncodeItem(data: dict) -> dict:
+    """
+
+    データをDynamoDBで扱える型に変換する
+    未対応の型の場合、例外を発生させる
+
+    Args:
+        data dict: 変換するデータ
+    Returns:
+        dict: 変換後のデータ
+    """
+
+    if type(data) is LazyItem:
+        # 変換前の項目をそのまま使う
+        return data.Raw
+
+    encodedItem: dict = {}
+
+    # 再帰せずに入れ子の辞書とリストを順番に変換する
+    stack: list[tuple[Union[dict, list], Iterable]] = [
+        (encodedItem, data.items())
+    ]
+    encoders: dict[type, Callable] = _SCALAR_ENCODERS
+    while len(stack) > 0:
+        target, pairs = stack.pop()
+        for key, value in pairs:
+            valueType: type = type(value)
+
+            # 出現頻度の高い文字列と数値を先に判定する
+            if valueType is str:
+                target[key] = {"S": value}
+            elif valueType is int or valueType is float:
+                target[key] = {"N": str(value)}
+            elif valueType is dict:
+                # 辞書
+                child: Union[dict, list] = {}
+                target[key] = {"M": child}
+                stack.append((child, value.items()))
+            elif valueType is list or valueType is tuple:
+                # リスト
+                child = [None] * len(value)
+                target[key] = {"L": child}
+                stack.append((child, enumerate(value)))
+            elif valueType in encoders:
+                target[key] = encoders[valueType](value)
+            elif valueType is LazyItem:
+                # 変換前の値をそのまま使う
+                target[key] = {"M": value.Raw}
+            elif valueType is LazyList:
+                target[key] = {"L": value.Raw}
+            elif isinstance(value, Mapping):
+                child = {}
+                target[key] = {"M": child}
+                stack.append((child, value.items()))
+            elif isinstance(value, (list, tuple)):
+                child = [None] * len(value)
+                target[key] = {"L": child}
+                stack.append((child, enumerate(value)))
+            else:
+                target[key] = _EncodeSubclass(value)
+
+    return encodedItem
+
+
+def EncodeValue(value) -> dict:
+    """
+
+    値をDynamoDBの属性値に変換する
+
+    Args:
+        value: 変換する値
+    Returns:
+        dict: DynamoDBの属性値
+    """
+
+    return EncodeItem({"": value})[""]
+
+
+def _EncodeSubclass(value) -> dict:
+    """
+
+    変換処理が登録されていない型を継承元の型として変換する
+
+    Args:
+        value: 変換する値
+    Returns:
+        dict: DynamoDBの属性値
+    """
+
+    # boolはintより先に判定する
+    for valueType in (bool, str, int, float, Decimal, bytes, frozenset, set):
+        if isinstance(value, valueType):
+            return _SCALAR_ENCODERS[valueType](value)
+
+    raise Exception("未対応の型です")
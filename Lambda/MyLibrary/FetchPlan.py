@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+"""
+ゆとシートの取得計画
+"""
+
+
+class FetchPlan:
+    """
+    ゆとシートの取得計画
+    複数シーズンのプレイヤーから重複なくゆとシートのIDを集める
+    """
+
+    def __init__(self):
+        """
+        コンストラクタ
+        """
+
+        # 取得対象のプレイヤー
+        self.Players: list[tuple[int, dict]] = []
+
+        # ゆとシートのIDごとの所有プレイヤー
+        self.Owners: dict[str, list[tuple[int, dict]]] = {}
+
+    def AddSeason(self, seasonId: int, players: "list[dict]") -> None:
+        """
+
+        シーズンのプレイヤーを追加する
+
+        Args:
+            seasonId int: シーズンID
+            players list[dict]: プレイヤー情報
+        """
+
+        for player in players:
+            self.Players.append((seasonId, player))
+            for ytsheetId in player["ytsheet_ids"]:
+                self.Owners.setdefault(ytsheetId, []).append(
+                    (seasonId, player)
+                )
+
+    def GetYtsheetIds(self) -> "list[str]":
+        """
+
+        取得するゆとシートのIDを返す
+
+        Returns:
+            list[str]: 重複を除いたゆとシートのID
+        """
+
+        return list(self.Owners.keys())
+
+    def CountDuplicates(self) -> int:
+        """
+
+        重複により取得を省略できるシート数を返す
+
+        Returns:
+            int: 省略できるシート数
+        """
+
+        return sum(len(x) - 1 for x in self.Owners.values())
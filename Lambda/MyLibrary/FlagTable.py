@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+
+from typing import Iterable, Iterator
+
+from MyLibrary.Constant import SwordWorld
+
+"""
+SW2.5の定数の一覧に対応するフラグ
+"""
+
+
+class FlagTable:
+    """
+    定数の一覧に対応するフラグ
+    一覧の並び順をビット位置として、PCが持つ項目を1つの整数にまとめる
+    """
+
+    __slots__ = ("Keys", "_indexes")
+
+    def __init__(self, keys: Iterable[str]):
+        """
+        コンストラクタ
+
+        keys Iterable[str]: 一覧の項目を表すキー、並び順がビット位置になる
+        """
+
+        self.Keys: tuple[str, ...] = tuple(keys)
+
+        # キーごとのビット位置
+        self._indexes: dict[str, int] = {}
+        for index, key in enumerate(self.Keys):
+            self._indexes.setdefault(key, index)
+
+    def __len__(self) -> int:
+        return len(self.Keys)
+
+    def __contains__(self, key) -> bool:
+        return key in self._indexes
+
+    def Index(self, key: str) -> int:
+        """
+
+        キーのビット位置を返す
+
+        Args:
+            key str: キー
+        Returns:
+            int: ビット位置
+        """
+
+        return self._indexes[key]
+
+    def ToFlags(self, keys: Iterable[str]) -> int:
+        """
+
+        キーをフラグにまとめる
+
+        Args:
+            keys Iterable[str]: キー、一覧にないものは無視する
+        Returns:
+            int: フラグ
+        """
+
+        flags: int = 0
+        for key in keys:
+            index: int = self._indexes.get(key, -1)
+            if index >= 0:
+                flags |= 1 << index
+
+        return flags
+
+    def ToKeys(self, flags: int) -> "list[str]":
+        """
+
+        フラグが立っている項目のキーを一覧の順に返す
+
+        Args:
+            flags int: フラグ
+        Returns:
+            list[str]: キー
+        """
+
+        return [self.Keys[x] for x in _IterateIndexes(flags)]
+
+    def ToCells(self, flags: int, value, empty="") -> list:
+        """
+
+        フラグをスプレッドシートの1行分のセルに変換する
+
+        Args:
+            flags int: フラグ
+            value: フラグが立っている項目のセルの値
+            empty: フラグが立っていない項目のセルの値
+        Returns:
+            list: 一覧の順に並べたセルの値
+        """
+
+        cells: list = [empty] * len(self.Keys)
+        for index in _IterateIndexes(flags):
+            cells[index] = value
+
+        return cells
+
+    def CountColumns(self, flagsList: Iterable[int]) -> "list[int]":
+        """
+
+        項目ごとにフラグが立っている数を数える
+
+        Args:
+            flagsList Iterable[int]: PCごとのフラグ
+        Returns:
+            list[int]: 一覧の順に並べた項目ごとの数
+        """
+
+        counts: list[int] = [0] * len(self.Keys)
+        for flags in flagsList:
+            for index in _IterateIndexes(flags):
+                counts[index] += 1
+
+        return counts
+
+
+def CountFlags(flags: int) -> int:
+    """
+
+    立っているフラグの数を返す
+
+    Args:
+        flags int: フラグ
+    Returns:
+        int: フラグの数
+    """
+
+    # int.bit_countはPython3.10以降のため文字列で数える
+    return bin(flags).count("1")
+
+
+def _IterateIndexes(flags: int) -> Iterator[int]:
+    """
+
+    立っているフラグのビット位置を小さい順に返す
+    立っているフラグの数だけ繰り返す
+
+    Args:
+        flags int: フラグ
+    Returns:
+        Iterator[int]: ビット位置
+    """
+
+    while flags:
+        lowest: int = flags & -flags
+        yield lowest.bit_length() - 1
+        flags ^= lowest
+
+
+# 冒険者技能
+SKILL_FLAGS: FlagTable = FlagTable(SwordWorld.SKILLS)
+
+# 流派
+STYLE_FLAGS: FlagTable = FlagTable(x.Name for x in SwordWorld.STYLES)
+
+# 2.0流派
+STYLE_20_FLAGS: int = STYLE_FLAGS.ToFlags(
+    x.Name for x in SwordWorld.STYLES if x.Is20
+)
+
+# アビスカース
+ABYSS_CURSE_FLAGS: FlagTable = FlagTable(SwordWorld.ABYSS_CURSES)
+
+# 公式一般技能
+OFFICIAL_GENERAL_SKILL_FLAGS: FlagTable = FlagTable(
+    SwordWorld.OFFICIAL_GENERAL_SKILL_NAMES
+)
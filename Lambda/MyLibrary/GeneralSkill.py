@@ -16,6 +16,8 @@ class GeneralSkill:
         Lv int: レベル
     """
 
+    __slots__ = ("Name", "Level")
+
     Name: str
     Level: int
 
@@ -0,0 +1,108 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Callable
+
+from MyLibrary.CommonFunction import (
+    ConvertDynamoDBToJson,
+    ConvertJsonToDynamoDB,
+)
+from MyLibrary.Constant import TableName
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.client import DynamoDBClient
+    from mypy_boto3_dynamodb.type_defs import UpdateItemOutputTypeDef
+
+"""
+カウンターによるIDの採番
+"""
+
+
+class IdAllocator:
+    """
+    カウンターによるIDの採番
+    同時に動く複数のLambdaでも重複しないIDを払い出す
+    """
+
+    def __init__(
+        self,
+        dynamoDb: DynamoDBClient,
+        counterId: str,
+        loadMaxId: Callable[[], int],
+    ):
+        """
+        コンストラクタ
+
+        dynamoDb DynamoDBClient: DynamoDBクライアント
+        counterId str: カウンターのID
+        loadMaxId Callable[[], int]:
+            カウンターがない場合に初期値とする既存IDの最大値を取得する処理
+        """
+
+        self._dynamoDb: DynamoDBClient = dynamoDb
+        self.CounterId: str = counterId
+        self._loadMaxId: Callable[[], int] = loadMaxId
+
+    def Reserve(self, count: int) -> range:
+        """
+
+        連続したIDをまとめて確保する
+
+        Args:
+            count int: 確保する数
+        Returns:
+            range: 確保したID
+        """
+
+        if count <= 0:
+            return range(0)
+
+        try:
+            lastId: int = self._Add(count)
+        except self._dynamoDb.exceptions.ConditionalCheckFailedException:
+            # 初回のみ既存IDの最大値から始める
+            self._Seed()
+            lastId = self._Add(count)
+
+        return range(lastId - count + 1, lastId + 1)
+
+    def _Add(self, count: int) -> int:
+        """
+
+        カウンターを加算する
+
+        Args:
+            count int: 加算する数
+        Returns:
+            int: 加算後の値
+        """
+
+        response: UpdateItemOutputTypeDef = self._dynamoDb.update_item(
+            TableName=TableName.COUNTERS,
+            Key=ConvertJsonToDynamoDB({"id": self.CounterId}),
+            UpdateExpression="ADD last_id :count",
+            ConditionExpression="attribute_exists(id)",
+            ExpressionAttributeValues=ConvertJsonToDynamoDB({":count": count}),
+            ReturnValues="UPDATED_NEW",
+        )
+
+        return int(ConvertDynamoDBToJson(response["Attributes"])["last_id"])
+
+    def _Seed(self) -> None:
+        """
+
+        既存IDの最大値でカウンターを作成する
+        他のLambdaが先に作成した場合はそのまま使う
+        """
+
+        try:
+            self._dynamoDb.put_item(
+                TableName=TableName.COUNTERS,
+                Item=ConvertJsonToDynamoDB(
+                    {"id": self.CounterId, "last_id": self._loadMaxId()}
+                ),
+                ConditionExpression="attribute_not_exists(id)",
+            )
+        except self._dynamoDb.exceptions.ConditionalCheckFailedException:
+            pass
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+from importlib import import_module
+from types import ModuleType
+from typing import Union
+
+"""
+モジュールの遅延読み込み
+"""
+
+
+class LazyModule:
+    """
+    初めて属性を参照したときに読み込むモジュール
+    使わない処理では重いライブラリの読み込みを省略して起動を速くする
+    """
+
+    __slots__ = ("_name", "_module")
+
+    def __init__(self, name: str):
+        """
+        コンストラクタ
+
+        name str: モジュール名
+        """
+
+        self._name: str = name
+        self._module: Union[ModuleType, None] = None
+
+    def __getattr__(self, attribute: str):
+        if self._module is None:
+            self._module = import_module(self._name)
+
+        return getattr(self._module, attribute)
+
+    def __repr__(self) -> str:
+        return f"LazyModule({self._name!r})"
@@ -2,8 +2,9 @@
 
 
 from dataclasses import dataclass
+from typing import Union
 
-from MyLibrary.CommonFunction import StrForDynamoDBToDateTime
+from MyLibrary.CommonFunction import StrForDynamoDBToStrForSpreadsheet
 from MyLibrary.PlayerCharacter import PlayerCharacter
 
 """
@@ -17,6 +18,8 @@ class Player:
     PL
     """
 
+    __slots__ = ("Name", "UpdateTime", "Characters", "GameMasterTimes")
+
     def __init__(
         self,
         name: str,
@@ -24,6 +27,7 @@ class Player:
         maxExp: int,
         minimumExp: int,
         characterJsons: list[dict],
+        characters: Union[list[PlayerCharacter], None] = None,
     ):
         """
         コンストラクタ
@@ -33,28 +37,37 @@ class Player:
         maxExp int: 最大経験点
         minimumExp int: 最小経験点
         characterJsons list[dict]: PC情報
+        characters Union[list[PlayerCharacter], None]:
+            作成済みのPC 指定した場合はcharacterJsonsを使用しない
         """
 
         self.Name: str = name
 
         # 更新日時をスプレッドシートが理解できる形式に変換
-        self.UpdateTime: str = StrForDynamoDBToDateTime(
-            strUpdateTime
-        ).strftime("%Y/%m/%d %H:%M:%S")
-
-        self.Characters: list[PlayerCharacter] = list(
-            map(
-                lambda x: PlayerCharacter(x, self.Name, maxExp, minimumExp),
-                characterJsons,
+        self.UpdateTime: str = StrForDynamoDBToStrForSpreadsheet(strUpdateTime)
+
+        self.Characters: list[PlayerCharacter] = (
+            characters
+            if characters is not None
+            else list(
+                map(
+                    lambda x: PlayerCharacter(
+                        x, self.Name, maxExp, minimumExp
+                    ),
+                    characterJsons,
+                )
             )
         )
 
-        gameMasterScenarioKeys: list[str] = []
+        # 同一シナリオの重複を排除してGM回数を集計
+        # 同じ日に複数のPCでGMをした記録は、回数の最も多いPCの分だけ数える
+        gameMasterDateCounts: dict[str, int] = {}
         for character in self.Characters:
-            gameMasterScenarioKeys.extend(character.GameMasterScenarioKeys)
+            for date, count in character.GameMasterDateCounts.items():
+                if count > gameMasterDateCounts.get(date, 0):
+                    gameMasterDateCounts[date] = count
 
-        # 同一シナリオの重複を排除してGM回数を集計
-        self.GameMasterTimes: int = len(set(gameMasterScenarioKeys))
+        self.GameMasterTimes: int = sum(gameMasterDateCounts.values())
 
     def CountActivePlayerCharacters(self) -> int:
         """
@@ -1,38 +1,150 @@
 # -*- coding: utf-8 -*-
 
+from array import array
 from dataclasses import dataclass
 from json import loads
-from re import Match, findall, search, sub
+from sys import intern
 from typing import Union
 
 from MyLibrary.CommonFunction import MakeYtsheetUrl
 from MyLibrary.Constant import SwordWorld
 from MyLibrary.ExpStatus import ExpStatus
+from MyLibrary.FlagTable import (
+    ABYSS_CURSE_FLAGS,
+    OFFICIAL_GENERAL_SKILL_FLAGS,
+    SKILL_FLAGS,
+    STYLE_FLAGS,
+)
 from MyLibrary.GeneralSkill import GeneralSkill
+from MyLibrary.SkillLevels import SkillLevels
 from MyLibrary.Status import Status
 from MyLibrary.Style import Style
+from MyLibrary.SwordWorldMatcher import (
+    FindAbyssCurses,
+    FindGeneralSkillName,
+    FindStyle,
+    IsVagrantsCombatFeat,
+)
+from MyLibrary.YtsheetCodec import DecodeYtsheetJson
+from MyLibrary.YtsheetText import (
+    ExtractHeightAndWeight,
+    ParseMajorRace,
+    ParseMinorRace,
+    RemoveFurigana,
+    SplitGeneralSkillName,
+)
 
 """
 PC
 """
 
 # 自分が開催したときのGM名
-_SELF_GAME_MASTER_NAMES: "list[str]" = [
-    "俺",
-    "私",
-    "自分",
-]
+_SELF_GAME_MASTER_NAMES: "frozenset[str]" = frozenset(
+    [
+        "俺",
+        "私",
+        "自分",
+    ]
+)
 
 # 死亡時の備考
-_DIED_REGEXP: str = "死亡"
+_DIED_KEYWORD: str = "死亡"
+
+# 能力値のキーの接尾辞
+# 器用度、敏捷度、筋力、生命力、知力、精神力の順
+_STATUS_KEYS: "list[tuple[str, str]]" = [
+    ("A", "Dex"),
+    ("B", "Agi"),
+    ("C", "Str"),
+    ("D", "Vit"),
+    ("E", "Int"),
+    ("F", "Mnd"),
+]
+
+# 1つの能力値を構成する値の数
+_STATUS_SIZE: int = 4
+
+
+def _StatusProperty(index: int) -> property:
+    """
+
+    配列に保持した能力値を取り出すプロパティを作成する
+
+    Args:
+        index int: _STATUS_KEYSでの能力値の位置
+    Returns:
+        property: 能力値を返すプロパティ
+    """
+
+    start: int = index * _STATUS_SIZE
+    return property(
+        lambda self: Status(*self._statuses[start : start + _STATUS_SIZE])
+    )
 
 
 @dataclass
 class PlayerCharacter:
     """
     PC
+    大量に保持するため、属性は__slots__に固定し、能力値と技能レベルは配列で持つ
     """
 
+    __slots__ = (
+        "YtsheetId",
+        "Race",
+        "Age",
+        "Gender",
+        "Birth",
+        "CombatFeatsLv1",
+        "CombatFeatsLv3",
+        "CombatFeatsLv5",
+        "CombatFeatsLv7",
+        "CombatFeatsLv9",
+        "CombatFeatsLv11",
+        "CombatFeatsLv13",
+        "CombatFeatsLv1bat",
+        "AdventurerRank",
+        "Level",
+        "Exp",
+        "GrowthTimes",
+        "TotalHonor",
+        "Hp",
+        "Mp",
+        "LifeResistance",
+        "SpiritResistance",
+        "MonsterKnowledge",
+        "Initiative",
+        "HistoryMoneyTotal",
+        "Sin",
+        "Name",
+        "ActiveStatus",
+        "Faith",
+        "AutoCombatFeats",
+        "Skills",
+        "SkillFlags",
+        "_statuses",
+        "Styles",
+        "StyleFlags",
+        "AbyssCurses",
+        "AbyssCurseFlags",
+        "GeneralSkills",
+        "GeneralSkillFlags",
+        "GameMasterDateCounts",
+        "GameMasterTimes",
+        "PlayerTimes",
+        "DiedTimes",
+        "Height",
+        "Weight",
+    )
+
+    # 各能力値
+    Dexterity = _StatusProperty(0)
+    Agility = _StatusProperty(1)
+    Strength = _StatusProperty(2)
+    Vitality = _StatusProperty(3)
+    Intelligence = _StatusProperty(4)
+    Mental = _StatusProperty(5)
+
     def __init__(
         self,
         characterJson: dict,
@@ -48,23 +160,41 @@ class PlayerCharacter:
         maxExp int: 最大経験点
         minimumExp int: 最小経験点
         """
-        ytsheetJson: dict = loads(characterJson["ytsheet_json"])
+        # 読み込むキーを追加した場合は Ytsheet.PROJECTION_KEYS にも追加する
+        ytsheetJson: dict = loads(DecodeYtsheetJson(characterJson))
 
         # 文字列
+        # 種族や戦闘特技など多くのPCで共通する値は同じ文字列を使い回す
         self.YtsheetId: str = characterJson["ytsheet_id"]
-        self.Race: str = ytsheetJson.get("race", "")
-        self.Age: str = ytsheetJson.get("age", "")
-        self.Gender: str = ytsheetJson.get("gender", "")
-        self.Birth: str = ytsheetJson.get("birth", "")
-        self.CombatFeatsLv1: str = ytsheetJson.get("combatFeatsLv1", "")
-        self.CombatFeatsLv3: str = ytsheetJson.get("combatFeatsLv3", "")
-        self.CombatFeatsLv5: str = ytsheetJson.get("combatFeatsLv5", "")
-        self.CombatFeatsLv7: str = ytsheetJson.get("combatFeatsLv7", "")
-        self.CombatFeatsLv9: str = ytsheetJson.get("combatFeatsLv9", "")
-        self.CombatFeatsLv11: str = ytsheetJson.get("combatFeatsLv11", "")
-        self.CombatFeatsLv13: str = ytsheetJson.get("combatFeatsLv13", "")
-        self.CombatFeatsLv1bat: str = ytsheetJson.get("combatFeatsLv1bat", "")
-        self.AdventurerRank: str = ytsheetJson.get("rank", "")
+        self.Race: str = intern(ytsheetJson.get("race", ""))
+        self.Age: str = intern(ytsheetJson.get("age", ""))
+        self.Gender: str = intern(ytsheetJson.get("gender", ""))
+        self.Birth: str = intern(ytsheetJson.get("birth", ""))
+        self.CombatFeatsLv1: str = intern(
+            ytsheetJson.get("combatFeatsLv1", "")
+        )
+        self.CombatFeatsLv3: str = intern(
+            ytsheetJson.get("combatFeatsLv3", "")
+        )
+        self.CombatFeatsLv5: str = intern(
+            ytsheetJson.get("combatFeatsLv5", "")
+        )
+        self.CombatFeatsLv7: str = intern(
+            ytsheetJson.get("combatFeatsLv7", "")
+        )
+        self.CombatFeatsLv9: str = intern(
+            ytsheetJson.get("combatFeatsLv9", "")
+        )
+        self.CombatFeatsLv11: str = intern(
+            ytsheetJson.get("combatFeatsLv11", "")
+        )
+        self.CombatFeatsLv13: str = intern(
+            ytsheetJson.get("combatFeatsLv13", "")
+        )
+        self.CombatFeatsLv1bat: str = intern(
+            ytsheetJson.get("combatFeatsLv1bat", "")
+        )
+        self.AdventurerRank: str = intern(ytsheetJson.get("rank", ""))
 
         # 数値
         self.Level: int = int(ytsheetJson.get("level", "0"))
@@ -84,15 +214,11 @@ class PlayerCharacter:
         )
 
         # 特殊な変数
-        self.Sin: str = ytsheetJson.get("sin", "0")
+        self.Sin: str = intern(ytsheetJson.get("sin", "0"))
 
         # PC名
         # フリガナを削除
-        self.Name: str = sub(
-            r"\|([^《]*)《[^》]*》",
-            r"\1",
-            ytsheetJson.get("characterName", ""),
-        )
+        self.Name: str = RemoveFurigana(ytsheetJson.get("characterName", ""))
         if self.Name == "":
             # PC名が空の場合は二つ名を表示
             self.Name = ytsheetJson.get("aka", "")
@@ -108,62 +234,38 @@ class PlayerCharacter:
         self.Faith: str = ytsheetJson.get("faith", "なし")
         if self.Faith == "その他の信仰":
             self.Faith = ytsheetJson.get("faithOther", self.Faith)
+        self.Faith = intern(self.Faith)
 
         # 自動取得
-        self.AutoCombatFeats: list[str] = ytsheetJson.get(
-            "combatFeatsAuto", ""
-        ).split(",")
+        self.AutoCombatFeats: list[str] = list(
+            map(intern, ytsheetJson.get("combatFeatsAuto", "").split(","))
+        )
 
         # 技能レベル
-        self.Skills: dict[str, int] = {}
-        for skill in SwordWorld.SKILLS:
-            skillLevel: int = int(ytsheetJson.get(skill, "0"))
-            if skillLevel > 0:
-                self.Skills[skill] = skillLevel
+        self.Skills: SkillLevels = SkillLevels(ytsheetJson)
+        self.SkillFlags: int = SKILL_FLAGS.ToFlags(self.Skills)
 
         # 各能力値
-        self.Dexterity: Status = Status(
-            int(ytsheetJson.get("sttBaseA", "0")),
-            int(ytsheetJson.get("sttDex", "0")),
-            int(ytsheetJson.get("sttAddA", "0")),
-            int(ytsheetJson.get("sttEquipA", "0")),
-        )
-        self.Agility: Status = Status(
-            int(ytsheetJson.get("sttBaseB", "0")),
-            int(ytsheetJson.get("sttAgi", "0")),
-            int(ytsheetJson.get("sttAddB", "0")),
-            int(ytsheetJson.get("sttEquipB", "0")),
-        )
-        self.Strength: Status = Status(
-            int(ytsheetJson.get("sttBaseC", "0")),
-            int(ytsheetJson.get("sttStr", "0")),
-            int(ytsheetJson.get("sttAddC", "0")),
-            int(ytsheetJson.get("sttEquipC", "0")),
-        )
-        self.Vitality: Status = Status(
-            int(ytsheetJson.get("sttBaseD", "0")),
-            int(ytsheetJson.get("sttVit", "0")),
-            int(ytsheetJson.get("sttAddD", "0")),
-            int(ytsheetJson.get("sttEquipD", "0")),
-        )
-        self.Intelligence: Status = Status(
-            int(ytsheetJson.get("sttBaseE", "0")),
-            int(ytsheetJson.get("sttInt", "0")),
-            int(ytsheetJson.get("sttAddE", "0")),
-            int(ytsheetJson.get("sttEquipE", "0")),
-        )
-        self.Mental: Status = Status(
-            int(ytsheetJson.get("sttBaseF", "0")),
-            int(ytsheetJson.get("sttMnd", "0")),
-            int(ytsheetJson.get("sttAddF", "0")),
-            int(ytsheetJson.get("sttEquipF", "0")),
+        # 基本値、合計値、増強、装備の順に並べる
+        self._statuses: array = array(
+            "i",
+            (
+                int(ytsheetJson.get(x, "0"))
+                for suffix, name in _STATUS_KEYS
+                for x in (
+                    f"sttBase{suffix}",
+                    f"stt{name}",
+                    f"sttAdd{suffix}",
+                    f"sttEquip{suffix}",
+                )
+            ),
         )
 
         # 秘伝
         self.Styles: list[Style] = []
         mysticArtsNum: int = int(ytsheetJson.get("mysticArtsNum", "0"))
         for i in range(1, mysticArtsNum + 1):
-            style: Union[Style, None] = _FindStyle(
+            style: Union[Style, None] = FindStyle(
                 ytsheetJson.get(f"mysticArts{i}", "")
             )
             if style is not None and style not in self.Styles:
@@ -172,7 +274,7 @@ class PlayerCharacter:
         # 秘伝魔法
         mysticMagicNum: int = int(ytsheetJson.get("mysticMagicNum", "0"))
         for i in range(1, mysticMagicNum + 1):
-            style: Union[Style, None] = _FindStyle(
+            style: Union[Style, None] = FindStyle(
                 ytsheetJson.get(f"mysticMagic{i}", "")
             )
             if style is not None and style not in self.Styles:
@@ -181,7 +283,7 @@ class PlayerCharacter:
         # 名誉アイテム
         honorItemsNum: int = int(ytsheetJson.get("honorItemsNum", "0"))
         for i in range(1, honorItemsNum + 1):
-            style: Union[Style, None] = _FindStyle(
+            style: Union[Style, None] = FindStyle(
                 ytsheetJson.get(f"honorItem{i}", "")
             )
             if style is not None and style not in self.Styles:
@@ -190,39 +292,42 @@ class PlayerCharacter:
         # 不名誉詳細
         disHonorItemsNum: int = int(ytsheetJson.get("dishonorItemsNum", "0"))
         for i in range(1, disHonorItemsNum + 1):
-            style: Union[Style, None] = _FindStyle(
+            style: Union[Style, None] = FindStyle(
                 ytsheetJson.get(f"dishonorItem{i}", "")
             )
             if style is not None and style not in self.Styles:
                 self.Styles.append(style)
 
+        self.StyleFlags: int = STYLE_FLAGS.ToFlags(x.Name for x in self.Styles)
+
         # 武器
         self.AbyssCurses: list[str] = []
         weaponNum: int = int(ytsheetJson.get("weaponNum", "0"))
 
         for i in range(1, weaponNum + 1):
-            self.AbyssCurses += _FindAbyssCurses(
+            self.AbyssCurses += FindAbyssCurses(
                 ytsheetJson.get(f"weapon{i}Name", "")
             )
-            self.AbyssCurses += _FindAbyssCurses(
+            self.AbyssCurses += FindAbyssCurses(
                 ytsheetJson.get(f"weapon{i}Note", "")
             )
 
         # 鎧
         armourNum: int = int(ytsheetJson.get("armourNum", "0"))
         for i in range(1, armourNum + 1):
-            self.AbyssCurses += _FindAbyssCurses(
+            self.AbyssCurses += FindAbyssCurses(
                 ytsheetJson.get(f"armour{i}Name", "")
             )
-            self.AbyssCurses += _FindAbyssCurses(
+            self.AbyssCurses += FindAbyssCurses(
                 ytsheetJson.get(f"armour{i}Note", "")
             )
 
         # 所持品
-        self.AbyssCurses += _FindAbyssCurses(ytsheetJson.get("items", ""))
+        self.AbyssCurses += FindAbyssCurses(ytsheetJson.get("items", ""))
 
         # 重複を削除
         self.AbyssCurses = list(set(self.AbyssCurses))
+        self.AbyssCurseFlags: int = ABYSS_CURSE_FLAGS.ToFlags(self.AbyssCurses)
 
         # 一般技能
         self.GeneralSkills: list[GeneralSkill] = []
@@ -233,24 +338,12 @@ class PlayerCharacter:
                 continue
 
             # カッコの中と外で分離
-            ytsheetGeneralSkills: list[str] = findall(
-                r"[^(（《/]+",
-                generalSkillName.removesuffix(")")
-                .removesuffix("）")
-                .removesuffix("》"),
+            ytsheetGeneralSkills: list[str] = SplitGeneralSkillName(
+                generalSkillName
             )
             for ytsheetGeneralSkill in ytsheetGeneralSkills:
-                if ytsheetGeneralSkill in SwordWorld.PROSTITUTE_SKILL_NAME:
-                    # 男娼と高級男娼を誤検知するので個別対応
-                    generalSkillName = SwordWorld.PROSTITUTE_SKILL_NAME
-                    break
-
-                officialGeneralSkill: Union[str, None] = next(
-                    filter(
-                        lambda x: ytsheetGeneralSkill in x,
-                        SwordWorld.OFFICIAL_GENERAL_SKILL_NAMES,
-                    ),
-                    None,
+                officialGeneralSkill: Union[str, None] = FindGeneralSkillName(
+                    ytsheetGeneralSkill
                 )
                 if officialGeneralSkill is not None:
                     # 公式一般技能は定数から正式名称を取得
@@ -259,13 +352,19 @@ class PlayerCharacter:
 
             self.GeneralSkills.append(
                 GeneralSkill(
-                    generalSkillName,
+                    intern(generalSkillName),
                     int(ytsheetJson.get(f"lvCommon{i}", "0")),
                 )
             )
 
+        self.GeneralSkillFlags: int = OFFICIAL_GENERAL_SKILL_FLAGS.ToFlags(
+            x.Name for x in self.GeneralSkills
+        )
+
         # セッション履歴を集計
-        self.GameMasterScenarioKeys: list[str] = []
+        # 複数PC所持PLのGM回数集計のため、開催日ごとのGM回数を数える
+        self.GameMasterDateCounts: dict[str, int] = {}
+        self.GameMasterTimes: int = 0
         self.PlayerTimes: int = 0
         self.DiedTimes: int = 0
         historyNum: int = int(ytsheetJson.get("historyNum", "0"))
@@ -279,60 +378,42 @@ class PlayerCharacter:
                 gameMaster == playerName
                 or gameMaster in _SELF_GAME_MASTER_NAMES
             ):
-                # 複数PC所持PLのGM回数集計のため、シナリオごとに一意のキーを作成
-                date: str = ytsheetJson.get(f"history{i}Date", "")
-                count: int = len(
-                    [
-                        x
-                        for x in self.GameMasterScenarioKeys
-                        if x.startswith(date)
-                    ]
+                date: str = intern(ytsheetJson.get(f"history{i}Date", ""))
+                self.GameMasterDateCounts[date] = (
+                    self.GameMasterDateCounts.get(date, 0) + 1
                 )
-
-                # 重複を避けるため、同一日の場合は連番を付与
-                self.GameMasterScenarioKeys.append(f"{date}_{count}")
+                self.GameMasterTimes += 1
             else:
                 self.PlayerTimes += 1
 
             # 備考
-            if search(_DIED_REGEXP, ytsheetJson.get(f"history{i}Note", "")):
+            if _DIED_KEYWORD in ytsheetJson.get(f"history{i}Note", ""):
                 # 死亡回数を集計
                 self.DiedTimes += 1
 
-        # 経歴を1行ごとに分割
-        freeNotes: list[str] = ytsheetJson.get("freeNote", "").split(
-            "&lt;br&gt;"
+        # 経歴から身長と体重を取得
+        self.Height: str
+        self.Weight: str
+        self.Height, self.Weight = ExtractHeightAndWeight(
+            ytsheetJson.get("freeNote", "")
         )
 
-        self.Height: str = ""
-        self.Weight: str = ""
-        for freeNote in freeNotes:
-            if "身長" in freeNote:
-                height: str = sub(
-                    r".*身長[^\d\.\|]*\|*[^\d\.\|]*([\d\.]+).*",
-                    r"\1",
-                    freeNote,
-                )
-                if height != freeNote:
-                    self.Height = height
-
-            if "背丈" in freeNote:
-                height: str = sub(
-                    r".*背丈[^\d\.\|]*\|*[^\d\.\|]*([\d\.]+).*",
-                    r"\1",
-                    freeNote,
-                )
-                if height != freeNote:
-                    self.Height = height
-
-            if "体重" in freeNote:
-                weight: str = sub(
-                    r".*体重[^\d\.\|]*\|*[^\d\.\|]*([\d\.]+).*",
-                    r"\1",
-                    freeNote,
-                )
-                if weight != freeNote:
-                    self.Weight = weight
+    @property
+    def GameMasterScenarioKeys(self) -> "list[str]":
+        """
+
+        GMをしたシナリオごとに一意のキーを返す
+        同一日の場合は連番を付与する
+
+        Returns:
+            list[str]: シナリオのキー
+        """
+
+        return [
+            f"{date}_{i}"
+            for date, count in self.GameMasterDateCounts.items()
+            for i in range(count)
+        ]
 
     def GetMinorRace(self) -> str:
         """
@@ -343,19 +424,7 @@ class PlayerCharacter:
             str: マイナー種族
         """
 
-        if "ナイトメア" in self.Race or "ウィークリング" in self.Race:
-            # 特定種族はかっこをつけたまま返却
-            return self.Race
-
-        minorRaceMatch: Union[Match[str], None] = search(
-            r"(?<=（)(.+)(?=）)", self.Race
-        )
-        if minorRaceMatch is None:
-            # カッコなしなのでそのまま返却
-            return self.Race
-
-        # カッコの中身を返却
-        return minorRaceMatch.group()
+        return ParseMinorRace(self.Race)
 
     def GetMajorRace(self) -> str:
         """
@@ -366,7 +435,7 @@ class PlayerCharacter:
             str: メジャー種族
         """
 
-        return sub(r"（.+）", "", self.Race)
+        return ParseMajorRace(self.Race)
 
     def IsVagrants(self) -> bool:
         """
@@ -377,103 +446,29 @@ class PlayerCharacter:
             bool: True ヴァグランツ
         """
 
-        if self.Skills.get(SwordWorld.BATTLE_DANCER_LEVEL_KEY, 0) > 0 and any(
-            list(
-                map(
-                    lambda x: self.CombatFeatsLv1bat.startswith(x),
-                    SwordWorld.VAGRANTS_COMBAT_SKILLS,
-                )
-            )
-        ):
-            return True
-
-        if any(
-            list(
-                map(
-                    lambda x: self.CombatFeatsLv1.startswith(x),
-                    SwordWorld.VAGRANTS_COMBAT_SKILLS,
-                )
-            )
-        ):
-            return True
-
-        if self.Level < 3:
-            return False
-
-        if any(
-            list(
-                map(
-                    lambda x: self.CombatFeatsLv3.startswith(x),
-                    SwordWorld.VAGRANTS_COMBAT_SKILLS,
-                )
-            )
-        ):
+        if self.Skills.get(
+            SwordWorld.BATTLE_DANCER_LEVEL_KEY, 0
+        ) > 0 and IsVagrantsCombatFeat(self.CombatFeatsLv1bat):
             return True
 
-        if self.Level < 5:
-            return False
-
-        if any(
-            list(
-                map(
-                    lambda x: self.CombatFeatsLv5.startswith(x),
-                    SwordWorld.VAGRANTS_COMBAT_SKILLS,
-                )
-            )
-        ):
+        # 1レベルの戦闘特技はレベルに関わらず確認する
+        if IsVagrantsCombatFeat(self.CombatFeatsLv1):
             return True
 
-        if self.Level < 7:
-            return False
-
-        if any(
-            list(
-                map(
-                    lambda x: self.CombatFeatsLv7.startswith(x),
-                    SwordWorld.VAGRANTS_COMBAT_SKILLS,
-                )
-            )
+        # 3レベル以降は習得済みのレベルの戦闘特技のみ確認する
+        for level, combatFeat in (
+            (3, self.CombatFeatsLv3),
+            (5, self.CombatFeatsLv5),
+            (7, self.CombatFeatsLv7),
+            (9, self.CombatFeatsLv9),
+            (11, self.CombatFeatsLv11),
+            (13, self.CombatFeatsLv13),
         ):
-            return True
-
-        if self.Level < 9:
-            return False
-
-        if any(
-            list(
-                map(
-                    lambda x: self.CombatFeatsLv9.startswith(x),
-                    SwordWorld.VAGRANTS_COMBAT_SKILLS,
-                )
-            )
-        ):
-            return True
-
-        if self.Level < 11:
-            return False
-
-        if any(
-            list(
-                map(
-                    lambda x: self.CombatFeatsLv11.startswith(x),
-                    SwordWorld.VAGRANTS_COMBAT_SKILLS,
-                )
-            )
-        ):
-            return True
+            if self.Level < level:
+                return False
 
-        if self.Level < 13:
-            return False
-
-        if any(
-            list(
-                map(
-                    lambda x: self.CombatFeatsLv13.startswith(x),
-                    SwordWorld.VAGRANTS_COMBAT_SKILLS,
-                )
-            )
-        ):
-            return True
+            if IsVagrantsCombatFeat(combatFeat):
+                return True
 
         return False
 
@@ -500,42 +495,3 @@ class PlayerCharacter:
             int: 技能レベル
         """
         return self.Skills.get(key, 0)
-
-
-def _FindStyle(string: str) -> Union[Style, None]:
-    """
-
-    引数が流派を表す文字列か調べ、一致する流派を返却する
-
-    Args:
-        string str: 確認する文字列
-
-    Returns:
-        Union[Style, None]: 存在する場合は流派、それ以外はNone
-    """
-
-    for style in SwordWorld.STYLES:
-        if search(style.GetKeywordsRegexp(), string):
-            return style
-
-    return None
-
-
-def _FindAbyssCurses(string: str) -> "list[str]":
-    """
-
-    引数に含まれるアビスカースを返却する
-
-    Args:
-        string str: 確認する文字列
-
-    Returns:
-        list[str]: 引数に含まれるアビスカース
-    """
-
-    result: list[str] = []
-    for abyssCurse in SwordWorld.ABYSS_CURSES:
-        if abyssCurse in string:
-            result.append(abyssCurse)
-
-    return result
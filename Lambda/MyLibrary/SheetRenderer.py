@@ -0,0 +1,650 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from enum import IntEnum, auto
+from typing import TYPE_CHECKING, Callable, Iterable, Union
+
+from MyLibrary.CommonFunction import ConvertToVerticalHeaders
+from MyLibrary.Constant import SpreadSheet
+from MyLibrary.LazyImport import LazyModule
+
+if TYPE_CHECKING:
+    from gspread.worksheet import CellFormat, Worksheet
+    from MyLibrary.FlagTable import FlagTable
+    from MyLibrary.Player import Player
+    from MyLibrary.PlayerCharacter import PlayerCharacter
+
+"""
+列の定義からスプレッドシートの各シートの内容を作成する
+"""
+
+# Google関係のライブラリは使うときに読み込む
+utils: LazyModule = LazyModule("gspread.utils")
+
+
+class CharacterContext:
+    """
+    各シートで共通して使うPCの情報
+    PCごとに1回だけ作成し、全てのシートで使い回す
+    """
+
+    __slots__ = (
+        "No",
+        "Player",
+        "Character",
+        "ActiveStatusText",
+        "LinkTextFormat",
+        "LinkFormat",
+    )
+
+    def __init__(self, no: int, player: Player, character: PlayerCharacter):
+        """
+        コンストラクタ
+
+        no int: 全PCの通し番号
+        player Player: PL
+        character PlayerCharacter: PC
+        """
+
+        self.No: int = no
+        self.Player: Player = player
+        self.Character: PlayerCharacter = character
+        self.ActiveStatusText: str = (
+            character.ActiveStatus.GetStrForSpreadsheet()
+        )
+
+        # ゆとシートへのハイパーリンク
+        self.LinkTextFormat: dict = SpreadSheet.DEFAULT_TEXT_FORMAT.copy()
+        self.LinkTextFormat["link"] = {"uri": character.GetYtsheetUrl()}
+        self.LinkFormat: dict = {"textFormat": self.LinkTextFormat}
+
+
+class PlayerContext:
+    """
+    PLごとに1行のシートで使うPLの情報
+    """
+
+    __slots__ = ("No", "Player", "Characters")
+
+    def __init__(
+        self, no: int, player: Player, characters: list[CharacterContext]
+    ):
+        """
+        コンストラクタ
+
+        no int: PLの通し番号
+        player Player: PL
+        characters list[CharacterContext]: PLのPCの情報
+        """
+
+        self.No: int = no
+        self.Player: Player = player
+        self.Characters: list[CharacterContext] = characters
+
+
+class Align(IntEnum):
+    """列の配置
+    Attributes:
+        CENTER: 合計行を含めて中央揃え
+        CENTER_ROWS: 合計行を除いて中央揃え
+    """
+
+    CENTER = auto()
+    CENTER_ROWS = auto()
+
+
+class Total(ABC):
+    """
+    合計行の集計
+    """
+
+    @abstractmethod
+    def Aggregate(self, rows: list, values: list):
+        """
+
+        列の合計を返す
+
+        Args:
+            rows list: 各行の情報
+            values list: 列の値、複数列の場合は行ごとの値のリスト
+        Returns:
+            合計行に出力する値、複数列の場合はリスト
+        """
+
+
+class CountTotal(Total):
+    """
+    条件を満たす行の数
+    """
+
+    def __init__(
+        self, predicate: Union[Callable[[object], bool], None] = None
+    ):
+        """
+        コンストラクタ
+
+        predicate Union[Callable[[object], bool], None]:
+            行の情報から数えるかどうかを返す処理、省略した場合は値が空でない行を数える
+        """
+
+        self._predicate: Union[Callable[[object], bool], None] = predicate
+
+    def Aggregate(self, rows: list, values: list) -> int:
+        if self._predicate is None:
+            return sum(1 for x in values if x)
+
+        return sum(1 for x in rows if self._predicate(x))
+
+
+class SumTotal(Total):
+    """
+    値の合計
+    """
+
+    def __init__(self, selector: Union[Callable[[object], int], None] = None):
+        """
+        コンストラクタ
+
+        selector Union[Callable[[object], int], None]:
+            行の情報から合計する値を返す処理、省略した場合は列の値を合計する
+        """
+
+        self._selector: Union[Callable[[object], int], None] = selector
+
+    def Aggregate(self, rows: list, values: list) -> int:
+        if self._selector is None:
+            return sum(values)
+
+        return sum(self._selector(x) for x in rows)
+
+
+class FlagTotal(Total):
+    """
+    項目ごとにフラグが立っている行の数
+    """
+
+    def __init__(self, table: FlagTable, selector: Callable[[object], int]):
+        """
+        コンストラクタ
+
+        table FlagTable: 列の並び順のフラグの一覧
+        selector Callable[[object], int]: 行の情報からフラグを返す処理
+        """
+
+        self._table: FlagTable = table
+        self._selector: Callable[[object], int] = selector
+
+    def Aggregate(self, rows: list, values: list) -> list[int]:
+        return self._table.CountColumns(self._selector(x) for x in rows)
+
+
+class Column:
+    """
+    シートの列の定義
+    1つの定義で複数列をまとめて出力する場合は、ヘッダーをリストで指定する
+    """
+
+    __slots__ = (
+        "Headers",
+        "IsMultiple",
+        "Value",
+        "Total",
+        "Format",
+        "Align",
+        "Vertical",
+        "NumberFormat",
+    )
+
+    def __init__(
+        self,
+        header: Union[str, list[str]],
+        value: Callable[[object], object],
+        total: Union[Total, None] = None,
+        cellFormat: Union[Callable[[object, object], object], None] = None,
+        align: Union[Align, None] = None,
+        vertical: bool = False,
+        numberFormat: Union[dict, None] = None,
+    ):
+        """
+        コンストラクタ
+
+        header Union[str, list[str]]:
+            ヘッダー、リストの場合は値もリストで返し、複数列に出力する
+        value Callable[[object], object]: 行の情報からセルの値を返す処理
+        total Union[Total, None]: 合計行の集計、省略した場合は集計しない
+        cellFormat Union[Callable[[object, object], object], None]:
+            行の情報とセルの値から書式を返す処理、書式がない場合はNoneを返す
+            複数列の場合は値の並び順の書式のリストを返す
+        align Union[Align, None]: 配置
+        vertical bool: ヘッダーを縦書きにするか
+        numberFormat Union[dict, None]: ヘッダーを含めた列全体の表示形式
+        """
+
+        self.IsMultiple: bool = isinstance(header, list)
+        self.Headers: list[str] = (
+            header if isinstance(header, list) else [header]
+        )
+        self.Value: Callable[[object], object] = value
+        self.Total: Union[Total, None] = total
+        self.Format: Union[Callable[[object, object], object], None] = (
+            cellFormat
+        )
+        self.Align: Union[Align, None] = align
+        self.Vertical: bool = vertical
+        self.NumberFormat: Union[dict, None] = numberFormat
+
+
+class SheetRenderer:
+    """
+    列の定義から1シート分の値と書式を作成して書き込む
+    RenderSheetsから全ての行を1件ずつ受け取り、行と書式を追加していく
+    """
+
+    def __init__(
+        self,
+        sheetName: str,
+        columns: list[Column],
+        perPlayer: bool = False,
+        coverAllColumns: bool = False,
+    ):
+        """
+        コンストラクタ
+
+        sheetName str: シート名
+        columns list[Column]: 列の定義
+        perPlayer bool: PLごとに1行にするか、Falseの場合はPCごとに1行
+        coverAllColumns bool:
+            全体の書式とフィルターをシートの全列に設定するか
+            列数が決まっていない列がある場合に使う
+        """
+
+        self.SheetName: str = sheetName
+        self.Columns: list[Column] = columns
+        self.PerPlayer: bool = perPlayer
+        self.CoverAllColumns: bool = coverAllColumns
+
+        # 列の定義ごとの開始列(1始まり)は作成時に1回だけ求める
+        self.Headers: list[str] = []
+        self._starts: list[int] = []
+        for column in columns:
+            self._starts.append(len(self.Headers) + 1)
+            self.Headers += column.Headers
+
+        # 出力する値
+        self.Values: list[list] = [
+            (
+                ConvertToVerticalHeaders(self.Headers)
+                if any(x.Vertical for x in columns)
+                else self.Headers
+            )
+        ]
+
+        # 合計行があるか
+        self.HasTotal: bool = False
+
+        # 合計行の集計に使う各行の情報
+        self._rows: list = []
+
+        # 行ごとに呼び出す処理は作成時にまとめておく
+        self._valueSelectors: list[Callable] = [x.Value for x in columns]
+        self._hasMultiple: bool = any(x.IsMultiple for x in columns)
+        self._formatColumns: list[tuple[int, int, Callable, bool]] = [
+            (index, start, column.Format, column.IsMultiple)
+            for index, (column, start) in enumerate(zip(columns, self._starts))
+            if column.Format is not None
+        ]
+
+        # セルごとの書式の開始行、開始列、終了行、終了列、書式
+        # A1形式への変換は書き込み時に1回だけ行う
+        self._cellFormats: list[list] = []
+
+        # 列の範囲ごとの直前に追加したセルごとの書式
+        self._lastCellFormats: dict[tuple[int, int], list] = {}
+
+    def AddCharacter(self, context: CharacterContext) -> None:
+        """
+
+        PC1件分の行を追加する
+
+        Args:
+            context CharacterContext: PCの情報
+        """
+
+        if not self.PerPlayer:
+            self._AddRow(context)
+
+    def AddPlayer(self, context: PlayerContext) -> None:
+        """
+
+        PL1件分の行を追加する
+        PLの全PCを追加した後に呼ばれる
+
+        Args:
+            context PlayerContext: PLの情報
+        """
+
+        if self.PerPlayer:
+            self._AddRow(context)
+
+    def _AddRow(self, context) -> None:
+        """
+
+        列の定義に従って1行分の値と書式を追加する
+
+        Args:
+            context: 行の情報
+        """
+
+        rowIndex: int = len(self.Values) + 1
+        values: list = [x(context) for x in self._valueSelectors]
+
+        row: list = values
+        if self._hasMultiple:
+            row = []
+            for column, value in zip(self.Columns, values):
+                if column.IsMultiple:
+                    row += value
+                else:
+                    row.append(value)
+
+        self.Values.append(row)
+        self._rows.append(context)
+
+        # 書式を設定するセルの列番号と書式
+        cellFormats: list[tuple[int, object]] = []
+        for index, start, rule, isMultiple in self._formatColumns:
+            cellFormat = rule(context, values[index])
+            if not isMultiple:
+                if cellFormat is not None:
+                    cellFormats.append((start, cellFormat))
+            else:
+                for offset, x in enumerate(cellFormat):
+                    if x is not None:
+                        cellFormats.append((start + offset, x))
+
+        # 同じ書式が隣り合うセルは1つの範囲にまとめる
+        startColumn: int = 0
+        endColumn: int = 0
+        currentFormat = None
+        for columnIndex, cellFormat in cellFormats:
+            if (
+                currentFormat is not None
+                and columnIndex == endColumn + 1
+                and cellFormat == currentFormat
+            ):
+                endColumn = columnIndex
+                continue
+
+            self._AppendCellFormat(
+                rowIndex, startColumn, endColumn, currentFormat
+            )
+            startColumn = endColumn = columnIndex
+            currentFormat = cellFormat
+
+        self._AppendCellFormat(rowIndex, startColumn, endColumn, currentFormat)
+
+    def _AppendCellFormat(
+        self, rowIndex: int, startColumn: int, endColumn: int, cellFormat
+    ) -> None:
+        """
+
+        1行の中の範囲の書式を追加する
+        直前の行の同じ列の範囲に同じ書式がある場合は、その範囲を広げる
+
+        Args:
+            rowIndex int: 行番号
+            startColumn int: 開始列
+            endColumn int: 終了列
+            cellFormat: 書式、Noneの場合は追加しない
+        """
+
+        if cellFormat is None:
+            return
+
+        key: tuple[int, int] = (startColumn, endColumn)
+        last: Union[list, None] = self._lastCellFormats.get(key)
+        if (
+            last is not None
+            and last[2] == rowIndex - 1
+            and last[4] == cellFormat
+        ):
+            last[2] = rowIndex
+            return
+
+        cell: list = [rowIndex, startColumn, rowIndex, endColumn, cellFormat]
+        self._lastCellFormats[key] = cell
+        self._cellFormats.append(cell)
+
+    def AddTotal(self) -> None:
+        """
+
+        全ての行を追加した後に合計行を追加する
+        最初に集計する列の1つ前の列に「合計」と出力する
+        """
+
+        total: list = [None] * len(self.Headers)
+        labelIndex: Union[int, None] = None
+        for column, start in zip(self.Columns, self._starts):
+            if column.Total is None:
+                continue
+
+            index: int = start - 1
+            if column.IsMultiple:
+                end: int = index + len(column.Headers)
+                total[index:end] = column.Total.Aggregate(
+                    self._rows, [x[index:end] for x in self.Values[1:]]
+                )
+            else:
+                total[index] = column.Total.Aggregate(
+                    self._rows, [x[index] for x in self.Values[1:]]
+                )
+
+            if labelIndex is None:
+                labelIndex = index - 1
+
+        if labelIndex is None:
+            # 合計行なし
+            return
+
+        total[labelIndex] = "合計"
+        self.Values.append(total)
+        self.HasTotal = True
+
+    def _MergeColumns(
+        self, key: Callable[[Column], object]
+    ) -> list[tuple[int, int, object]]:
+        """
+
+        列の定義の属性が同じ値で隣り合う列を1つの範囲にまとめる
+
+        Args:
+            key Callable[[Column], object]: 列の定義の属性を返す処理
+        Returns:
+            list[tuple[int, int, object]]:
+                開始列、終了列、属性の値、属性がNoneまたはFalseの列は除く
+        """
+
+        ranges: list[tuple[int, int, object]] = []
+        for column, start in zip(self.Columns, self._starts):
+            value = key(column)
+            if not value:
+                continue
+
+            end: int = start + len(column.Headers) - 1
+            if (
+                len(ranges) > 0
+                and ranges[-1][1] == start - 1
+                and ranges[-1][2] == value
+            ):
+                ranges[-1] = (ranges[-1][0], end, value)
+            else:
+                ranges.append((start, end, value))
+
+        return ranges
+
+    def Write(self, worksheet: Worksheet) -> None:
+        """
+
+        作成した値と書式をシートに書き込む
+
+        Args:
+            worksheet Worksheet: シート
+        """
+
+        columnCount: int = (
+            worksheet.col_count if self.CoverAllColumns else len(self.Headers)
+        )
+        lastRow: int = len(self.Values)
+        lastDataRow: int = lastRow - 1 if self.HasTotal else lastRow
+
+        # クリア
+        worksheet.clear()
+        worksheet.clear_basic_filter()
+
+        # 更新
+        worksheet.update(
+            self.Values, value_input_option=utils.ValueInputOption.user_entered
+        )
+
+        # 書式設定
+        # 全体
+        worksheet.format(
+            ToRange(1, 1, lastRow, columnCount),
+            SpreadSheet.DEFAULT_FORMAT,
+        )
+
+        # 部分的な書式
+        # 書き込むたびに作り直し、同じシートに何度書き込んでも重複させない
+        formats: list[CellFormat] = []
+
+        # セルごとの書式
+        for (
+            startRow,
+            startColumn,
+            endRow,
+            endColumn,
+            cellFormat,
+        ) in self._cellFormats:
+            formats.append(
+                {
+                    "range": (
+                        utils.rowcol_to_a1(startRow, startColumn)
+                        if startRow == endRow and startColumn == endColumn
+                        else ToRange(startRow, startColumn, endRow, endColumn)
+                    ),
+                    "format": cellFormat,
+                }
+            )
+
+        # ヘッダー
+        formats.append(
+            {
+                "range": ToRange(1, 1, 1, len(self.Headers)),
+                "format": SpreadSheet.DEFAULT_HEADER_FORMAT,
+            }
+        )
+
+        # 縦書きヘッダー
+        for start, end, _ in self._MergeColumns(lambda x: x.Vertical):
+            formats.append(
+                {
+                    "range": ToRange(1, start, 1, end),
+                    "format": {"textRotation": {"vertical": True}},
+                }
+            )
+
+        # 中央揃え
+        for start, end, align in self._MergeColumns(lambda x: x.Align):
+            formats.append(
+                {
+                    "range": ToRange(
+                        2,
+                        start,
+                        lastRow if align == Align.CENTER else lastDataRow,
+                        end,
+                    ),
+                    "format": {"horizontalAlignment": "CENTER"},
+                }
+            )
+
+        # 表示形式
+        for column, start in zip(self.Columns, self._starts):
+            if column.NumberFormat is not None:
+                formats.append(
+                    {
+                        "range": ToRange(
+                            1, start, lastRow, start + len(column.Headers) - 1
+                        ),
+                        "format": {"numberFormat": column.NumberFormat},
+                    }
+                )
+
+        # 部分的なフォーマットを設定
+        worksheet.batch_format(formats)
+
+        # 行列の固定
+        worksheet.freeze(1, 2)
+
+        # フィルター
+        worksheet.set_basic_filter(
+            1, 1, lastDataRow, columnCount  # type: ignore
+        )
+
+
+def ToRange(
+    startRow: int, startColumn: int, endRow: int, endColumn: int
+) -> str:
+    """
+
+    範囲をA1形式に変換する
+
+    Args:
+        startRow int: 開始行
+        startColumn int: 開始列
+        endRow int: 終了行
+        endColumn int: 終了列
+    Returns:
+        str: A1形式の範囲
+    """
+
+    return (
+        f"{utils.rowcol_to_a1(startRow, startColumn)}"
+        f":{utils.rowcol_to_a1(endRow, endColumn)}"
+    )
+
+
+def RenderSheets(
+    players: list[Player], renderers: Iterable[SheetRenderer]
+) -> None:
+    """
+
+    全PCを1回だけ走査して、全てのシートの値と書式を作成する
+
+    Args:
+        players list[Player]: PL情報
+        renderers Iterable[SheetRenderer]: 作成するシート
+    """
+
+    renderers = list(renderers)
+    characterNo: int = 0
+    for playerNo, player in enumerate(players, 1):
+        contexts: list[CharacterContext] = []
+        for character in player.Characters:
+            characterNo += 1
+            context: CharacterContext = CharacterContext(
+                characterNo, player, character
+            )
+            contexts.append(context)
+            for renderer in renderers:
+                renderer.AddCharacter(context)
+
+        playerContext: PlayerContext = PlayerContext(
+            playerNo, player, contexts
+        )
+        for renderer in renderers:
+            renderer.AddPlayer(playerContext)
+
+    for renderer in renderers:
+        renderer.AddTotal()
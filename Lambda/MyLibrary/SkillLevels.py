@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+from array import array
+from collections.abc import Mapping
+from typing import Iterator
+
+from MyLibrary.Constant import SwordWorld
+
+"""
+冒険者技能のレベル
+"""
+
+# 技能のキーごとの位置
+_SKILL_INDEXES: dict[str, int] = {
+    x: i for i, x in enumerate(SwordWorld.SKILLS)
+}
+
+
+class SkillLevels(Mapping):
+    """
+    冒険者技能のレベル
+    技能の並び順の配列で保持し、レベルが1以上の技能のみを含む辞書として扱う
+    """
+
+    __slots__ = ("_levels",)
+
+    def __init__(self, ytsheetJson: dict):
+        """
+        コンストラクタ
+
+        ytsheetJson dict: ゆとシートのデータ
+        """
+
+        self._levels: array = array(
+            "H",
+            (max(0, int(ytsheetJson.get(x, "0"))) for x in SwordWorld.SKILLS),
+        )
+
+    def __getitem__(self, key: str) -> int:
+        index: int = _SKILL_INDEXES.get(key, -1)
+        if index < 0 or self._levels[index] == 0:
+            raise KeyError(key)
+
+        return self._levels[index]
+
+    def __contains__(self, key) -> bool:
+        index: int = _SKILL_INDEXES.get(key, -1)
+        return index >= 0 and self._levels[index] > 0
+
+    def __iter__(self) -> Iterator[str]:
+        return (
+            x for x, level in zip(SwordWorld.SKILLS, self._levels) if level > 0
+        )
+
+    def __len__(self) -> int:
+        return len(self._levels) - self._levels.count(0)
+
+    def ToCells(self, empty="") -> list:
+        """
+
+        技能レベルをスプレッドシートの1行分のセルに変換する
+
+        Args:
+            empty: 未習得の技能のセルの値
+        Returns:
+            list: 技能の並び順に並べたセルの値
+        """
+
+        return [x if x > 0 else empty for x in self._levels]
+
+    def __repr__(self) -> str:
+        return f"SkillLevels({dict(self)!r})"
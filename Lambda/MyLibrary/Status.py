@@ -14,6 +14,8 @@ class Status:
     能力値
     """
 
+    __slots__ = ("Base", "Point", "Additional", "Equipment")
+
     Base: int
 
     # 装備の増強を除く合計値
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from re import Match, Pattern, compile, escape
+from typing import Iterable, Iterator, Union
+
+from MyLibrary.Constant import SwordWorld
+from MyLibrary.Style import Style
+
+"""
+SW2.5の定数を使った文字列の検索
+"""
+
+
+class KeywordMatcher:
+    """
+    複数のキーワードを1回の走査で検索する
+    全てのキーワードを1つの正規表現にまとめて、作成時に1回だけコンパイルする
+    """
+
+    def __init__(self, keywords: Iterable[tuple[str, object]]):
+        """
+        コンストラクタ
+
+        keywords Iterable[tuple[str, object]]:
+            キーワードと一致したときに返す値の組、優先度の高い順
+            同じ位置から始まるキーワードは優先度の高いものだけを検出する
+        """
+
+        # キーワードごとの優先度と値
+        self._keywords: dict[str, tuple[int, object]] = {}
+        for keyword, value in keywords:
+            if keyword not in self._keywords:
+                self._keywords[keyword] = (len(self._keywords), value)
+
+        if len(self._keywords) == 0:
+            # 何にも一致しない
+            self._pattern: Pattern[str] = compile(r"(?!)")
+            return
+
+        self._pattern = compile("|".join(map(escape, self._keywords)))
+
+    def _Iterate(self, string: str) -> Iterator[tuple[int, object]]:
+        """
+
+        引数に含まれるキーワードの優先度と値を出現順に返す
+
+        Args:
+            string str: 確認する文字列
+        Returns:
+            Iterator[tuple[int, object]]: 一致したキーワードの優先度と値
+        """
+
+        position: int = 0
+        while True:
+            match: Union[Match[str], None] = self._pattern.search(
+                string, position
+            )
+            if match is None:
+                return
+
+            yield self._keywords[match.group()]
+
+            # 重なったキーワードも見つけるため、次の文字から検索する
+            position = match.start() + 1
+
+    def FindFirst(self, string: str):
+        """
+
+        引数に含まれるキーワードのうち、最も優先度の高いものの値を返す
+
+        Args:
+            string str: 確認する文字列
+        Returns:
+            一致したキーワードの値、一致しない場合はNone
+        """
+
+        found: Union[tuple[int, object], None] = None
+        for keyword in self._Iterate(string):
+            if found is None or keyword[0] < found[0]:
+                found = keyword
+                if found[0] == 0:
+                    break
+
+        return None if found is None else found[1]
+
+    def FindAll(self, string: str) -> list:
+        """
+
+        引数に含まれる全てのキーワードの値を優先度の高い順に返す
+
+        Args:
+            string str: 確認する文字列
+        Returns:
+            list: 一致したキーワードの値、重複は除く
+        """
+
+        found: dict[int, object] = {}
+        for priority, value in self._Iterate(string):
+            found[priority] = value
+
+        return [found[x] for x in sorted(found)]
+
+
+# 流派
+_styleMatcher: KeywordMatcher = KeywordMatcher(
+    (keyword, style)
+    for style in SwordWorld.STYLES
+    for keyword in style.Keywords
+)
+
+# アビスカース
+_abyssCurseMatcher: KeywordMatcher = KeywordMatcher(
+    (x, x) for x in SwordWorld.ABYSS_CURSES
+)
+
+# 公式一般技能の名称を区切り文字でつないだ文字列と、各名称の開始位置
+_GENERAL_SKILL_SEPARATOR: str = "\n"
+_officialGeneralSkillNames: str = _GENERAL_SKILL_SEPARATOR.join(
+    SwordWorld.OFFICIAL_GENERAL_SKILL_NAMES
+)
+_officialGeneralSkillStarts: list[int] = list(
+    accumulate(
+        (
+            len(x) + len(_GENERAL_SKILL_SEPARATOR)
+            for x in SwordWorld.OFFICIAL_GENERAL_SKILL_NAMES[:-1]
+        ),
+        initial=0,
+    )
+)
+
+# ヴァグランツ戦闘特技
+_VAGRANTS_COMBAT_SKILLS: tuple[str, ...] = tuple(
+    SwordWorld.VAGRANTS_COMBAT_SKILLS
+)
+
+
+def FindStyle(string: str) -> Union[Style, None]:
+    """
+
+    引数が流派を表す文字列か調べ、一致する流派を返却する
+    複数の流派に一致する場合は定数で先に定義された流派を返す
+
+    Args:
+        string str: 確認する文字列
+
+    Returns:
+        Union[Style, None]: 存在する場合は流派、それ以外はNone
+    """
+
+    return _styleMatcher.FindFirst(string)
+
+
+def FindAbyssCurses(string: str) -> "list[str]":
+    """
+
+    引数に含まれるアビスカースを返却する
+
+    Args:
+        string str: 確認する文字列
+
+    Returns:
+        list[str]: 引数に含まれるアビスカース
+    """
+
+    return _abyssCurseMatcher.FindAll(string)
+
+
+@lru_cache(maxsize=1024)
+def FindGeneralSkillName(string: str) -> Union[str, None]:
+    """
+
+    引数を含む公式一般技能の正式名称を返却する
+    同じ一般技能は多くのPCが取得しているため、結果を使い回す
+
+    Args:
+        string str: 一般技能名の一部
+
+    Returns:
+        Union[str, None]: 存在する場合は正式名称、それ以外はNone
+    """
+
+    if string in SwordWorld.PROSTITUTE_SKILL_NAME:
+        # 男娼と高級男娼を誤検知するので個別対応
+        return SwordWorld.PROSTITUTE_SKILL_NAME
+
+    if _GENERAL_SKILL_SEPARATOR in string:
+        return None
+
+    # つないだ文字列の中で最初に見つかった位置の名称を返す
+    index: int = _officialGeneralSkillNames.find(string)
+    if index < 0:
+        return None
+
+    return SwordWorld.OFFICIAL_GENERAL_SKILL_NAMES[
+        bisect_right(_officialGeneralSkillStarts, index) - 1
+    ]
+
+
+def IsVagrantsCombatFeat(string: str) -> bool:
+    """
+
+    ヴァグランツ戦闘特技か調べる
+
+    Args:
+        string str: 戦闘特技
+
+    Returns:
+        bool: True ヴァグランツ戦闘特技
+    """
+
+    return string.startswith(_VAGRANTS_COMBAT_SKILLS)
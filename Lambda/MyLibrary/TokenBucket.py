@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+from random import uniform
+from time import sleep, time
+from typing import TYPE_CHECKING
+
+from MyLibrary.CommonFunction import (
+    ConvertDynamoDBToJson,
+    ConvertJsonToDynamoDB,
+)
+from MyLibrary.Constant import TableName
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.client import DynamoDBClient
+    from mypy_boto3_dynamodb.type_defs import GetItemOutputTypeDef
+
+"""
+DynamoDBで共有するトークンバケット
+"""
+
+# 書き込みが競合したときの最大待ち時間(秒)
+_CONFLICT_MAX_WAIT_SECONDS: float = 0.05
+
+
+class TokenBucket:
+    """
+    DynamoDBで共有するトークンバケット
+    同時に動く複数のLambdaでリクエスト頻度の上限を守る
+    """
+
+    def __init__(
+        self,
+        dynamoDb: DynamoDBClient,
+        bucketId: str,
+        rate: float,
+        capacity: float,
+    ):
+        """
+        コンストラクタ
+
+        dynamoDb DynamoDBClient: DynamoDBクライアント
+        bucketId str: バケットのID
+        rate float: 1秒あたりに補充するトークン数
+        capacity float: 貯められるトークン数の上限
+        """
+
+        self._dynamoDb: DynamoDBClient = dynamoDb
+        self.BucketId: str = bucketId
+        self.Rate: float = rate
+        self.Capacity: float = capacity
+
+    def Acquire(self) -> None:
+        """
+
+        トークンを1つ取得する
+        トークンがない場合は補充されるまで待つ
+        """
+
+        while True:
+            waitSeconds: float = self.TryAcquire()
+            if waitSeconds == 0:
+                return
+
+            sleep(waitSeconds)
+
+    def TryAcquire(self) -> float:
+        """
+
+        トークンの取得を1回試みる
+
+        Returns:
+            float: 取得できた場合は0、それ以外は次に試すまでの待ち時間(秒)
+        """
+
+        response: GetItemOutputTypeDef = self._dynamoDb.get_item(
+            TableName=TableName.RATE_LIMITS,
+            Key=ConvertJsonToDynamoDB({"id": self.BucketId}),
+            ConsistentRead=True,
+        )
+
+        # 前回からの経過時間分を補充
+        now: float = time()
+        tokens: float = self.Capacity
+        conditionExpression: str = "attribute_not_exists(id)"
+        expressionAttributeValues: dict = {}
+        if "Item" in response:
+            item: dict = ConvertDynamoDBToJson(response["Item"])
+            tokens = min(
+                self.Capacity,
+                item["tokens"]
+                + max(0.0, now - item["refill_time"]) * self.Rate,
+            )
+            conditionExpression = "refill_time = :refill_time"
+            expressionAttributeValues = ConvertJsonToDynamoDB(
+                {":refill_time": item["refill_time"]}
+            )
+
+        if tokens < 1:
+            # 1つ補充されるまで待つ
+            return (1 - tokens) / self.Rate
+
+        try:
+            # 他のLambdaが更新していない場合のみ消費する
+            putItemArguments: dict = {}
+            if len(expressionAttributeValues) > 0:
+                putItemArguments["ExpressionAttributeValues"] = (
+                    expressionAttributeValues
+                )
+
+            self._dynamoDb.put_item(
+                TableName=TableName.RATE_LIMITS,
+                Item=ConvertJsonToDynamoDB(
+                    {
+                        "id": self.BucketId,
+                        "tokens": tokens - 1,
+                        "refill_time": now,
+                    }
+                ),
+                ConditionExpression=conditionExpression,
+                **putItemArguments,
+            )
+        except self._dynamoDb.exceptions.ConditionalCheckFailedException:
+            # 競合した場合は少し待って再試行
+            return uniform(0, _CONFLICT_MAX_WAIT_SECONDS)
+
+        return 0
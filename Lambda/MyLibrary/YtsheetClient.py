@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from importlib.util import find_spec
+from json import loads
+from random import uniform
+from threading import Lock
+from time import sleep
+from typing import TYPE_CHECKING, Callable, Union
+from urllib.parse import urlparse
+
+from MyLibrary.CircuitBreaker import CircuitBreaker, GetCircuitBreaker
+from MyLibrary.CommonFunction import MakeYtsheetUrl
+from MyLibrary.Constant import Ytsheet
+from MyLibrary.LazyImport import LazyModule
+
+if TYPE_CHECKING:
+    from requests import Response, Session
+
+"""
+ゆとシートへのアクセス
+"""
+
+# requestsは初めてリクエストを送るときに読み込む
+exceptions: LazyModule = LazyModule("requests.exceptions")
+
+# 未更新を表すステータスコード
+_NOT_MODIFIED_STATUS_CODE: int = 304
+
+# 再試行するステータスコード
+_RETRY_STATUS_CODES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+# 受け入れる圧縮形式
+# brotliがインストールされている場合のみbrも受け入れる
+_ACCEPT_ENCODING: str = "gzip, deflate"
+if find_spec("brotli") is not None or find_spec("brotlicffi") is not None:
+    _ACCEPT_ENCODING += ", br"
+
+
+def _CreateSession() -> Session:
+    """
+
+    ゆとシート用のセッションを作成する
+
+    Returns:
+        Session: 接続を使い回すセッション
+    """
+
+    from requests import Session
+    from requests.adapters import HTTPAdapter
+
+    session: Session = Session()
+    adapter: HTTPAdapter = HTTPAdapter(
+        pool_connections=1, pool_maxsize=Ytsheet.HTTP_POOL_SIZE
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update(
+        {"Accept-Encoding": _ACCEPT_ENCODING, "Connection": "keep-alive"}
+    )
+
+    return session
+
+
+# コンテナ内で使い回すセッション、初めて使うときに作成する
+_session: Union[Session, None] = None
+_sessionLock: Lock = Lock()
+
+
+def _GetSession() -> Session:
+    """
+
+    コンテナ内で使い回すセッションを返す
+
+    Returns:
+        Session: 接続を使い回すセッション
+    """
+
+    global _session
+
+    # 作成済みの場合はロックを取らずに返す
+    if _session is not None:
+        return _session
+
+    with _sessionLock:
+        if _session is None:
+            _session = _CreateSession()
+
+        return _session
+
+
+@dataclass
+class YtsheetResponse:
+    """
+    ゆとシートの取得結果
+    Attributes:
+        Data Union[dict, None]: 取得したデータ、未更新か失敗の場合はNone
+        ETag str: ETagヘッダー
+        LastModified str: Last-Modifiedヘッダー
+        Error str: 失敗した場合のエラーの種類
+        Cause str: 失敗した場合のエラーの内容
+    """
+
+    Data: Union[dict, None]
+    ETag: str = ""
+    LastModified: str = ""
+    Error: str = ""
+    Cause: str = ""
+
+    def IsNotModified(self) -> bool:
+        """
+        前回取得時から更新されていないかを返す
+
+        Returns:
+            bool: True 未更新
+        """
+        return self.Data is None and not self.IsFailed()
+
+    def IsFailed(self) -> bool:
+        """
+        取得に失敗したかを返す
+
+        Returns:
+            bool: True 失敗
+        """
+        return self.Error != ""
+
+    @classmethod
+    def Failed(cls, error: Exception) -> "YtsheetResponse":
+        """
+        失敗した取得結果を作成する
+
+        Args:
+            error Exception: 発生した例外
+        Returns:
+            YtsheetResponse: 取得結果
+        """
+        return cls(None, Error=type(error).__name__, Cause=str(error))
+
+
+def FetchYtsheet(
+    ytsheetId: str,
+    baseUrl: str = Ytsheet.BASE_URL,
+    etag: str = "",
+    lastModified: str = "",
+) -> YtsheetResponse:
+    """
+
+    ゆとシートからデータを取得する
+    前回取得時の検証子を渡すと、未更新の場合はダウンロードを省略する
+
+    Args:
+        ytsheetId str: ゆとシートのID
+        baseUrl str: ゆとシートのURL
+        etag str: 前回取得時のETag
+        lastModified str: 前回取得時のLast-Modified
+    Returns:
+        YtsheetResponse: 取得結果
+    """
+
+    # 条件付きリクエスト
+    headers: dict[str, str] = {}
+    if etag != "":
+        headers["If-None-Match"] = etag
+    if lastModified != "":
+        headers["If-Modified-Since"] = lastModified
+
+    # ゆとシートにアクセス
+    url: str = f"{MakeYtsheetUrl(ytsheetId, baseUrl)}&mode=json"
+    response: Response = _GetSession().get(
+        url,
+        headers=headers,
+        timeout=(Ytsheet.HTTP_CONNECT_TIMEOUT, Ytsheet.HTTP_READ_TIMEOUT),
+    )
+
+    if response.status_code == _NOT_MODIFIED_STATUS_CODE:
+        return YtsheetResponse(None, etag, lastModified)
+
+    # ステータスコード200以外は例外発生
+    response.raise_for_status()
+
+    # 文字コードの推測を避けるためバイト列のまま読み込む
+    return YtsheetResponse(
+        loads(response.content),
+        response.headers.get("ETag", ""),
+        response.headers.get("Last-Modified", ""),
+    )
+
+
+def FetchYtsheetWithRetry(
+    ytsheetId: str,
+    baseUrl: str = Ytsheet.BASE_URL,
+    etag: str = "",
+    lastModified: str = "",
+    beforeRequest: Union[Callable[[], None], None] = None,
+    maxAttempts: int = Ytsheet.RETRY_MAX_ATTEMPTS,
+) -> YtsheetResponse:
+    """
+
+    一時的なエラーの場合は間隔を空けて再試行しながらゆとシートからデータを取得する
+    接続先が停止中と判断した場合はリクエストを送らずに例外を発生させる
+
+    Args:
+        ytsheetId str: ゆとシートのID
+        baseUrl str: ゆとシートのURL
+        etag str: 前回取得時のETag
+        lastModified str: 前回取得時のLast-Modified
+        beforeRequest Union[Callable[[], None], None]:
+            毎回のリクエスト前に呼び出す処理、流量制限など
+        maxAttempts int: 最大リクエスト数
+    Returns:
+        YtsheetResponse: 取得結果
+    """
+
+    circuitBreaker: CircuitBreaker = GetCircuitBreaker(
+        urlparse(baseUrl).netloc
+    )
+    attempt: int = 0
+    while True:
+        if beforeRequest is not None:
+            beforeRequest()
+
+        circuitBreaker.Before()
+
+        attempt += 1
+        try:
+            response: YtsheetResponse = FetchYtsheet(
+                ytsheetId, baseUrl, etag, lastModified
+            )
+        except (
+            exceptions.ConnectionError,
+            exceptions.Timeout,
+            exceptions.ChunkedEncodingError,
+            exceptions.HTTPError,
+        ) as e:
+            if not _IsTransientError(e):
+                # 接続先は応答しているため失敗扱いにしない
+                circuitBreaker.RecordSuccess()
+                raise
+
+            retryAfterSeconds: float = _GetRetryAfterSeconds(e)
+            if retryAfterSeconds > Ytsheet.RETRY_MAX_SECONDS:
+                # 長く待つよう指示された場合は接続を遮断して諦める
+                circuitBreaker.RecordFailure(retryAfterSeconds)
+                raise
+
+            circuitBreaker.RecordFailure()
+            if attempt >= maxAttempts:
+                raise
+
+            sleep(_GetRetryWaitSeconds(attempt, retryAfterSeconds))
+            continue
+        except Exception:
+            # 応答の読み込みに失敗した場合は接続先の停止とは扱わない
+            circuitBreaker.RecordSuccess()
+            raise
+
+        circuitBreaker.RecordSuccess()
+        return response
+
+
+def _IsTransientError(error: Exception) -> bool:
+    """
+
+    再試行すれば成功する可能性があるエラーかを返す
+
+    Args:
+        error Exception: 発生した例外
+    Returns:
+        bool: True 一時的なエラー
+    """
+
+    if isinstance(error, exceptions.HTTPError):
+        return (
+            error.response is not None
+            and error.response.status_code in _RETRY_STATUS_CODES
+        )
+
+    return True
+
+
+def _GetRetryAfterSeconds(error: Exception) -> float:
+    """
+
+    Retry-Afterヘッダーで指定された待ち時間を返す
+
+    Args:
+        error Exception: 発生した例外
+    Returns:
+        float: 待ち時間(秒)、指定がない場合は0
+    """
+
+    response: Union[Response, None] = getattr(error, "response", None)
+    if response is None:
+        return 0.0
+
+    retryAfter: str = response.headers.get("Retry-After", "").strip()
+    if retryAfter == "":
+        return 0.0
+
+    # 秒数か日時で指定される
+    if retryAfter.isdigit():
+        return float(retryAfter)
+
+    try:
+        retryAt: datetime = parsedate_to_datetime(retryAfter)
+    except (TypeError, ValueError):
+        return 0.0
+
+    if retryAt.tzinfo is None:
+        retryAt = retryAt.replace(tzinfo=timezone.utc)
+
+    return max(0.0, (retryAt - datetime.now(timezone.utc)).total_seconds())
+
+
+def _GetRetryWaitSeconds(attempt: int, retryAfterSeconds: float) -> float:
+    """
+
+    再試行までの待ち時間を返す
+    同時に失敗したリクエストが揃って再送しないよう揺らぎを加える
+
+    Args:
+        attempt int: 失敗したリクエストの回数
+        retryAfterSeconds float: Retry-Afterヘッダーで指定された待ち時間(秒)
+    Returns:
+        float: 待ち時間(秒)
+    """
+
+    if retryAfterSeconds > 0:
+        return retryAfterSeconds
+
+    return uniform(
+        0,
+        min(
+            Ytsheet.RETRY_MAX_SECONDS,
+            Ytsheet.RETRY_BASE_SECONDS * 2 ** (attempt - 1),
+        ),
+    )
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+from zlib import compress, decompress
+
+from MyLibrary.Constant import Ytsheet
+
+"""
+DBに保存するゆとシートのデータの圧縮
+"""
+
+# 圧縮しない
+CODEC_NONE: str = "none"
+
+# zlibで圧縮
+CODEC_ZLIB: str = "zlib"
+
+# zstdで圧縮
+# zstandardがインストールされている場合のみ使用できる
+CODEC_ZSTD: str = "zstd"
+
+# zlibの圧縮レベル
+_ZLIB_LEVEL: int = 9
+
+
+def EncodeCharacter(
+    character: dict, codec: str = Ytsheet.STORAGE_CODEC
+) -> dict:
+    """
+
+    PC情報のゆとシートのデータを圧縮する
+    圧縮済みの場合はそのまま返す
+
+    Args:
+        character dict: PC情報
+        codec str: 圧縮形式
+    Returns:
+        dict: 圧縮後のPC情報
+    """
+
+    if codec == CODEC_NONE or "ytsheet_json" not in character:
+        return character
+
+    encodedCharacter: dict = dict(character)
+    ytsheetJson: bytes = encodedCharacter.pop("ytsheet_json").encode()
+    if codec == CODEC_ZLIB:
+        encodedCharacter["ytsheet_data"] = compress(ytsheetJson, _ZLIB_LEVEL)
+    elif codec == CODEC_ZSTD:
+        from zstandard import ZstdCompressor
+
+        encodedCharacter["ytsheet_data"] = ZstdCompressor().compress(
+            ytsheetJson
+        )
+    else:
+        raise Exception("未対応の圧縮形式です")
+
+    encodedCharacter["ytsheet_codec"] = codec
+    return encodedCharacter
+
+
+def DecodeYtsheetJson(character: dict) -> str:
+    """
+
+    PC情報からゆとシートのデータを取得する
+    圧縮されていない形式にも対応する
+
+    Args:
+        character dict: PC情報
+    Returns:
+        str: ゆとシートのデータ
+    """
+
+    if "ytsheet_data" not in character:
+        return character["ytsheet_json"]
+
+    codec: str = character["ytsheet_codec"]
+    ytsheetData: bytes = bytes(character["ytsheet_data"])
+    if codec == CODEC_ZLIB:
+        return decompress(ytsheetData).decode()
+    elif codec == CODEC_ZSTD:
+        from zstandard import ZstdDecompressor
+
+        return ZstdDecompressor().decompress(ytsheetData).decode()
+
+    raise Exception("未対応の圧縮形式です")
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+
+from asyncio import (
+    Lock,
+    Semaphore,
+    gather,
+    get_running_loop,
+    run,
+    sleep,
+)
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+from typing import Union
+from urllib.parse import urlparse
+
+from MyLibrary.CircuitBreaker import CircuitBreaker, GetCircuitBreaker
+from MyLibrary.Constant import Ytsheet
+from MyLibrary.TokenBucket import TokenBucket
+from MyLibrary.YtsheetClient import FetchYtsheetWithRetry, YtsheetResponse
+
+"""
+ゆとシートの一括取得
+"""
+
+
+class _HostLimiter:
+    """
+    同一ホストへのアクセスを制限する
+    """
+
+    def __init__(self, concurrency: int, interval: float):
+        """
+        コンストラクタ
+
+        concurrency int: 同時接続数
+        interval float: リクエスト開始間隔(秒)
+        """
+
+        self._semaphore: Semaphore = Semaphore(concurrency)
+        self._lock: Lock = Lock()
+        self._interval: float = interval
+        self._nextStartTime: float = 0.0
+
+    async def __aenter__(self):
+        await self._semaphore.acquire()
+
+        # 前回のリクエスト開始から間隔を空ける
+        async with self._lock:
+            waitTime: float = self._nextStartTime - monotonic()
+            if waitTime > 0:
+                await sleep(waitTime)
+
+            self._nextStartTime = monotonic() + self._interval
+
+    async def __aexit__(self, *args):
+        self._semaphore.release()
+
+
+class YtsheetCrawler:
+    """
+    ゆとシートの一括取得
+    取得に失敗したシートは失敗した取得結果を返し、他のシートの取得は続ける
+    """
+
+    def __init__(
+        self,
+        maxConcurrency: int = Ytsheet.CRAWLER_MAX_CONCURRENCY,
+        hostConcurrency: int = Ytsheet.CRAWLER_HOST_CONCURRENCY,
+        hostInterval: float = Ytsheet.CRAWLER_HOST_INTERVAL,
+        baseUrl: str = Ytsheet.BASE_URL,
+        rateLimiter: Union[TokenBucket, None] = None,
+    ):
+        """
+        コンストラクタ
+
+        maxConcurrency int: 全体の同時ダウンロード数
+        hostConcurrency int: 同一ホストへの同時接続数
+        hostInterval float: 同一ホストへのリクエスト開始間隔(秒)
+        baseUrl str: ゆとシートのURL
+        rateLimiter Union[TokenBucket, None]: 他のLambdaと共有する流量制限
+        """
+
+        self.MaxConcurrency: int = maxConcurrency
+        self.HostConcurrency: int = hostConcurrency
+        self.HostInterval: float = hostInterval
+        self.BaseUrl: str = baseUrl
+        self.RateLimiter: Union[TokenBucket, None] = rateLimiter
+
+    def Run(
+        self,
+        ytsheetIds: "list[str]",
+        validators: "Union[dict[str, tuple[str, str]], None]" = None,
+    ) -> "dict[str, YtsheetResponse]":
+        """
+
+        ゆとシートを一括取得する
+
+        Args:
+            ytsheetIds list[str]: ゆとシートのID
+            validators Union[dict[str, tuple[str, str]], None]:
+                ゆとシートのIDごとの前回取得時のETagとLast-Modified
+        Returns:
+            dict[str, YtsheetResponse]: ゆとシートのIDごとの取得結果
+        """
+
+        return run(self.Crawl(ytsheetIds, validators))
+
+    async def Crawl(
+        self,
+        ytsheetIds: "list[str]",
+        validators: "Union[dict[str, tuple[str, str]], None]" = None,
+    ) -> "dict[str, YtsheetResponse]":
+        """
+
+        ゆとシートを一括取得する
+
+        Args:
+            ytsheetIds list[str]: ゆとシートのID
+            validators Union[dict[str, tuple[str, str]], None]:
+                ゆとシートのIDごとの前回取得時のETagとLast-Modified
+        Returns:
+            dict[str, YtsheetResponse]: ゆとシートのIDごとの取得結果
+        """
+
+        ytsheetValidators: dict[str, tuple[str, str]] = validators or {}
+
+        # 同じシートは1回だけ取得
+        uniqueYtsheetIds: list[str] = list(dict.fromkeys(ytsheetIds))
+
+        semaphore: Semaphore = Semaphore(self.MaxConcurrency)
+        hostLimiter: _HostLimiter = _HostLimiter(
+            self.HostConcurrency, self.HostInterval
+        )
+        circuitBreaker: CircuitBreaker = GetCircuitBreaker(
+            urlparse(self.BaseUrl).netloc
+        )
+        with ThreadPoolExecutor(self.MaxConcurrency) as executor:
+
+            async def fetch(ytsheetId: str) -> YtsheetResponse:
+                etag, lastModified = ytsheetValidators.get(ytsheetId, ("", ""))
+                async with semaphore:
+                    # 遮断中の場合は間隔を空けずに失敗とする
+                    if circuitBreaker.IsOpen():
+                        return YtsheetResponse.Failed(
+                            circuitBreaker.MakeOpenError()
+                        )
+
+                    async with hostLimiter:
+                        return await get_running_loop().run_in_executor(
+                            executor,
+                            self._Fetch,
+                            ytsheetId,
+                            etag,
+                            lastModified,
+                        )
+
+            responses: list[YtsheetResponse] = await gather(
+                *map(fetch, uniqueYtsheetIds)
+            )
+
+        return dict(zip(uniqueYtsheetIds, responses))
+
+    def _Fetch(
+        self, ytsheetId: str, etag: str, lastModified: str
+    ) -> YtsheetResponse:
+        """
+
+        流量制限を守ってゆとシートを取得する
+        失敗した場合は例外を発生させずに失敗した取得結果を返す
+
+        Args:
+            ytsheetId str: ゆとシートのID
+            etag str: 前回取得時のETag
+            lastModified str: 前回取得時のLast-Modified
+        Returns:
+            YtsheetResponse: 取得結果
+        """
+
+        try:
+            return FetchYtsheetWithRetry(
+                ytsheetId,
+                self.BaseUrl,
+                etag,
+                lastModified,
+                (
+                    self.RateLimiter.Acquire
+                    if self.RateLimiter is not None
+                    else None
+                ),
+            )
+        except Exception as e:
+            return YtsheetResponse.Failed(e)
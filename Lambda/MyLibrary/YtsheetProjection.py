@@ -0,0 +1,47 @@
+# -*- coding: utf-8 -*-
+
+from re import Pattern, compile
+
+from MyLibrary.Constant import Ytsheet
+
+"""
+ゆとシートのデータから保存するキーを抽出
+"""
+
+# 保存する連番付きのキー
+_PROJECTION_KEY_PATTERN: "Pattern[str]" = compile(
+    Ytsheet.PROJECTION_KEY_PATTERN
+)
+
+
+def ProjectYtsheetData(ytsheetData: dict) -> dict:
+    """
+
+    集計に使うキーのみ抽出する
+
+    Args:
+        ytsheetData dict: ゆとシートから取得したデータ
+    Returns:
+        dict: 抽出後のデータ
+    """
+
+    return {
+        key: value
+        for key, value in ytsheetData.items()
+        if key in Ytsheet.PROJECTION_KEYS
+        or _PROJECTION_KEY_PATTERN.fullmatch(key)
+    }
+
+
+def IsCurrentProjection(character: dict) -> bool:
+    """
+
+    DBに登録済みのPC情報が現在の定義で抽出されたものか
+
+    Args:
+        character dict: DBに登録済みのPC情報
+    Returns:
+        bool: True 現在の定義で抽出済み
+    """
+
+    return character.get("projection_version") == Ytsheet.PROJECTION_VERSION
@@ -0,0 +1,205 @@
+# -*- coding: utf-8 -*-
+
+from functools import lru_cache
+from re import Match, Pattern, compile
+from typing import Union
+
+"""
+ゆとシートの自由記述からの情報の抽出
+"""
+
+# フリガナ
+_FURIGANA_PATTERN: Pattern[str] = compile(r"\|([^《]*)《[^》]*》")
+
+# 一般技能のカッコの中と外
+_GENERAL_SKILL_PART_PATTERN: Pattern[str] = compile(r"[^(（《/]+")
+
+# 経歴の改行
+_FREE_NOTE_SEPARATOR: str = "&lt;br&gt;"
+
+# 経歴から身長と体重を探すキーワード
+_HEIGHT_KEYWORDS: "tuple[str, ...]" = ("身長", "背丈")
+_WEIGHT_KEYWORD: str = "体重"
+_FREE_NOTE_KEYWORD_PATTERN: Pattern[str] = compile(
+    "|".join((*_HEIGHT_KEYWORDS, _WEIGHT_KEYWORD))
+)
+
+# キーワードの直後の数値
+# 長い行で数値が見つからない場合に後戻りが増えないよう、
+# 先読みと後方参照で数値以外の部分を一度に読み飛ばす
+_FREE_NOTE_VALUE_PATTERN: Pattern[str] = compile(
+    r"(?=([^\d\.\|]*))\1(?=(\|*))\2(?=([^\d\.\|]*))\3(?P<value>[\d\.]+)"
+)
+
+# 改行を含む行で使う、行全体を数値に置き換えるパターン
+_FREE_NOTE_LINE_PATTERNS: "dict[str, Pattern[str]]" = {
+    x: compile(f".*{x}{_FREE_NOTE_VALUE_PATTERN.pattern}.*")
+    for x in (*_HEIGHT_KEYWORDS, _WEIGHT_KEYWORD)
+}
+
+# 種族のカッコの中身
+_MINOR_RACE_PATTERN: Pattern[str] = compile(r"(?<=（)(.+)(?=）)")
+
+# 種族のカッコ
+_RACE_DETAIL_PATTERN: Pattern[str] = compile(r"（.+）")
+
+
+def RemoveFurigana(string: str) -> str:
+    """
+
+    フリガナを削除する
+
+    Args:
+        string str: |漢字《かんじ》形式のフリガナを含む文字列
+    Returns:
+        str: フリガナを削除した文字列
+    """
+
+    if "《" not in string:
+        return string
+
+    return _FURIGANA_PATTERN.sub(r"\1", string)
+
+
+def SplitGeneralSkillName(string: str) -> "list[str]":
+    """
+
+    一般技能名をカッコの中と外で分離する
+
+    Args:
+        string str: 一般技能名
+    Returns:
+        list[str]: 分離した一般技能名
+    """
+
+    return _GENERAL_SKILL_PART_PATTERN.findall(
+        string.removesuffix(")").removesuffix("）").removesuffix("》")
+    )
+
+
+def ExtractHeightAndWeight(freeNote: str) -> "tuple[str, str]":
+    """
+
+    経歴から身長と体重を取り出す
+    キーワードを含む行のみを1回の走査で探し、後の行に書かれた値を優先する
+
+    Args:
+        freeNote str: 経歴
+    Returns:
+        tuple[str, str]: 身長と体重、見つからない場合は空文字
+    """
+
+    height: str = ""
+    weight: str = ""
+
+    position: int = 0
+    while True:
+        keywordMatch: Union[Match[str], None] = (
+            _FREE_NOTE_KEYWORD_PATTERN.search(freeNote, position)
+        )
+        if keywordMatch is None:
+            return height, weight
+
+        # キーワードを含む行を切り出す
+        lineStart: int = freeNote.rfind(
+            _FREE_NOTE_SEPARATOR, position, keywordMatch.start()
+        )
+        if lineStart < 0:
+            lineStart = position
+        else:
+            lineStart += len(_FREE_NOTE_SEPARATOR)
+
+        lineEnd: int = freeNote.find(_FREE_NOTE_SEPARATOR, keywordMatch.end())
+        if lineEnd < 0:
+            lineEnd = len(freeNote)
+
+        line: str = freeNote[lineStart:lineEnd]
+
+        # 同じ行に書かれている場合は背丈を優先する
+        for keyword in _HEIGHT_KEYWORDS:
+            value: Union[str, None] = _ExtractValue(line, keyword)
+            if value is not None:
+                height = value
+
+        value = _ExtractValue(line, _WEIGHT_KEYWORD)
+        if value is not None:
+            weight = value
+
+        position = lineEnd + len(_FREE_NOTE_SEPARATOR)
+
+
+def _ExtractValue(line: str, keyword: str) -> Union[str, None]:
+    """
+
+    キーワードの直後に書かれた数値を取り出す
+    キーワードが複数ある場合は、数値が続く最後のキーワードを使う
+
+    Args:
+        line str: 経歴の1行
+        keyword str: キーワード
+    Returns:
+        Union[str, None]: 数値、見つからない場合はNone
+    """
+
+    if keyword not in line:
+        return None
+
+    if "\n" in line:
+        # 改行ごとに置き換わるため、行全体を置き換えた結果を返す
+        value: str = _FREE_NOTE_LINE_PATTERNS[keyword].sub(r"\g<value>", line)
+        return None if value == line else value
+
+    # 後ろのキーワードから順にキーワードの直後だけを照合する
+    index: int = line.rfind(keyword)
+    while index >= 0:
+        valueMatch: Union[Match[str], None] = _FREE_NOTE_VALUE_PATTERN.match(
+            line, index + len(keyword)
+        )
+        if valueMatch is not None:
+            return valueMatch.group("value")
+
+        index = line.rfind(keyword, 0, index)
+
+    return None
+
+
+@lru_cache(maxsize=256)
+def ParseMinorRace(race: str) -> str:
+    """
+
+    マイナー種族を返却する
+    種族の種類は少ないため、種族ごとに結果を使い回す
+
+    Args:
+        race str: 種族
+    Returns:
+        str: マイナー種族
+    """
+
+    if "ナイトメア" in race or "ウィークリング" in race:
+        # 特定種族はかっこをつけたまま返却
+        return race
+
+    minorRaceMatch: Union[Match[str], None] = _MINOR_RACE_PATTERN.search(race)
+    if minorRaceMatch is None:
+        # カッコなしなのでそのまま返却
+        return race
+
+    # カッコの中身を返却
+    return minorRaceMatch.group()
+
+
+@lru_cache(maxsize=256)
+def ParseMajorRace(race: str) -> str:
+    """
+
+    メジャー種族を返却する
+    種族の種類は少ないため、種族ごとに結果を使い回す
+
+    Args:
+        race str: 種族
+    Returns:
+        str: メジャー種族
+    """
+
+    return _RACE_DETAIL_PATTERN.sub("", race)
@@ -1,35 +1,56 @@
 # -*- coding: utf-8 -*-
 
+from __future__ import annotations
 
 from re import sub
 from time import sleep
-from typing import Union
-
-from aws_lambda_powertools.utilities.typing import LambdaContext
-from google.oauth2 import service_account
-from gspread import utils
-from gspread.auth import authorize
-from gspread.client import Client
-from gspread.spreadsheet import Spreadsheet
-from gspread.utils import ValueInputOption
-from gspread.worksheet import CellFormat, Worksheet
+from typing import TYPE_CHECKING, Callable, Union
+
 from MyLibrary.CommonFunction import (
-    ConvertDynamoDBToJson,
+    ConvertDynamoDBToView,
     ConvertJsonToDynamoDB,
-    ConvertToVerticalHeaders,
     InitDb,
+    QueryItems,
 )
-from MyLibrary.Constant import SpreadSheet, SwordWorld, TableName
+from MyLibrary.Constant import SpreadSheet, SwordWorld, TableName, Ytsheet
 from MyLibrary.ExpStatus import ExpStatus
+from MyLibrary.FlagTable import (
+    ABYSS_CURSE_FLAGS,
+    OFFICIAL_GENERAL_SKILL_FLAGS,
+    SKILL_FLAGS,
+    STYLE_20_FLAGS,
+    STYLE_FLAGS,
+    CountFlags,
+)
 from MyLibrary.GeneralSkill import GeneralSkill
+from MyLibrary.LazyImport import LazyModule
 from MyLibrary.Player import Player
-from mypy_boto3_dynamodb.client import DynamoDBClient
-from mypy_boto3_dynamodb.type_defs import QueryOutputTypeDef
+from MyLibrary.PlayerCharacter import PlayerCharacter
+from MyLibrary.SheetRenderer import (
+    Align,
+    Column,
+    CountTotal,
+    FlagTotal,
+    RenderSheets,
+    SheetRenderer,
+    SumTotal,
+    Total,
+)
+
+if TYPE_CHECKING:
+    from aws_lambda_powertools.utilities.typing import LambdaContext
+    from gspread.client import Client
+    from gspread.spreadsheet import Spreadsheet
+    from mypy_boto3_dynamodb.client import DynamoDBClient
 
 """
 スプレッドシートを更新
 """
 
+# Google関係のライブラリは使うときに読み込む
+service_account: LazyModule = LazyModule("google.oauth2.service_account")
+auth: LazyModule = LazyModule("gspread.auth")
+
 # ヘッダーに出力する文字列
 PLAYER_CHARACTER_NAME_HEADER_TEXT: str = "PC名"
 PLAYER_NAME_HEADER_TEXT: str = "PL名"
@@ -77,6 +98,46 @@ RACES_STATUSES: dict = {
     "ラルヴァ": {"diceCount": 9, "fixedValue": 6},
 }
 
+# 経験点の状態ごとの書式
+EXP_FORMATS: dict[ExpStatus, dict] = {
+    ExpStatus.MAX: {
+        "textFormat": {
+            **SpreadSheet.DEFAULT_TEXT_FORMAT,
+            "foregroundColorStyle": {
+                "rgbColor": {"red": 1, "green": 0, "blue": 0}
+            },
+        }
+    },
+    ExpStatus.INACTIVE: {
+        "textFormat": {
+            **SpreadSheet.DEFAULT_TEXT_FORMAT,
+            "foregroundColorStyle": {
+                "rgbColor": {"red": 0, "green": 0, "blue": 1}
+            },
+        }
+    },
+}
+
+# ダイス平均4.5を超える場合の書式
+HIGH_DICE_AVERAGE_FORMAT: dict = {
+    "textFormat": {
+        **SpreadSheet.DEFAULT_TEXT_FORMAT,
+        "foregroundColorStyle": {
+            "rgbColor": {"red": 1, "green": 0, "blue": 0}
+        },
+    }
+}
+
+# 習得レベルに満たない戦闘特技の書式
+GRAY_OUT_FORMAT: dict = {
+    "textFormat": {
+        **SpreadSheet.DEFAULT_TEXT_FORMAT,
+        "foregroundColorStyle": {
+            "rgbColor": {"red": 0.4, "green": 0.4, "blue": 0.4}
+        },
+    }
+}
+
 
 def lambda_handler(event: dict, context: LambdaContext) -> None:
     """
@@ -103,6 +164,27 @@ def lambda_handler(event: dict, context: LambdaContext) -> None:
     # ゆとシートのデータを取得
     players: "list[Player]" = LoadPlayers(seasonId, maxExp, minimumExp)
 
+    # 全シートの内容をまとめて作成
+    renderers: list[SheetRenderer] = [
+        # PLシート
+        CreatePlayerSheet(players),
+        # 基本シート
+        CreateBasicSheet(),
+        # 技能シート
+        CreateCombatSkillSheet(),
+        # 能力値シート
+        CreateStatusSheet(),
+        # 戦闘特技シート
+        CreateAbilitySheet(),
+        # 名誉点・流派シート
+        CreateHonorSheet(),
+        # アビスカースシート
+        CreateAbyssCurseSheet(),
+        # 一般技能シート
+        CreateGeneralSkillSheet(),
+    ]
+    RenderSheets(players, renderers)
+
     # スプレッドシートを開く
     spreadsheet: Spreadsheet = OpenSpreadsheet(
         googleServiceAccount, spreadsheetId
@@ -111,51 +193,63 @@ def lambda_handler(event: dict, context: LambdaContext) -> None:
     # シート並び替え
     ReorderSheets(spreadsheet)
 
-    sleep(interval)
+    # シートごとに間隔を空けて書き込む
+    for renderer in renderers:
+        sleep(interval)
+        renderer.Write(spreadsheet.worksheet(renderer.SheetName))
 
-    # PLシート
-    UpdatePlayerSheet(spreadsheet, players)
 
-    sleep(interval)
-
-    # 基本シート
-    UpdateBasicSheet(spreadsheet, players)
-
-    sleep(interval)
-
-    # 技能シート
-    UpdateCombatSkillSheet(spreadsheet, players)
-
-    sleep(interval)
-
-    # 能力値シート
-    UpdateStatusSheet(spreadsheet, players)
-
-    sleep(interval)
-
-    # 戦闘特技シート
-    UpdateAbilitySheet(spreadsheet, players)
-
-    sleep(interval)
+def LoadPlayers(seasonId: int, maxExp: int, minimumExp: int) -> list[Player]:
+    """DBからプレイヤー情報を取得
 
-    # 名誉点・流派シート
-    UpdateHonorSheet(spreadsheet, players)
+    Args:
+        seasonId int: シーズンID
+        maxExp int: 最大経験点
+        minimumExp int: 最小経験点
 
-    sleep(interval)
+    Returns:
+        list[Player]: プレイヤー情報
+    """
 
-    # アビスカースシート
-    UpdateAbyssCurseSheet(spreadsheet, players)
+    dynamodb: DynamoDBClient = InitDb()
+    if Ytsheet.STORE_CHARACTERS_SEPARATELY:
+        return LoadSeparatedPlayers(dynamodb, seasonId, maxExp, minimumExp)
 
-    sleep(interval)
+    players: list[dict] = list(
+        QueryItems(
+            dynamodb,
+            TableName=TableName.PLAYERS,
+            ProjectionExpression="id, characters, update_time, #name",
+            ExpressionAttributeNames={"#name": "name"},
+            KeyConditionExpression="season_id = :season_id",
+            ExpressionAttributeValues=ConvertJsonToDynamoDB(
+                {":season_id": seasonId}
+            ),
+        )
+    )
 
-    # 一般技能シート
-    UpdateGeneralSkillSheet(spreadsheet, players)
+    return list(
+        map(
+            lambda x: Player(
+                x["name"],
+                x["update_time"],
+                maxExp,
+                minimumExp,
+                x["characters"],
+            ),
+            ConvertDynamoDBToView(players),
+        )
+    )
 
 
-def LoadPlayers(seasonId: int, maxExp: int, minimumExp: int) -> list[Player]:
-    """DBからプレイヤー情報を取得
+def LoadSeparatedPlayers(
+    dynamodb: DynamoDBClient, seasonId: int, maxExp: int, minimumExp: int
+) -> list[Player]:
+    """DBからPCを別項目で保存したプレイヤー情報を取得
+    PC情報は1件ずつ読み込み、PCに変換してから次を読み込む
 
     Args:
+        dynamodb DynamoDBClient: DynamoDBクライアント
         seasonId int: シーズンID
         maxExp int: 最大経験点
         minimumExp int: 最小経験点
@@ -164,46 +258,60 @@ def LoadPlayers(seasonId: int, maxExp: int, minimumExp: int) -> list[Player]:
         list[Player]: プレイヤー情報
     """
 
-    dynamodb: DynamoDBClient = InitDb()
-    projectionExpression: str = "id, characters, update_time, #name"
-    expressionAttributeNames: dict = {"#name": "name"}
-    keyConditionExpression: str = "season_id = :season_id"
     expressionAttributeValues: dict = ConvertJsonToDynamoDB(
         {":season_id": seasonId}
     )
-    response: QueryOutputTypeDef = dynamodb.query(
-        TableName=TableName.PLAYERS,
-        ProjectionExpression=projectionExpression,
-        ExpressionAttributeNames=expressionAttributeNames,
-        KeyConditionExpression=keyConditionExpression,
-        ExpressionAttributeValues=expressionAttributeValues,
+    players: list[dict] = ConvertDynamoDBToView(
+        list(
+            QueryItems(
+                dynamodb,
+                TableName=TableName.PLAYERS,
+                ProjectionExpression="ytsheet_ids, update_time, #name",
+                ExpressionAttributeNames={"#name": "name"},
+                KeyConditionExpression="season_id = :season_id",
+                ExpressionAttributeValues=expressionAttributeValues,
+            )
+        )
     )
 
-    # ページ分割分を取得
-    players: list[dict] = []
-    while "LastEvaluatedKey" in response:
-        players += response["Items"]
-        response = dynamodb.query(
-            TableName=TableName.PLAYERS,
-            ProjectionExpression=projectionExpression,
-            ExpressionAttributeNames=expressionAttributeNames,
-            KeyConditionExpression=keyConditionExpression,
-            ExpressionAttributeValues=expressionAttributeValues,
-            ExclusiveStartKey=response["LastEvaluatedKey"],
-        )
+    # ゆとシートのIDごとの格納先(プレイヤー、PCの順番)
+    owners: dict[str, list[tuple[int, int]]] = {}
+    characters: list[list[Union[PlayerCharacter, None]]] = []
+    for playerIndex, player in enumerate(players):
+        characters.append([None] * len(player["ytsheet_ids"]))
+        for characterIndex, ytsheetId in enumerate(player["ytsheet_ids"]):
+            owners.setdefault(ytsheetId, []).append(
+                (playerIndex, characterIndex)
+            )
 
-    players += response["Items"]
+    for item in QueryItems(
+        dynamodb,
+        TableName=TableName.CHARACTERS,
+        KeyConditionExpression="season_id = :season_id",
+        ExpressionAttributeValues=expressionAttributeValues,
+    ):
+        characterJson: dict = ConvertDynamoDBToView(item)
+        for playerIndex, characterIndex in owners.get(
+            characterJson["ytsheet_id"], []
+        ):
+            characters[playerIndex][characterIndex] = PlayerCharacter(
+                characterJson,
+                players[playerIndex]["name"],
+                maxExp,
+                minimumExp,
+            )
 
     return list(
         map(
             lambda x: Player(
-                x["name"],
-                x["update_time"],
+                x[0]["name"],
+                x[0]["update_time"],
                 maxExp,
                 minimumExp,
-                x["characters"],
+                [],
+                [y for y in x[1] if y is not None],
             ),
-            ConvertDynamoDBToJson(players),
+            zip(players, characters),
         )
     )
 
@@ -227,7 +335,7 @@ def OpenSpreadsheet(
         googleServiceAccount,
         scopes=["https://www.googleapis.com/auth/spreadsheets"],
     )
-    client: Client = authorize(credentials)
+    client: Client = auth.authorize(credentials)
     return client.open_by_key(spreadsheetId)
 
 
@@ -255,1448 +363,506 @@ def ReorderSheets(spreadsheet: Spreadsheet) -> None:
     )
 
 
-def UpdatePlayerSheet(spreadsheet: Spreadsheet, players: list[Player]) -> None:
-    """PLシートを更新
+def NoColumn() -> Column:
+    """No.列
 
-    Args:
-        spreadsheet Spreadsheet: スプレッドシート
-        players list[Player]: PL情報
+    Returns:
+        Column: 列の定義
     """
 
-    worksheet: Worksheet = spreadsheet.worksheet("PL")
-    updateData: list[list] = []
+    return Column("No.", lambda x: x.No)
 
-    maxPcCount: int = max(list(map(lambda x: len(x.Characters), players)))
 
-    # ヘッダー
-    header: list[str] = [
-        "No.",
-        PLAYER_NAME_HEADER_TEXT,
-        ACTIVE_HEADER_TEXT,
-    ]
-    for i in range(maxPcCount):
-        header.append(f"{i + 1}人目")
+def PlayerCharacterNameColumn() -> Column:
+    """PC名列、ゆとシートへのハイパーリンクを設定する
 
-    header.extend(
-        [
-            PLAYER_COUNT_HEADER_TEXT,
-            GAME_MASTER_COUNT_HEADER_TEXT,
-            TOTAL_GAME_COUNT_HEADER_TEXT,
-            "更新日時",
-        ]
-    )
-    updateData.append(header)
-
-    formats: list[CellFormat] = []
-    no: int = 0
-    for player in players:
-        row: list = []
-
-        # No.
-        no += 1
-        row.append(no)
-
-        # PL
-        row.append(player.Name)
-
-        # 参加傾向
-        row.append(
-            max(
-                list(
-                    map(
-                        lambda x: x.ActiveStatus.GetStrForSpreadsheet(),
-                        player.Characters,
-                    )
-                )
-            )
-        )
-
-        # PC名
-        for i in range(maxPcCount):
-            if len(player.Characters) <= i:
-                # PCなし
-                row.append("")
-                continue
-
-            row.append(player.Characters[i].Name)
-            pcIndex: int = header.index(f"{i + 1}人目") + 1
-            pcTextFormat: dict = SpreadSheet.DEFAULT_TEXT_FORMAT.copy()
-            pcTextFormat["link"] = {
-                "uri": player.Characters[i].GetYtsheetUrl()
-            }
-            formats.append(
-                {
-                    "range": utils.rowcol_to_a1(no + 1, pcIndex),
-                    "format": {"textFormat": pcTextFormat},
-                }
-            )
-
-        # 参加
-        playerTimes: int = sum(
-            list(map(lambda x: x.PlayerTimes, player.Characters))
-        )
-        row.append(playerTimes)
+    Returns:
+        Column: 列の定義
+    """
 
-        # GM
-        gameMasterTimes: int = player.GameMasterTimes
-        row.append(gameMasterTimes)
+    return Column(
+        PLAYER_CHARACTER_NAME_HEADER_TEXT,
+        lambda x: x.Character.Name,
+        cellFormat=lambda x, _: x.LinkFormat,
+    )
 
-        # 参加+GM
-        row.append(playerTimes + gameMasterTimes)
 
-        # 更新日時
-        row.append(player.UpdateTime)
+def ActiveColumn(total: Union[Total, None] = None) -> Column:
+    """参加傾向列
 
-        updateData.append(row)
+    Args:
+        total Union[Total, None]: 合計行の集計
 
-    # 合計行
-    total: list = [None] * len(header)
-    activeCountIndex: int = header.index(ACTIVE_HEADER_TEXT)
-    total[activeCountIndex - 1] = "合計"
+    Returns:
+        Column: 列の定義
+    """
 
-    # アクティブ
-    total[activeCountIndex] = sum(
-        x.CountActivePlayerCharacters() for x in players
+    return Column(
+        ACTIVE_HEADER_TEXT,
+        lambda x: x.ActiveStatusText,
+        total,
+        align=Align.CENTER,
     )
 
-    # サブキャラ以降
-    for i in range(1, maxPcCount):
-        pcIndex: int = header.index(f"{i + 1}人目")
-        total[pcIndex] = len([x for x in players if len(x.Characters) > i])
 
-    updateData.append(total)
-
-    # クリア
-    worksheet.clear()
-    worksheet.clear_basic_filter()
-
-    # 更新
-    worksheet.update(
-        updateData, value_input_option=ValueInputOption.user_entered
-    )
+def TrueString(value: bool) -> str:
+    """真偽値をスプレッドシート表示用文字列に変換する
 
-    # 書式設定
-    # 全体
-    startA1: str = utils.rowcol_to_a1(1, 1)
-    endA1: str = utils.rowcol_to_a1(len(updateData), len(header))
-    worksheet.format(
-        f"{startA1}:{endA1}",
-        SpreadSheet.DEFAULT_FORMAT,
-    )
+    Args:
+        value bool: 真偽値
 
-    # ヘッダー
-    startA1 = utils.rowcol_to_a1(1, 1)
-    endA1 = utils.rowcol_to_a1(1, len(header))
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": SpreadSheet.DEFAULT_HEADER_FORMAT,
-        }
-    )
+    Returns:
+        str: Trueの場合は○、それ以外は空文字
+    """
 
-    # アクティブ
-    startA1 = utils.rowcol_to_a1(2, activeCountIndex + 1)
-    endA1: str = utils.rowcol_to_a1(len(updateData), activeCountIndex + 1)
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": {"horizontalAlignment": "CENTER"},
-        }
-    )
+    return SpreadSheet.TRUE_STRING if value else ""
 
-    # 部分的なフォーマットを設定
-    worksheet.batch_format(formats)
 
-    # 行列の固定
-    worksheet.freeze(1, 2)
+class SubCharacterTotal(Total):
+    """
+    2人目以降のPCを持つPLの数
+    """
 
-    # フィルター
-    worksheet.set_basic_filter(
-        1, 1, len(updateData) - 1, len(header)  # type: ignore
-    )
+    def Aggregate(self, rows: list, values: list) -> list:
+        return [None] + [
+            sum(1 for x in rows if len(x.Characters) > i)
+            for i in range(1, len(values[0]) if len(values) > 0 else 0)
+        ]
 
 
-def UpdateBasicSheet(spreadsheet: Spreadsheet, players: list[Player]) -> None:
-    """基本シートを更新
+def CreatePlayerSheet(players: list[Player]) -> SheetRenderer:
+    """PLシートの定義を作成
 
     Args:
-        spreadsheet Spreadsheet: スプレッドシート
         players list[Player]: PL情報
-    """
 
-    worksheet: Worksheet = spreadsheet.worksheet("基本")
-    updateData: list[list] = []
-
-    # ヘッダー
-    vagrantsHeaderText: str = "ｳﾞｧｸﾞﾗﾝﾂ"
-    header: "list[str]" = [
-        "No.",
-        PLAYER_CHARACTER_NAME_HEADER_TEXT,
-        ACTIVE_HEADER_TEXT,
-        PLAYER_NAME_HEADER_TEXT,
-        "種族",
-        "種族\nマイナーチェンジ除く",
-        "年齢",
-        "性別",
-        "身長",
-        "体重",
-        "信仰",
-        vagrantsHeaderText,
-        "穢れ",
-        PLAYER_COUNT_HEADER_TEXT,
-        GAME_MASTER_COUNT_HEADER_TEXT,
-        TOTAL_GAME_COUNT_HEADER_TEXT,
-        "累計ガメル",
-        "死亡",
-    ]
-    updateData.append(header)
-
-    formats: "list[CellFormat]" = []
-    no: int = 0
-    for player in players:
-        for character in player.Characters:
-            row: list = []
-
-            # No.
-            no += 1
-            row.append(no)
+    Returns:
+        SheetRenderer: シート
+    """
 
-            # PC
-            row.append(character.Name)
+    maxPcCount: int = max(list(map(lambda x: len(x.Characters), players)))
 
+    return SheetRenderer(
+        "PL",
+        [
+            NoColumn(),
+            Column(PLAYER_NAME_HEADER_TEXT, lambda x: x.Player.Name),
             # 参加傾向
-            row.append(character.ActiveStatus.GetStrForSpreadsheet())
-
-            # PL
-            row.append(player.Name)
-
-            # 種族
-            row.append(character.GetMinorRace())
-
-            # 種族(マイナーチェンジ除く)
-            row.append(character.GetMajorRace())
-
-            # 年齢
-            row.append(character.Age)
-
-            # 性別
-            row.append(character.Gender)
-
-            # 身長
-            row.append(character.Height)
-
-            # 体重
-            row.append(character.Weight)
-
-            # 信仰
-            row.append(character.Faith)
-
-            # ヴァグランツ
-            row.append(
-                SpreadSheet.TRUE_STRING if character.IsVagrants() else ""
-            )
-
-            # 穢れ
-            row.append(character.Sin)
-
+            Column(
+                ACTIVE_HEADER_TEXT,
+                lambda x: max(
+                    list(map(lambda y: y.ActiveStatusText, x.Characters))
+                ),
+                SumTotal(lambda x: x.Player.CountActivePlayerCharacters()),
+                align=Align.CENTER,
+            ),
+            # PC名
+            Column(
+                [f"{i + 1}人目" for i in range(maxPcCount)],
+                lambda x: [y.Character.Name for y in x.Characters]
+                + [""] * (maxPcCount - len(x.Characters)),
+                SubCharacterTotal(),
+                cellFormat=lambda x, _: [y.LinkFormat for y in x.Characters],
+            ),
             # 参加
-            playerTimes: int = character.PlayerTimes
-            row.append(playerTimes)
-
+            Column(
+                PLAYER_COUNT_HEADER_TEXT,
+                lambda x: sum(
+                    list(map(lambda y: y.PlayerTimes, x.Player.Characters))
+                ),
+            ),
             # GM
-            gameMasterTimes: int = len(character.GameMasterScenarioKeys)
-            row.append(gameMasterTimes)
-
+            Column(
+                GAME_MASTER_COUNT_HEADER_TEXT,
+                lambda x: x.Player.GameMasterTimes,
+            ),
             # 参加+GM
-            row.append(playerTimes + gameMasterTimes)
-
-            # ガメル
-            row.append(character.HistoryMoneyTotal)
-
-            # 死亡
-            row.append(character.DiedTimes)
-
-            updateData.append(row)
-
-            # PC列のハイパーリンク
-            pcTextFormat: dict = SpreadSheet.DEFAULT_TEXT_FORMAT.copy()
-            pcTextFormat["link"] = {"uri": character.GetYtsheetUrl()}
-            formats.append(
-                {
-                    "range": utils.rowcol_to_a1(
-                        no + 1,
-                        header.index(PLAYER_CHARACTER_NAME_HEADER_TEXT) + 1,
-                    ),
-                    "format": {"textFormat": pcTextFormat},
-                }
-            )
-
-    # 合計行
-    total: list = [None] * len(header)
-    activeCountIndex: int = header.index(ACTIVE_HEADER_TEXT)
-    total[activeCountIndex - 1] = "合計"
-
-    # アクティブ
-    total[activeCountIndex] = sum(
-        x.CountActivePlayerCharacters() for x in players
-    )
-
-    # ヴァグランツ
-    total[header.index(vagrantsHeaderText)] = sum(
-        x.CountVagrantsPlayerCharacters() for x in players
-    )
-
-    # 死亡回数
-    total[header.index("死亡")] = sum(
-        sum(y.DiedTimes for y in x.Characters) for x in players
-    )
-    updateData.append(total)
-
-    # クリア
-    worksheet.clear()
-    worksheet.clear_basic_filter()
-
-    # 更新
-    worksheet.update(
-        updateData, value_input_option=ValueInputOption.user_entered
-    )
-
-    # 書式設定
-    # 全体
-    startA1: str = utils.rowcol_to_a1(1, 1)
-    endA1: str = utils.rowcol_to_a1(len(updateData), len(header))
-    worksheet.format(
-        f"{startA1}:{endA1}",
-        SpreadSheet.DEFAULT_FORMAT,
-    )
-
-    # ヘッダー
-    startA1 = utils.rowcol_to_a1(1, 1)
-    endA1 = utils.rowcol_to_a1(1, len(header))
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": SpreadSheet.DEFAULT_HEADER_FORMAT,
-        }
+            Column(
+                TOTAL_GAME_COUNT_HEADER_TEXT,
+                lambda x: sum(
+                    list(map(lambda y: y.PlayerTimes, x.Player.Characters))
+                )
+                + x.Player.GameMasterTimes,
+            ),
+            Column("更新日時", lambda x: x.Player.UpdateTime),
+        ],
+        perPlayer=True,
     )
 
-    # アクティブ
-    startA1 = utils.rowcol_to_a1(2, activeCountIndex + 1)
-    endA1: str = utils.rowcol_to_a1(len(updateData), activeCountIndex + 1)
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": {"horizontalAlignment": "CENTER"},
-        }
-    )
 
-    # 部分的なフォーマットを設定
-    worksheet.batch_format(formats)
+def CreateBasicSheet() -> SheetRenderer:
+    """基本シートの定義を作成
 
-    # 行列の固定
-    worksheet.freeze(1, 2)
+    Returns:
+        SheetRenderer: シート
+    """
 
-    # フィルター
-    worksheet.set_basic_filter(
-        1, 1, len(updateData) - 1, len(header)  # type: ignore
+    return SheetRenderer(
+        "基本",
+        [
+            NoColumn(),
+            PlayerCharacterNameColumn(),
+            ActiveColumn(CountTotal()),
+            Column(PLAYER_NAME_HEADER_TEXT, lambda x: x.Player.Name),
+            Column("種族", lambda x: x.Character.GetMinorRace()),
+            Column(
+                "種族\nマイナーチェンジ除く",
+                lambda x: x.Character.GetMajorRace(),
+            ),
+            Column("年齢", lambda x: x.Character.Age),
+            Column("性別", lambda x: x.Character.Gender),
+            Column("身長", lambda x: x.Character.Height),
+            Column("体重", lambda x: x.Character.Weight),
+            Column("信仰", lambda x: x.Character.Faith),
+            Column(
+                "ｳﾞｧｸﾞﾗﾝﾂ",
+                lambda x: TrueString(x.Character.IsVagrants()),
+                CountTotal(),
+            ),
+            Column("穢れ", lambda x: x.Character.Sin),
+            Column(
+                PLAYER_COUNT_HEADER_TEXT, lambda x: x.Character.PlayerTimes
+            ),
+            Column(
+                GAME_MASTER_COUNT_HEADER_TEXT,
+                lambda x: x.Character.GameMasterTimes,
+            ),
+            Column(
+                TOTAL_GAME_COUNT_HEADER_TEXT,
+                lambda x: x.Character.PlayerTimes
+                + x.Character.GameMasterTimes,
+            ),
+            Column("累計ガメル", lambda x: x.Character.HistoryMoneyTotal),
+            Column("死亡", lambda x: x.Character.DiedTimes, SumTotal()),
+        ],
     )
 
 
-def UpdateCombatSkillSheet(
-    spreadsheet: Spreadsheet, players: list[Player]
-) -> None:
-    """技能シートを更新
+def CreateCombatSkillSheet() -> SheetRenderer:
+    """技能シートの定義を作成
 
-    Args:
-        spreadsheet Spreadsheet: スプレッドシート
-        players list[Player]: PL情報
+    Returns:
+        SheetRenderer: シート
     """
 
-    worksheet: Worksheet = spreadsheet.worksheet("技能")
-    updateData: list[list] = []
-
-    # ヘッダー
-    headers: list[str] = [
-        "No.",
-        PLAYER_CHARACTER_NAME_HEADER_TEXT,
-        ACTIVE_HEADER_TEXT,
-        "信仰",
-        "Lv.",
-        EXP_HEADER_TEXT,
-    ]
-    for skill in SwordWorld.SKILLS.values():
-        headers.append(skill)
-
-    # ヘッダーを縦書き用に変換
-    updateData.append(ConvertToVerticalHeaders(headers))
-
-    formats: list[CellFormat] = []
-    no: int = 0
-    for player in players:
-        for character in player.Characters:
-            row: list = []
-
-            # No.
-            no += 1
-            row.append(no)
-
-            # PC
-            row.append(character.Name)
-
-            # 参加傾向
-            row.append(character.ActiveStatus.GetStrForSpreadsheet())
-
-            # 信仰
-            row.append(character.Faith)
-
-            # Lv
-            row.append(character.Level)
-
-            # 経験点
-            row.append(character.Exp)
-
+    return SheetRenderer(
+        "技能",
+        [
+            NoColumn(),
+            PlayerCharacterNameColumn(),
+            ActiveColumn(),
+            Column("信仰", lambda x: x.Character.Faith),
+            Column("Lv.", lambda x: x.Character.Level),
+            # 経験点の状態ごとに文字色を変える
+            Column(
+                EXP_HEADER_TEXT,
+                lambda x: x.Character.Exp,
+                cellFormat=lambda x, _: EXP_FORMATS.get(
+                    x.Character.ActiveStatus
+                ),
+            ),
             # 技能レベル
-            for skill in SwordWorld.SKILLS:
-                row.append(character.Skills.get(skill, ""))
-
-            updateData.append(row)
-
-            # 書式設定
-            rowIndex: int = no + 1
-
-            # 経験点の文字色
-            expIndex: int = headers.index(EXP_HEADER_TEXT) + 1
-            expTextFormat: dict = SpreadSheet.DEFAULT_TEXT_FORMAT.copy()
-            if character.ActiveStatus == ExpStatus.MAX:
-                expTextFormat["foregroundColorStyle"] = {
-                    "rgbColor": {"red": 1, "green": 0, "blue": 0}
-                }
-                formats.append(
-                    {
-                        "range": utils.rowcol_to_a1(rowIndex, expIndex),
-                        "format": {"textFormat": expTextFormat},
-                    }
-                )
-            elif character.ActiveStatus == ExpStatus.INACTIVE:
-                expTextFormat["foregroundColorStyle"] = {
-                    "rgbColor": {"red": 0, "green": 0, "blue": 1}
-                }
-                formats.append(
-                    {
-                        "range": utils.rowcol_to_a1(rowIndex, expIndex),
-                        "format": {"textFormat": expTextFormat},
-                    }
-                )
-
-            # PC列のハイパーリンク
-            pcIndex: int = headers.index(PLAYER_CHARACTER_NAME_HEADER_TEXT) + 1
-            pcTextFormat: dict = SpreadSheet.DEFAULT_TEXT_FORMAT.copy()
-            pcTextFormat["link"] = {"uri": character.GetYtsheetUrl()}
-            formats.append(
-                {
-                    "range": utils.rowcol_to_a1(rowIndex, pcIndex),
-                    "format": {"textFormat": pcTextFormat},
-                }
-            )
-
-    # 合計行
-    notSkillColumnCount: int = len(headers) - len(SwordWorld.SKILLS)
-    total: list = [None] * notSkillColumnCount
-    total[-1] = "合計"
-    total += list(
-        map(
-            lambda x: sum(
-                len([z for z in y.Characters if z.GetSkillLevel(x) > 0])
-                for y in players
+            Column(
+                list(SwordWorld.SKILLS.values()),
+                lambda x: x.Character.Skills.ToCells(),
+                FlagTotal(SKILL_FLAGS, lambda x: x.Character.SkillFlags),
+                vertical=True,
             ),
-            SwordWorld.SKILLS.keys(),
-        )
-    )
-    updateData.append(total)
-
-    # クリア
-    worksheet.clear()
-    worksheet.clear_basic_filter()
-
-    # 更新
-    worksheet.update(
-        updateData, value_input_option=ValueInputOption.user_entered
-    )
-
-    # 書式設定
-    # 全体
-    startA1: str = utils.rowcol_to_a1(1, 1)
-    endA1: str = utils.rowcol_to_a1(len(updateData), len(headers))
-    worksheet.format(
-        f"{startA1}:{endA1}",
-        SpreadSheet.DEFAULT_FORMAT,
+        ],
     )
 
-    # ヘッダー
-    startA1: str = utils.rowcol_to_a1(1, 1)
-    endA1: str = utils.rowcol_to_a1(1, len(headers))
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": SpreadSheet.DEFAULT_HEADER_FORMAT,
-        }
-    )
 
-    # 技能レベルのヘッダー
-    startA1: str = utils.rowcol_to_a1(1, notSkillColumnCount + 1)
-    endA1: str = utils.rowcol_to_a1(1, len(headers))
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": {"textRotation": {"vertical": True}},
-        }
-    )
-
-    # アクティブ
-    activeCountIndex: int = headers.index(ACTIVE_HEADER_TEXT)
-    startA1 = utils.rowcol_to_a1(2, activeCountIndex + 1)
-    endA1: str = utils.rowcol_to_a1(len(updateData), activeCountIndex + 1)
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": {"horizontalAlignment": "CENTER"},
-        }
-    )
-
-    # 部分的なフォーマットを設定
-    worksheet.batch_format(formats)
-
-    # 行列の固定
-    worksheet.freeze(1, 2)
-
-    # フィルター
-    worksheet.set_basic_filter(
-        1, 1, len(updateData) - 1, len(headers)  # type: ignore
-    )
-
-
-def UpdateStatusSheet(spreadsheet: Spreadsheet, players: list[Player]) -> None:
-    """能力値シートを更新
+def CalculateDiceAverage(character: PlayerCharacter) -> float:
+    """作成時のダイスの出目の平均を計算
 
     Args:
-        spreadsheet Spreadsheet: スプレッドシート
-        players list[Player]: PL情報
-    """
-
-    worksheet: Worksheet = spreadsheet.worksheet("能力値")
-    updateData: list[list] = []
-
-    # ヘッダー
-    adventurerBirthHeader: str = "冒険者\n生まれ"
-    headers: list[str] = [
-        "No.",
-        PLAYER_CHARACTER_NAME_HEADER_TEXT,
-        ACTIVE_HEADER_TEXT,
-        "種族",
-        "器用",
-        "敏捷",
-        "筋力",
-        "生命",
-        "知力",
-        "精神",
-        "成長",
-        "HP",
-        "MP",
-        "生命抵抗",
-        "精神抵抗",
-        "魔物知識",
-        "先制",
-        "ダイス平均",
-        adventurerBirthHeader,
-    ]
-    updateData.append(headers)
-
-    formats: list[CellFormat] = []
-    no: int = 0
-    for player in players:
-        for character in player.Characters:
-            row: list = []
-
-            # ダイス平均を計算
-            racesStatus: dict = RACES_STATUSES[sub("（.*", "", character.Race)]
-            diceAverage: float = (
-                character.Dexterity.Base
-                + character.Agility.Base
-                + character.Strength.Base
-                + character.Vitality.Base
-                + character.Intelligence.Base
-                + character.Mental.Base
-                - racesStatus["fixedValue"]
-            ) / racesStatus["diceCount"]
-
-            # No.
-            no += 1
-            row.append(no)
-
-            # PC
-            row.append(character.Name)
-
-            # 参加傾向
-            row.append(character.ActiveStatus.GetStrForSpreadsheet())
-
-            # 種族
-            row.append(character.GetMinorRace())
-
-            # 器用
-            row.append(character.Dexterity.GetTotalStatus())
-
-            # 敏捷
-            row.append(character.Agility.GetTotalStatus())
-
-            # 筋力
-            row.append(character.Strength.GetTotalStatus())
-
-            # 生命
-            row.append(character.Vitality.GetTotalStatus())
-
-            # 知力
-            row.append(character.Intelligence.GetTotalStatus())
-
-            # 精神
-            row.append(character.Mental.GetTotalStatus())
-
-            # 成長
-            row.append(character.GrowthTimes)
-
-            # HP
-            row.append(character.Hp)
-
-            # MP
-            row.append(character.Mp)
-
-            # 生命抵抗力
-            row.append(character.LifeResistance)
+        character PlayerCharacter: PC
 
-            # 精神抵抗力
-            row.append(character.SpiritResistance)
-
-            # 魔物知識
-            row.append(character.MonsterKnowledge)
-
-            # 先制力
-            row.append(character.Initiative)
-
-            # ダイス平均
-            row.append(diceAverage)
+    Returns:
+        float: ダイス平均
+    """
 
-            # 冒険者生まれ
-            if character.Birth == "冒険者":
-                row.append(SpreadSheet.TRUE_STRING)
+    racesStatus: dict = RACES_STATUSES[sub("（.*", "", character.Race)]
+    return (
+        character.Dexterity.Base
+        + character.Agility.Base
+        + character.Strength.Base
+        + character.Vitality.Base
+        + character.Intelligence.Base
+        + character.Mental.Base
+        - racesStatus["fixedValue"]
+    ) / racesStatus["diceCount"]
 
-            updateData.append(row)
 
-            # 書式設定
-            rowIndex: int = no + 1
+def CreateStatusSheet() -> SheetRenderer:
+    """能力値シートの定義を作成
 
-            # PC列のハイパーリンク
-            pcIndex: int = headers.index(PLAYER_CHARACTER_NAME_HEADER_TEXT) + 1
-            pcTextFormat: dict = SpreadSheet.DEFAULT_TEXT_FORMAT.copy()
-            pcTextFormat["link"] = {"uri": character.GetYtsheetUrl()}
-            formats.append(
-                {
-                    "range": utils.rowcol_to_a1(rowIndex, pcIndex),
-                    "format": {"textFormat": pcTextFormat},
-                }
-            )
+    Returns:
+        SheetRenderer: シート
+    """
 
+    return SheetRenderer(
+        "能力値",
+        [
+            NoColumn(),
+            PlayerCharacterNameColumn(),
+            ActiveColumn(),
+            Column("種族", lambda x: x.Character.GetMinorRace()),
+            Column("器用", lambda x: x.Character.Dexterity.GetTotalStatus()),
+            Column("敏捷", lambda x: x.Character.Agility.GetTotalStatus()),
+            Column("筋力", lambda x: x.Character.Strength.GetTotalStatus()),
+            Column("生命", lambda x: x.Character.Vitality.GetTotalStatus()),
+            Column(
+                "知力", lambda x: x.Character.Intelligence.GetTotalStatus()
+            ),
+            Column("精神", lambda x: x.Character.Mental.GetTotalStatus()),
+            Column("成長", lambda x: x.Character.GrowthTimes),
+            Column("HP", lambda x: x.Character.Hp),
+            Column("MP", lambda x: x.Character.Mp),
+            Column("生命抵抗", lambda x: x.Character.LifeResistance),
+            Column("精神抵抗", lambda x: x.Character.SpiritResistance),
+            Column("魔物知識", lambda x: x.Character.MonsterKnowledge),
+            Column("先制", lambda x: x.Character.Initiative),
             # ダイス平均4.5を超える場合は赤文字
-            if diceAverage > 4.5:
-                diceAverageIndex: int = headers.index("ダイス平均") + 1
-                diceAverageTextFormat: dict = (
-                    SpreadSheet.DEFAULT_TEXT_FORMAT.copy()
-                )
-                diceAverageTextFormat["foregroundColorStyle"] = {
-                    "rgbColor": {"red": 1, "green": 0, "blue": 0}
-                }
-                formats.append(
-                    {
-                        "range": utils.rowcol_to_a1(
-                            rowIndex, diceAverageIndex
-                        ),
-                        "format": {"textFormat": diceAverageTextFormat},
-                    }
-                )
-
-    # クリア
-    worksheet.clear()
-    worksheet.clear_basic_filter()
-
-    # 更新
-    worksheet.update(
-        updateData, value_input_option=ValueInputOption.user_entered
-    )
-
-    # 書式設定
-    # 全体
-    startA1: str = utils.rowcol_to_a1(1, 1)
-    endA1: str = utils.rowcol_to_a1(len(updateData), len(headers))
-    worksheet.format(
-        f"{startA1}:{endA1}",
-        SpreadSheet.DEFAULT_FORMAT,
-    )
-
-    # ヘッダー
-    startA1: str = utils.rowcol_to_a1(1, 1)
-    endA1: str = utils.rowcol_to_a1(1, len(headers))
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": SpreadSheet.DEFAULT_HEADER_FORMAT,
-        }
-    )
-
-    # アクティブ
-    activeCountIndex: int = headers.index(ACTIVE_HEADER_TEXT)
-    startA1 = utils.rowcol_to_a1(2, activeCountIndex + 1)
-    endA1: str = utils.rowcol_to_a1(len(updateData), activeCountIndex + 1)
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": {"horizontalAlignment": "CENTER"},
-        }
+            Column(
+                "ダイス平均",
+                lambda x: CalculateDiceAverage(x.Character),
+                cellFormat=lambda _, y: (
+                    HIGH_DICE_AVERAGE_FORMAT if y > 4.5 else None
+                ),
+                numberFormat={"type": "NUMBER", "pattern": "0.00"},
+            ),
+            Column(
+                "冒険者\n生まれ",
+                lambda x: TrueString(x.Character.Birth == "冒険者"),
+                align=Align.CENTER,
+            ),
+        ],
     )
 
-    # ダイス平均
-    diceAverageIndex: int = headers.index("ダイス平均") + 1
-    startA1: str = utils.rowcol_to_a1(1, diceAverageIndex)
-    endA1: str = utils.rowcol_to_a1(len(updateData), diceAverageIndex)
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": {"numberFormat": {"type": "NUMBER", "pattern": "0.00"}},
-        }
-    )
 
-    # アクティブ
-    adventurerBirthIndex: int = headers.index(adventurerBirthHeader)
-    startA1 = utils.rowcol_to_a1(2, adventurerBirthIndex + 1)
-    endA1: str = utils.rowcol_to_a1(len(updateData), adventurerBirthIndex + 1)
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": {"horizontalAlignment": "CENTER"},
-        }
-    )
+def CombatFeatColumn(level: int, combatFeat: Callable) -> Column:
+    """戦闘特技列、習得レベルに満たないものはグレーで表示する
 
-    # 部分的なフォーマットを設定
-    worksheet.batch_format(formats)
+    Args:
+        level int: 習得レベル
+        combatFeat Callable: PCから戦闘特技を返す処理
 
-    # 行列の固定
-    worksheet.freeze(1, 2)
+    Returns:
+        Column: 列の定義
+    """
 
-    # フィルター
-    worksheet.set_basic_filter(
-        1, 1, len(updateData), len(headers)  # type: ignore
+    return Column(
+        f"Lv.{level}",
+        lambda x: combatFeat(x.Character),
+        cellFormat=lambda x, _: (
+            GRAY_OUT_FORMAT if x.Character.Level < level else None
+        ),
     )
 
 
-def UpdateAbilitySheet(
-    spreadsheet: Spreadsheet, players: list[Player]
-) -> None:
-    """戦闘特技シートを更新
+def CreateAbilitySheet() -> SheetRenderer:
+    """戦闘特技シートの定義を作成
 
-    Args:
-        spreadsheet Spreadsheet: スプレッドシート
-        players list[Player]: PL情報
+    Returns:
+        SheetRenderer: シート
     """
 
-    worksheet: Worksheet = spreadsheet.worksheet("戦闘特技")
-    updateData: list[list] = []
-
-    # ヘッダー
-    headers: list[str] = [
-        "No.",
-        PLAYER_CHARACTER_NAME_HEADER_TEXT,
-        ACTIVE_HEADER_TEXT,
-        "バトルダンサー",
-        "Lv.1",
-        "Lv.3",
-        "Lv.5",
-        "Lv.7",
-        "Lv.9",
-        "Lv.11",
-        "Lv.13",
-        "自動取得",
-    ]
-    updateData.append(headers)
-
-    formats: list[CellFormat] = []
-    no: int = 0
-    for player in players:
-        for character in player.Characters:
-            row: list = []
-
-            # No.
-            no += 1
-            row.append(no)
-
-            # PC
-            row.append(character.Name)
-
-            # 参加傾向
-            row.append(character.ActiveStatus.GetStrForSpreadsheet())
-
-            # バトルダンサー
-            row.append(character.CombatFeatsLv1bat)
-
-            # Lv.1
-            row.append(character.CombatFeatsLv1)
-
-            # Lv.3
-            row.append(character.CombatFeatsLv3)
-
-            # Lv.5
-            row.append(character.CombatFeatsLv5)
-
-            # Lv.7
-            row.append(character.CombatFeatsLv7)
-
-            # Lv.9
-            row.append(character.CombatFeatsLv9)
-
-            # Lv.11
-            row.append(character.CombatFeatsLv11)
-
-            # Lv.13
-            row.append(character.CombatFeatsLv13)
-
-            # 自動取得
-            for autoCombatFeat in character.AutoCombatFeats:
-                row.append(autoCombatFeat)
-
-            updateData.append(row)
-
-            # 書式設定
-            rowIndex: int = no + 1
-
-            # PC列のハイパーリンク
-            pcIndex: int = headers.index(PLAYER_CHARACTER_NAME_HEADER_TEXT) + 1
-            pcTextFormat: dict = SpreadSheet.DEFAULT_TEXT_FORMAT.copy()
-            pcTextFormat["link"] = {"uri": character.GetYtsheetUrl()}
-            formats.append(
-                {
-                    "range": utils.rowcol_to_a1(rowIndex, pcIndex),
-                    "format": {"textFormat": pcTextFormat},
-                }
-            )
-
-            # 習得レベルに満たないものはグレーで表示
-            grayOutStartIndex: Union[int, None] = None
-            for level in range(3, 15, 2):
-                if character.Level < level:
-                    grayOutStartIndex = headers.index(f"Lv.{level}") + 1
-                    break
-
-            if grayOutStartIndex is not None:
-                grayOutEndIndex: int = headers.index("Lv.13") + 1
-                grayOutTextFormat: dict = (
-                    SpreadSheet.DEFAULT_TEXT_FORMAT.copy()
-                )
-                grayOutTextFormat["foregroundColorStyle"] = {
-                    "rgbColor": {"red": 0.4, "green": 0.4, "blue": 0.4}
-                }
-                startA1: str = utils.rowcol_to_a1(rowIndex, grayOutStartIndex)
-                endA1: str = utils.rowcol_to_a1(rowIndex, grayOutEndIndex)
-                formats.append(
-                    {
-                        "range": f"{startA1}:{endA1}",
-                        "format": {"textFormat": grayOutTextFormat},
-                    }
-                )
-
-                # バトルダンサー未習得もグレーで表示
-                if character.Skills.get("lvBat", 0) == 0:
-                    battleDancerIndex: int = (
-                        headers.index("バトルダンサー") + 1
-                    )
-                    battleDancerA1: str = utils.rowcol_to_a1(
-                        rowIndex, battleDancerIndex
-                    )
-                    formats.append(
-                        {
-                            "range": f"{battleDancerA1}:{battleDancerA1}",
-                            "format": {"textFormat": grayOutTextFormat},
-                        }
+    return SheetRenderer(
+        "戦闘特技",
+        [
+            NoColumn(),
+            PlayerCharacterNameColumn(),
+            ActiveColumn(),
+            # バトルダンサー未習得もグレーで表示
+            Column(
+                "バトルダンサー",
+                lambda x: x.Character.CombatFeatsLv1bat,
+                cellFormat=lambda x, _: (
+                    GRAY_OUT_FORMAT
+                    if x.Character.Level < 13
+                    and x.Character.GetSkillLevel(
+                        SwordWorld.BATTLE_DANCER_LEVEL_KEY
                     )
-
-    # クリア
-    worksheet.clear()
-    worksheet.clear_basic_filter()
-
-    # 更新
-    worksheet.update(
-        updateData, value_input_option=ValueInputOption.user_entered
-    )
-
-    # 書式設定
-    # 全体
-    startA1: str = utils.rowcol_to_a1(1, 1)
-    endA1: str = utils.rowcol_to_a1(len(updateData), worksheet.col_count)
-    worksheet.format(
-        f"{startA1}:{endA1}",
-        SpreadSheet.DEFAULT_FORMAT,
-    )
-
-    # ヘッダー
-    startA1 = utils.rowcol_to_a1(1, 1)
-    endA1 = utils.rowcol_to_a1(1, len(headers))
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": SpreadSheet.DEFAULT_HEADER_FORMAT,
-        }
-    )
-
-    # アクティブ
-    activeCountIndex: int = headers.index(ACTIVE_HEADER_TEXT)
-    startA1 = utils.rowcol_to_a1(2, activeCountIndex + 1)
-    endA1: str = utils.rowcol_to_a1(len(updateData), activeCountIndex + 1)
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": {"horizontalAlignment": "CENTER"},
-        }
-    )
-
-    # 部分的なフォーマットを設定
-    worksheet.batch_format(formats)
-
-    # 行列の固定
-    worksheet.freeze(1, 2)
-
-    # フィルター
-    worksheet.set_basic_filter(
-        1, 1, len(updateData), worksheet.col_count  # type: ignore
+                    == 0
+                    else None
+                ),
+            ),
+            # 1レベルの戦闘特技は全てのPCが習得済みのため、グレーにしない
+            Column("Lv.1", lambda x: x.Character.CombatFeatsLv1),
+            CombatFeatColumn(3, lambda x: x.CombatFeatsLv3),
+            CombatFeatColumn(5, lambda x: x.CombatFeatsLv5),
+            CombatFeatColumn(7, lambda x: x.CombatFeatsLv7),
+            CombatFeatColumn(9, lambda x: x.CombatFeatsLv9),
+            CombatFeatColumn(11, lambda x: x.CombatFeatsLv11),
+            CombatFeatColumn(13, lambda x: x.CombatFeatsLv13),
+            # 取得数が決まっていないため、見出しの後ろに並べる
+            Column(["自動取得"], lambda x: x.Character.AutoCombatFeats),
+        ],
+        coverAllColumns=True,
     )
 
 
-def UpdateHonorSheet(spreadsheet: Spreadsheet, players: list[Player]) -> None:
-    """名誉点・流派シートを更新
+def CreateHonorSheet() -> SheetRenderer:
+    """名誉点・流派シートの定義を作成
 
-    Args:
-        spreadsheet Spreadsheet: スプレッドシート
-        players list[Player]: PL情報
+    Returns:
+        SheetRenderer: シート
     """
 
-    worksheet: Worksheet = spreadsheet.worksheet("名誉点・流派")
-    updateData: list[list] = []
-
-    # ヘッダー
-    headers: "list[str]" = [
-        "No.",
-        PLAYER_CHARACTER_NAME_HEADER_TEXT,
-        ACTIVE_HEADER_TEXT,
-        "冒険者ランク",
-        "累計名誉点",
-        "入門数",
-        "2.0流派",
-    ]
-    for style in SwordWorld.STYLES:
-        headers.append(style.Name)
-
-    updateData.append(ConvertToVerticalHeaders(headers))
-
-    formats: "list[CellFormat]" = []
-    no: int = 0
-    for player in players:
-        for character in player.Characters:
-            row: list = []
-
-            # 流派の情報を取得
-            is20: bool = False
-            learnedStyles: list[str] = []
-            for style in SwordWorld.STYLES:
-                learnedStyle: str = ""
-                if style in character.Styles:
-                    # 該当する流派に入門している
-                    learnedStyle = SpreadSheet.TRUE_STRING
-                    if style.Is20:
-                        is20 = True
-
-                learnedStyles.append(learnedStyle)
-
-            # No.
-            no += 1
-            row.append(no)
-
-            # PC
-            row.append(character.Name)
-
-            # 参加傾向
-            row.append(character.ActiveStatus.GetStrForSpreadsheet())
-
-            # 冒険者ランク
-            row.append(character.AdventurerRank)
-
-            # 累計名誉点
-            row.append(character.TotalHonor)
-
-            # 加入数
-            row.append(len(character.Styles))
-
-            # 2.0流派
-            row.append(SpreadSheet.TRUE_STRING if is20 else "")
-
+    return SheetRenderer(
+        "名誉点・流派",
+        [
+            NoColumn(),
+            PlayerCharacterNameColumn(),
+            ActiveColumn(),
+            Column("冒険者ランク", lambda x: x.Character.AdventurerRank),
+            Column("累計名誉点", lambda x: x.Character.TotalHonor),
+            Column("入門数", lambda x: CountFlags(x.Character.StyleFlags)),
+            Column(
+                "2.0流派",
+                lambda x: TrueString(x.Character.StyleFlags & STYLE_20_FLAGS),
+                CountTotal(),
+                align=Align.CENTER_ROWS,
+                vertical=True,
+            ),
             # 各流派
-            row += learnedStyles
-
-            updateData.append(row)
-
-            # PC列のハイパーリンク
-            pcIndex: int = headers.index(PLAYER_CHARACTER_NAME_HEADER_TEXT) + 1
-            rowIndex: int = no + 1
-            pcTextFormat: dict = SpreadSheet.DEFAULT_TEXT_FORMAT.copy()
-            pcTextFormat["link"] = {"uri": character.GetYtsheetUrl()}
-            formats.append(
-                {
-                    "range": utils.rowcol_to_a1(rowIndex, pcIndex),
-                    "format": {"textFormat": pcTextFormat},
-                }
-            )
-
-    # 合計行
-    notTotalColumnCount: int = 6
-    total: list = [None] * notTotalColumnCount
-    total[-1] = "合計"
-
-    # 2.0流派所持
-    total.append(
-        sum(
-            len([y for y in x.Characters if any(z.Is20 for z in y.Styles)])
-            for x in players
-        )
-    )
-
-    # 各流派
-    total += list(
-        map(
-            lambda x: sum(
-                len([z for z in y.Characters if x in z.Styles])
-                for y in players
+            Column(
+                list(STYLE_FLAGS.Keys),
+                lambda x: STYLE_FLAGS.ToCells(
+                    x.Character.StyleFlags, SpreadSheet.TRUE_STRING
+                ),
+                FlagTotal(STYLE_FLAGS, lambda x: x.Character.StyleFlags),
+                align=Align.CENTER_ROWS,
+                vertical=True,
             ),
-            SwordWorld.STYLES,
-        )
+        ],
     )
-    updateData.append(total)
 
-    # クリア
-    worksheet.clear()
-    worksheet.clear_basic_filter()
 
-    # 更新
-    worksheet.update(
-        updateData, value_input_option=ValueInputOption.user_entered
-    )
+def CreateAbyssCurseSheet() -> SheetRenderer:
+    """アビスカースシートの定義を作成
 
-    # 書式設定
-    # 全体
-    startA1: str = utils.rowcol_to_a1(1, 1)
-    endA1: str = utils.rowcol_to_a1(len(updateData), len(headers))
-    worksheet.format(
-        f"{startA1}:{endA1}",
-        SpreadSheet.DEFAULT_FORMAT,
-    )
-
-    # ヘッダー
-    startA1 = utils.rowcol_to_a1(1, 1)
-    endA1 = utils.rowcol_to_a1(1, len(headers))
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": SpreadSheet.DEFAULT_HEADER_FORMAT,
-        }
-    )
-
-    # 流派のヘッダー
-    startA1 = utils.rowcol_to_a1(1, notTotalColumnCount + 1)
-    endA1 = utils.rowcol_to_a1(1, len(headers))
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": {"textRotation": {"vertical": True}},
-        }
-    )
-
-    # アクティブ
-    activeCountIndex: int = headers.index(ACTIVE_HEADER_TEXT)
-    startA1 = utils.rowcol_to_a1(2, activeCountIndex + 1)
-    endA1: str = utils.rowcol_to_a1(len(updateData), activeCountIndex + 1)
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": {"horizontalAlignment": "CENTER"},
-        }
-    )
-
-    # ○
-    startA1 = utils.rowcol_to_a1(2, notTotalColumnCount + 1)
-    endA1: str = utils.rowcol_to_a1(len(updateData) - 1, len(headers))
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": {"horizontalAlignment": "CENTER"},
-        }
-    )
-
-    # 部分的なフォーマットを設定
-    worksheet.batch_format(formats)
-
-    # 行列の固定
-    worksheet.freeze(1, 2)
-
-    # フィルター
-    worksheet.set_basic_filter(
-        1, 1, len(updateData) - 1, len(headers)  # type: ignore
-    )
-
-
-def UpdateAbyssCurseSheet(
-    spreadsheet: Spreadsheet, players: list[Player]
-) -> None:
-    """アビスカースシートを更新
-
-    Args:
-        spreadsheet Spreadsheet: スプレッドシート
-        players list[Player]: PL情報
+    Returns:
+        SheetRenderer: シート
     """
 
-    worksheet: Worksheet = spreadsheet.worksheet("アビスカース")
-    updateData: list[list] = []
-
-    # ヘッダー
-    headers: "list[str]" = [
-        "No.",
-        PLAYER_CHARACTER_NAME_HEADER_TEXT,
-        ACTIVE_HEADER_TEXT,
-        "数",
-    ]
-    for abyssCurse in SwordWorld.ABYSS_CURSES:
-        headers.append(abyssCurse)
-
-    # ヘッダーを追加
-    updateData.append(headers)
-
-    formats: "list[CellFormat]" = []
-    no: int = 0
-    for player in players:
-        for character in player.Characters:
-            row: list = []
-
-            # アビスカースの情報を取得
-            receivedCurses: list[str] = []
-            receivedCursesString: str = ""
-            for abyssCurse in SwordWorld.ABYSS_CURSES:
-                receivedCurse: str = ""
-                if abyssCurse in character.AbyssCurses:
-                    receivedCurse = SpreadSheet.TRUE_STRING
-                    receivedCursesString += abyssCurse
-
-                receivedCurses.append(receivedCurse)
-
-            # No.
-            no += 1
-            row.append(no)
-
-            # PC
-            row.append(receivedCursesString + character.Name)
-
-            # 参加傾向
-            row.append(character.ActiveStatus.GetStrForSpreadsheet())
-
-            # 数
-            row.append(len(character.AbyssCurses))
-
+    return SheetRenderer(
+        "アビスカース",
+        [
+            NoColumn(),
+            # PC名の前にアビスカースを並べる
+            Column(
+                PLAYER_CHARACTER_NAME_HEADER_TEXT,
+                lambda x: "".join(
+                    ABYSS_CURSE_FLAGS.ToKeys(x.Character.AbyssCurseFlags)
+                )
+                + x.Character.Name,
+                cellFormat=lambda x, _: {
+                    "wrapStrategy": "WRAP",
+                    "textFormat": x.LinkTextFormat,
+                },
+            ),
+            ActiveColumn(),
+            Column(
+                "数",
+                lambda x: CountFlags(x.Character.AbyssCurseFlags),
+                SumTotal(),
+            ),
             # 各アビスカース
-            row += receivedCurses
-
-            updateData.append(row)
-
-            # PC列のハイパーリンク
-            pcIndex: int = headers.index(PLAYER_CHARACTER_NAME_HEADER_TEXT) + 1
-            rowIndex: int = no + 1
-            pcTextFormat: dict = SpreadSheet.DEFAULT_TEXT_FORMAT.copy()
-            pcTextFormat["link"] = {"uri": character.GetYtsheetUrl()}
-            formats.append(
-                {
-                    "range": utils.rowcol_to_a1(rowIndex, pcIndex),
-                    "format": {
-                        "wrapStrategy": "WRAP",
-                        "textFormat": pcTextFormat,
-                    },
-                }
-            )
-
-    # 合計行
-    total: list = [None] * 3
-    total[-1] = "合計"
-
-    # アビスカースの数
-    total.append(
-        sum(sum(len(y.AbyssCurses) for y in x.Characters) for x in players)
-    )
-
-    # 各カースの数
-    total += list(
-        map(
-            lambda x: sum(
-                len([z for z in y.Characters if x in z.AbyssCurses])
-                for y in players
+            Column(
+                list(ABYSS_CURSE_FLAGS.Keys),
+                lambda x: ABYSS_CURSE_FLAGS.ToCells(
+                    x.Character.AbyssCurseFlags, SpreadSheet.TRUE_STRING
+                ),
+                FlagTotal(
+                    ABYSS_CURSE_FLAGS, lambda x: x.Character.AbyssCurseFlags
+                ),
+                align=Align.CENTER_ROWS,
             ),
-            SwordWorld.ABYSS_CURSES,
-        )
-    )
-    updateData.append(total)
-
-    # クリア
-    worksheet.clear()
-    worksheet.clear_basic_filter()
-
-    # 更新
-    worksheet.update(
-        updateData, value_input_option=ValueInputOption.user_entered
-    )
-
-    # 書式設定
-    # 全体
-    generalFormatStartA1: str = utils.rowcol_to_a1(1, 1)
-    generalFormatEndA1: str = utils.rowcol_to_a1(len(updateData), len(headers))
-    worksheet.format(
-        f"{generalFormatStartA1}:{generalFormatEndA1}",
-        SpreadSheet.DEFAULT_FORMAT,
+        ],
     )
 
-    # ヘッダー
-    headerFormatStartA1: str = utils.rowcol_to_a1(1, 1)
-    headerFormatEndA1: str = utils.rowcol_to_a1(1, len(headers))
-    formats.append(
-        {
-            "range": f"{headerFormatStartA1}:{headerFormatEndA1}",
-            "format": SpreadSheet.DEFAULT_HEADER_FORMAT,
-        }
-    )
 
-    # アクティブ
-    activeCountIndex: int = headers.index(ACTIVE_HEADER_TEXT)
-    startA1 = utils.rowcol_to_a1(2, activeCountIndex + 1)
-    endA1: str = utils.rowcol_to_a1(len(updateData), activeCountIndex + 1)
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": {"horizontalAlignment": "CENTER"},
-        }
-    )
+def GetOfficialGeneralSkills(character: PlayerCharacter) -> list[GeneralSkill]:
+    """公式一般技能を返す
 
-    # ○
-    markFormatStartA1: str = utils.rowcol_to_a1(
-        2, len(headers) - len(SwordWorld.ABYSS_CURSES) + 1
-    )
-    markFormatEndA1: str = utils.rowcol_to_a1(
-        len(updateData) - 1, len(headers)
-    )
-    formats.append(
-        {
-            "range": f"{markFormatStartA1}:{markFormatEndA1}",
-            "format": {"horizontalAlignment": "CENTER"},
-        }
-    )
-
-    # 部分的なフォーマットを設定
-    worksheet.batch_format(formats)
+    Args:
+        character PlayerCharacter: PC
 
-    # 行列の固定
-    worksheet.freeze(1, 2)
+    Returns:
+        list[GeneralSkill]: 公式一般技能
+    """
 
-    # フィルター
-    worksheet.set_basic_filter(
-        1, 1, len(updateData) - 1, len(headers)  # type: ignore
-    )
+    return [
+        x
+        for x in character.GeneralSkills
+        if x.Name in OFFICIAL_GENERAL_SKILL_FLAGS
+    ]
 
 
-def UpdateGeneralSkillSheet(
-    spreadsheet: Spreadsheet, players: list[Player]
-) -> None:
-    """一般技能シートを更新
+def GetOfficialGeneralSkillLevels(
+    character: PlayerCharacter,
+) -> list[Union[int, None]]:
+    """公式一般技能のレベルを定数の順に返す
 
     Args:
-        spreadsheet Spreadsheet: スプレッドシート
-        players list[Player]: PL情報
-    """
+        character PlayerCharacter: PC
 
-    worksheet: Worksheet = spreadsheet.worksheet("一般技能")
-    updateData: list[list] = []
-
-    # ヘッダー
-    headers: "list[str]" = [
-        "No.",
-        PLAYER_CHARACTER_NAME_HEADER_TEXT,
-        ACTIVE_HEADER_TEXT,
-        "公式技能",
-        "オリジナル技能",
-    ]
-    for officialGeneralSkillName in SwordWorld.OFFICIAL_GENERAL_SKILL_NAMES:
-        headers.append(officialGeneralSkillName)
-
-    updateData.append(ConvertToVerticalHeaders(headers))
-
-    formats: "list[CellFormat]" = []
-    no: int = 0
-    for player in players:
-        for character in player.Characters:
-            # 公式一般技能のレベル取得
-            officialGeneralSkills: list[GeneralSkill] = list(
-                filter(
-                    lambda x: x.Name
-                    in SwordWorld.OFFICIAL_GENERAL_SKILL_NAMES,
-                    character.GeneralSkills,
-                )
-            )
-            officialGeneralSkillLevels: list[Union[int, None]] = [None] * len(
-                SwordWorld.OFFICIAL_GENERAL_SKILL_NAMES
-            )
-            for officialGeneralSkill in officialGeneralSkills:
-                officialGeneralSkillLevels[
-                    SwordWorld.OFFICIAL_GENERAL_SKILL_NAMES.index(
-                        officialGeneralSkill.Name
-                    )
-                ] = officialGeneralSkill.Level
+    Returns:
+        list[Union[int, None]]: レベル、未習得の場合はNone
+    """
 
-            row: list = []
+    levels: list[Union[int, None]] = [None] * len(OFFICIAL_GENERAL_SKILL_FLAGS)
+    for officialGeneralSkill in GetOfficialGeneralSkills(character):
+        levels[
+            OFFICIAL_GENERAL_SKILL_FLAGS.Index(officialGeneralSkill.Name)
+        ] = officialGeneralSkill.Level
 
-            # No.
-            no += 1
-            row.append(no)
+    return levels
 
-            # PC
-            row.append(character.Name)
 
-            # 参加傾向
-            row.append(character.ActiveStatus.GetStrForSpreadsheet())
+def CreateGeneralSkillSheet() -> SheetRenderer:
+    """一般技能シートの定義を作成
 
-            # 公式技能
-            row.append(
-                "\n".join([x.getFormattedStr() for x in officialGeneralSkills])
-            )
+    Returns:
+        SheetRenderer: シート
+    """
 
-            # オリジナル技能
-            row.append(
-                "\n".join(
+    return SheetRenderer(
+        "一般技能",
+        [
+            NoColumn(),
+            PlayerCharacterNameColumn(),
+            ActiveColumn(),
+            Column(
+                "公式技能",
+                lambda x: "\n".join(
                     [
-                        x.getFormattedStr()
-                        for x in list(
-                            filter(
-                                lambda x: x.Name
-                                not in SwordWorld.OFFICIAL_GENERAL_SKILL_NAMES,
-                                character.GeneralSkills,
-                            )
-                        )
+                        y.getFormattedStr()
+                        for y in GetOfficialGeneralSkills(x.Character)
                     ]
-                )
-            )
-
-            # 公式技能
-            row += officialGeneralSkillLevels
-
-            updateData.append(row)
-
-            # PC列のハイパーリンク
-            pcTextFormat: dict = SpreadSheet.DEFAULT_TEXT_FORMAT.copy()
-            pcTextFormat["link"] = {"uri": character.GetYtsheetUrl()}
-            formats.append(
-                {
-                    "range": utils.rowcol_to_a1(
-                        no + 1,
-                        headers.index(PLAYER_CHARACTER_NAME_HEADER_TEXT) + 1,
-                    ),
-                    "format": {"textFormat": pcTextFormat},
-                }
-            )
-
-    # 合計行
-    notTotalColumnCount: int = len(headers) - len(
-        SwordWorld.OFFICIAL_GENERAL_SKILL_NAMES
-    )
-    total: list = [None] * notTotalColumnCount
-    total[-1] = "合計"
-    for officialGeneralSkillName in SwordWorld.OFFICIAL_GENERAL_SKILL_NAMES:
-        total.append(
-            sum(
-                len(
+                ),
+            ),
+            Column(
+                "オリジナル技能",
+                lambda x: "\n".join(
                     [
-                        y
-                        for y in x.Characters
-                        if any(
-                            z.Name == officialGeneralSkillName
-                            for z in y.GeneralSkills
-                        )
+                        y.getFormattedStr()
+                        for y in x.Character.GeneralSkills
+                        if y.Name not in OFFICIAL_GENERAL_SKILL_FLAGS
                     ]
-                )
-                for x in players
-            )
-        )
-
-    updateData.append(total)
-
-    # クリア
-    worksheet.clear()
-    worksheet.clear_basic_filter()
-
-    # 更新
-    worksheet.update(
-        updateData, value_input_option=ValueInputOption.user_entered
-    )
-
-    # 書式設定
-    # 全体
-    startA1: str = utils.rowcol_to_a1(1, 1)
-    endA1: str = utils.rowcol_to_a1(len(updateData), len(headers))
-    worksheet.format(
-        f"{startA1}:{endA1}",
-        SpreadSheet.DEFAULT_FORMAT,
-    )
-
-    # ヘッダー
-    startA1 = utils.rowcol_to_a1(1, 1)
-    endA1 = utils.rowcol_to_a1(1, len(headers))
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": SpreadSheet.DEFAULT_HEADER_FORMAT,
-        }
-    )
-
-    # 縦書きヘッダー
-    startA1 = utils.rowcol_to_a1(1, notTotalColumnCount + 1)
-    endA1 = utils.rowcol_to_a1(1, len(headers))
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": {"textRotation": {"vertical": True}},
-        }
-    )
-
-    # アクティブ
-    activeCountIndex: int = headers.index(ACTIVE_HEADER_TEXT)
-    startA1 = utils.rowcol_to_a1(2, activeCountIndex + 1)
-    endA1: str = utils.rowcol_to_a1(len(updateData), activeCountIndex + 1)
-    formats.append(
-        {
-            "range": f"{startA1}:{endA1}",
-            "format": {"horizontalAlignment": "CENTER"},
-        }
-    )
-
-    # 部分的なフォーマットを設定
-    worksheet.batch_format(formats)
-
-    # 行列の固定
-    worksheet.freeze(1, 2)
-
-    # フィルター
-    worksheet.set_basic_filter(
-        1, 1, len(updateData) - 1, len(headers)  # type: ignore
+                ),
+            ),
+            # 公式技能のレベル
+            Column(
+                list(OFFICIAL_GENERAL_SKILL_FLAGS.Keys),
+                lambda x: GetOfficialGeneralSkillLevels(x.Character),
+                FlagTotal(
+                    OFFICIAL_GENERAL_SKILL_FLAGS,
+                    lambda x: x.Character.GeneralSkillFlags,
+                ),
+                vertical=True,
+            ),
+        ],
     )
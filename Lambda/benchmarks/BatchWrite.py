@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+
+from moto import mock_aws
+from MyLibrary.BatchWriter import BatchWriter
+from MyLibrary.CommonFunction import InitDb
+from MyLibrary.Constant import TableName
+
+from benchmarks.Support import Measure, PrintTable, RemoteClient
+from tests.Support import CreateTables, ResetContainer
+
+"""
+BatchWriterの書き込み件数ごとのスループット
+motoに通信の遅延を加えて、同時書き込み数とスロットリングの有無ごとに計測する
+
+python -m benchmarks.BatchWrite
+"""
+
+# 書き込む件数
+ITEM_COUNTS: "tuple[int, ...]" = (100, 500, 2000)
+
+# 1件ずつ登録する場合と比べる最大件数、多いと時間がかかるため
+SINGLE_ITEM_MAX_COUNT: int = 500
+
+# 同時書き込み数
+CONCURRENCIES: "tuple[int, ...]" = (1, 4, 8)
+
+# 1リクエストあたりの往復時間(秒)
+LATENCY: float = 0.02
+
+# スロットリング時に未処理として返す項目の割合
+UNPROCESSED_RATIO: float = 0.5
+
+
+def MakePlayers(count: int) -> "list[dict]":
+    """
+
+    登録するプレイヤーを作成する
+
+    Args:
+        count int: 件数
+    Returns:
+        list[dict]: プレイヤー
+    """
+
+    return [
+        {
+            "season_id": 1,
+            "id": i,
+            "name": f"PL{i}",
+            "ytsheet_ids": [f"sheet{i}"],
+            "characters": [],
+            "update_time": "2024-01-01T00:00:00.000000Z",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def main() -> None:
+    rows: list[list] = []
+    with mock_aws():
+        ResetContainer()
+        CreateTables(InitDb())
+        for count in ITEM_COUNTS:
+            players: list[dict] = MakePlayers(count)
+
+            if count <= SINGLE_ITEM_MAX_COUNT:
+                # 1件ずつ登録
+                client: RemoteClient = RemoteClient(InitDb(), LATENCY)
+                milliseconds: float = Measure(
+                    lambda: [
+                        BatchWriter(client, TableName.PLAYERS).PutItems([x])
+                        for x in players
+                    ],
+                    repeat=1,
+                )
+                rows.append(
+                    [count, "single", 1, milliseconds, client.RequestCount]
+                )
+
+            for unprocessedRatio in (0.0, UNPROCESSED_RATIO):
+                for concurrency in CONCURRENCIES:
+                    client = RemoteClient(InitDb(), LATENCY, unprocessedRatio)
+                    milliseconds = Measure(
+                        lambda: BatchWriter(
+                            client, TableName.PLAYERS, concurrency
+                        ).PutItems(players),
+                        repeat=1,
+                    )
+                    rows.append(
+                        [
+                            count,
+                            (
+                                "throttled"
+                                if unprocessedRatio > 0
+                                else "batched"
+                            ),
+                            concurrency,
+                            milliseconds,
+                            client.RequestCount,
+                        ]
+                    )
+
+    PrintTable(
+        ["items", "mode", "concurrency", "ms", "requests", "items/s"],
+        [row + [round(row[0] / row[3] * 1000)] for row in rows],
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+from gc import collect
+from tracemalloc import get_traced_memory, start, stop
+
+from MyLibrary.Player import Player
+from MyLibrary.PlayerCharacter import PlayerCharacter
+
+from benchmarks.Support import MakeCharacterJson, PrintTable
+
+"""
+PCを保持するメモリ量
+tracemallocで1,000PCあたりの確保済みメモリを計測する
+変換前のPC情報は計測前に作成し、PCとPLの保持分のみを数える
+
+python -m benchmarks.CharacterMemory
+"""
+
+# PC数
+CHARACTER_COUNTS: "tuple[int, ...]" = (1000, 3000)
+
+# 1PLあたりのPC数
+CHARACTERS_PER_PLAYER: int = 3
+
+# 1PCあたりのセッション履歴の行数
+HISTORY_COUNT: int = 30
+
+
+def MeasureCharacters(characterCount: int) -> "tuple[float, float]":
+    """
+
+    PCとPLを作成して、保持しているメモリを計測する
+
+    Args:
+        characterCount int: PC数
+    Returns:
+        tuple[float, float]: PCのメモリ(KB)、PLを含むメモリ(KB)
+    """
+
+    characterJsons: list[dict] = [
+        MakeCharacterJson(i, HISTORY_COUNT) for i in range(characterCount)
+    ]
+
+    collect()
+    start()
+    baseline: int = get_traced_memory()[0]
+    characters: list[PlayerCharacter] = [
+        PlayerCharacter(x, "PL", 10000, 3000) for x in characterJsons
+    ]
+    collect()
+    characterMemory: int = get_traced_memory()[0] - baseline
+
+    players: list[Player] = [
+        Player(
+            f"PL{i}",
+            "2024-01-01T00:00:00.000Z",
+            10000,
+            3000,
+            [],
+            characters[i : i + CHARACTERS_PER_PLAYER],
+        )
+        for i in range(0, characterCount, CHARACTERS_PER_PLAYER)
+    ]
+    collect()
+    totalMemory: int = get_traced_memory()[0] - baseline
+    stop()
+
+    return characterMemory / 1024, totalMemory / 1024
+
+
+def main() -> None:
+    rows: list[list] = []
+    for characterCount in CHARACTER_COUNTS:
+        characterMemory, totalMemory = MeasureCharacters(characterCount)
+        rows.append(
+            [
+                characterCount,
+                characterMemory,
+                totalMemory,
+                totalMemory * 1000 / characterCount,
+            ]
+        )
+
+    print(f"{HISTORY_COUNT} history rows per character")
+    PrintTable(
+        [
+            "characters",
+            "characters KB",
+            "with players KB",
+            "KB per 1000",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+
+import sys
+from subprocess import run
+
+from boto3 import client
+from moto import mock_aws
+from MyLibrary.CommonFunction import InitDb
+from MyLibrary.Constant import Aws, TableName
+
+from benchmarks.Support import Measure, PrintTable
+from tests.Support import LAMBDA_DIRECTORY, CreateTables, ResetContainer
+
+"""
+AWSクライアントの作成と呼び出しの時間
+以前の呼び出しごとにクライアントを作成する場合と、ClientRegistryで使い回す場合を比べる
+起動時間は別のプロセスで計測し、呼び出しの時間はmotoで計測する
+
+python -m benchmarks.ClientRegistry
+"""
+
+# 起動時間の計測回数
+STARTUP_REPEAT: int = 5
+
+# 計測するウォーム状態の呼び出し回数
+INVOCATION_COUNT: int = 50
+
+# 1回の呼び出しでDynamoDBにリクエストする回数
+REQUEST_COUNT: int = 5
+
+# 別のプロセスでクライアントを作成して時間を出力する処理
+STARTUP_SCRIPTS: dict[str, str] = {
+    "per call": (
+        "from time import perf_counter\n"
+        "startTime = perf_counter()\n"
+        "from boto3 import client\n"
+        f"client('dynamodb', region_name='{Aws.REGION_NAME}')\n"
+        "print(perf_counter() - startTime)\n"
+    ),
+    "registry": (
+        "from time import perf_counter\n"
+        "startTime = perf_counter()\n"
+        "from MyLibrary.CommonFunction import InitDb\n"
+        "InitDb()\n"
+        "print(perf_counter() - startTime)\n"
+    ),
+}
+
+
+def MeasureStartup(script: str) -> float:
+    """
+
+    新しいプロセスで初めてクライアントを作成するまでの時間を計測する
+
+    Args:
+        script str: 実行する処理
+    Returns:
+        float: 処理時間(ミリ秒)
+    """
+
+    return (
+        min(
+            float(
+                run(
+                    [sys.executable, "-c", script],
+                    cwd=LAMBDA_DIRECTORY,
+                    capture_output=True,
+                    check=True,
+                    text=True,
+                ).stdout
+            )
+            for _ in range(STARTUP_REPEAT)
+        )
+        * 1000
+    )
+
+
+def Invoke(getClient) -> None:
+    """
+
+    1回の呼び出しを再現する
+
+    Args:
+        getClient Callable: クライアントを取得する処理
+    """
+
+    dynamoDb = getClient()
+    for i in range(REQUEST_COUNT):
+        dynamoDb.get_item(
+            TableName=TableName.PLAYERS,
+            Key={"season_id": {"N": "1"}, "id": {"N": str(i)}},
+        )
+
+
+def main() -> None:
+    rows: list[list] = []
+    with mock_aws():
+        ResetContainer()
+        CreateTables(InitDb())
+
+        getClients: dict = {
+            "per call": lambda: client(
+                "dynamodb", region_name=Aws.REGION_NAME
+            ),
+            "registry": InitDb,
+        }
+        for name, getClient in getClients.items():
+            startup: float = MeasureStartup(STARTUP_SCRIPTS[name])
+            getClientTime: float = (
+                Measure(lambda: [getClient() for _ in range(INVOCATION_COUNT)])
+                / INVOCATION_COUNT
+            )
+            invocationTime: float = (
+                Measure(
+                    lambda: [
+                        Invoke(getClient) for _ in range(INVOCATION_COUNT)
+                    ]
+                )
+                / INVOCATION_COUNT
+            )
+            rows.append(
+                [
+                    name,
+                    startup,
+                    f"{getClientTime:.3f}",
+                    invocationTime,
+                    f"{invocationTime / REQUEST_COUNT:.2f}",
+                ]
+            )
+
+    print(
+        f"warm invocations: {INVOCATION_COUNT}, "
+        f"requests per invocation: {REQUEST_COUNT}"
+    )
+    PrintTable(
+        [
+            "client",
+            "cold start ms",
+            "get client ms",
+            "invocation ms",
+            "per request ms",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+
+from MyLibrary.YtsheetCrawler import YtsheetCrawler
+
+from benchmarks.Support import Measure, PrintTable
+from tests.Support import FakeYtsheetServer, ResetContainer
+
+"""
+シーズンの規模ごとのクローラーの取得時間
+ローカルのHTTPサーバーに通信の遅延を加えて、同時ダウンロード数ごとに計測する
+
+python -m benchmarks.CrawlSeason
+"""
+
+# シーズンのシート数
+SEASON_SIZES: "tuple[int, ...]" = (50, 200, 800)
+
+# 同時ダウンロード数
+CONCURRENCIES: "tuple[int, ...]" = (1, 4, 16)
+
+# 1シートあたりの応答時間(秒)
+RESPONSE_DELAY: float = 0.02
+
+
+def main() -> None:
+    ResetContainer()
+    rows: list[list] = []
+    with FakeYtsheetServer(RESPONSE_DELAY) as server:
+        for size in SEASON_SIZES:
+            ytsheetIds: list[str] = [str(i) for i in range(size)]
+            for ytsheetId in ytsheetIds:
+                server.AddSheet(ytsheetId, {"characterName": ytsheetId})
+
+            row: list = [size]
+            for concurrency in CONCURRENCIES:
+                crawler: YtsheetCrawler = YtsheetCrawler(
+                    concurrency, concurrency, 0.0, server.BaseUrl
+                )
+                row.append(
+                    Measure(lambda: crawler.Run(ytsheetIds), repeat=1) / 1000
+                )
+
+            rows.append(row)
+
+    PrintTable(
+        ["sheets"] + [f"concurrency {x} (s)" for x in CONCURRENCIES], rows
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+
+from datetime import datetime, timedelta
+
+from MyLibrary.CommonFunction import (
+    JST,
+    SPREADSHEET_DATETIME_FORMAT,
+    DateTimesToStrsForDynamoDB,
+    StrForDynamoDBToStrForSpreadsheet,
+    StrsForDynamoDBToDateTimes,
+)
+from pytz import timezone
+
+from benchmarks.Support import Measure, PrintTable
+
+"""
+DynamoDBの日時文字列の変換速度
+以前のpytzによる変換と、1シーズン分のupdate_timeで比べる
+
+python -m benchmarks.DateTimeConversion
+"""
+
+# 1シーズンのプレイヤー数
+PLAYER_COUNT: int = 3000
+
+# 同じ更新日時のプレイヤー数、同じ処理で更新したPLは更新日時が同じ
+PLAYERS_PER_UPDATE: int = 20
+
+# 計測の実行回数
+REPEAT: int = 5
+
+
+def LegacyStrForDynamoDBToDateTime(target: str) -> datetime:
+    """以前の実装の日時文字列からの変換"""
+
+    isoStr = target.removesuffix("Z")
+    utc: datetime = datetime.fromisoformat(isoStr)
+    return utc.astimezone(timezone("Asia/Tokyo"))
+
+
+def LegacyDateTimeToStrForDynamoDB(target: datetime) -> str:
+    """以前の実装の日時文字列への変換"""
+
+    gmt = target
+    if target.tzinfo is not None:
+        gmt = target.astimezone(None).replace(tzinfo=None)
+
+    return f"{gmt.isoformat(timespec='milliseconds')}Z"
+
+
+def MakeUpdateTimes() -> "list[str]":
+    """
+
+    1シーズン分のupdate_timeを作成する
+
+    Returns:
+        list[str]: 日時文字列
+    """
+
+    startTime: datetime = datetime(2024, 1, 1)
+    return [
+        (startTime + timedelta(hours=i // PLAYERS_PER_UPDATE)).isoformat(
+            timespec="milliseconds"
+        )
+        + "Z"
+        for i in range(PLAYER_COUNT)
+    ]
+
+
+def ConvertForSpreadsheet(updateTimes: "list[str]") -> "list[str]":
+    """
+
+    スプレッドシートに出力する日時文字列に変換する
+    キャッシュはLambdaの呼び出しごとに空の状態から計測する
+
+    Args:
+        updateTimes list[str]: 日時文字列
+    Returns:
+        list[str]: スプレッドシートの日時文字列
+    """
+
+    StrForDynamoDBToStrForSpreadsheet.cache_clear()
+    return list(map(StrForDynamoDBToStrForSpreadsheet, updateTimes))
+
+
+def main() -> None:
+    updateTimes: list[str] = MakeUpdateTimes()
+    dateTimes: list[datetime] = [
+        x.astimezone(JST) for x in StrsForDynamoDBToDateTimes(updateTimes)
+    ]
+
+    cases: list[tuple] = [
+        (
+            "parse",
+            lambda: list(map(LegacyStrForDynamoDBToDateTime, updateTimes)),
+            lambda: StrsForDynamoDBToDateTimes(updateTimes),
+        ),
+        (
+            "format",
+            lambda: list(map(LegacyDateTimeToStrForDynamoDB, dateTimes)),
+            lambda: DateTimesToStrsForDynamoDB(dateTimes),
+        ),
+        (
+            "spreadsheet",
+            lambda: [
+                LegacyStrForDynamoDBToDateTime(x).strftime(
+                    SPREADSHEET_DATETIME_FORMAT
+                )
+                for x in updateTimes
+            ],
+            lambda: ConvertForSpreadsheet(updateTimes),
+        ),
+    ]
+
+    rows: list[list] = []
+    for name, legacy, current in cases:
+        legacyTime: float = Measure(legacy, REPEAT)
+        currentTime: float = Measure(current, REPEAT)
+        rows.append(
+            [name, legacyTime, currentTime, f"{legacyTime / currentTime:.2f}x"]
+        )
+
+    print(
+        f"{PLAYER_COUNT} update_time values, "
+        f"{PLAYERS_PER_UPDATE} players per update"
+    )
+    PrintTable(["conversion", "legacy ms", "current ms", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
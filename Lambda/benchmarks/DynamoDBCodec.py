@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+from functools import singledispatch
+from typing import Union
+
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+from MyLibrary.DynamoDBCodec import DecodeItem, EncodeItem
+
+from benchmarks.Support import Measure, PrintTable
+
+"""
+DynamoDBの項目の変換処理の速度
+以前の再帰による変換とboto3のTypeDeserializer/TypeSerializerと比べる
+1シーズン分のプレイヤーと、入れ子の深いキャラクターデータで計測する
+
+python -m benchmarks.DynamoDBCodec
+"""
+
+# 1シーズンのプレイヤー数
+PLAYER_COUNT: int = 300
+
+# 1プレイヤーあたりのキャラクター数
+CHARACTER_COUNT: int = 3
+
+# キャラクターデータの履歴の行数
+HISTORY_COUNT: int = 40
+
+# 計測の実行回数
+REPEAT: int = 5
+
+
+@singledispatch
+def LegacyConvertDynamoDBToJson(dynamoDBData):
+    """以前の実装のDynamoDBからの変換"""
+
+    raise Exception("未対応の型です")
+
+
+@LegacyConvertDynamoDBToJson.register  # type: ignore
+def _(dynamoDBData: dict) -> dict:
+    convertedJson: dict = {}
+    for key, value in dynamoDBData.items():
+        if isinstance(value, dict):
+            convertedJson[key] = _LegacyConvertDynamoDBToJsonByTypeKey(value)
+        else:
+            raise Exception("未対応の型です")
+
+    return convertedJson
+
+
+@LegacyConvertDynamoDBToJson.register  # type: ignore
+def _(dynamoDBData: list) -> list:
+    return list(map(LegacyConvertDynamoDBToJson, dynamoDBData))
+
+
+def _LegacyConvertDynamoDBToJsonByTypeKey(
+    dynamoDBData: dict,
+) -> Union[str, float, list, dict]:
+    key = next(iter(dynamoDBData.keys()))
+    value = next(iter(dynamoDBData.values()))
+    if key == "S":
+        return value
+    elif key == "N":
+        return float(value)
+    elif key == "M":
+        return LegacyConvertDynamoDBToJson(value)
+    elif key == "L":
+        return list(map(_LegacyConvertDynamoDBToJsonByTypeKey, value))
+
+    raise Exception("未対応の型です")
+
+
+def LegacyConvertJsonToDynamoDB(json: dict) -> dict:
+    """以前の実装のDynamoDBへの変換"""
+
+    convertedJson: dict = {}
+    for key, value in json.items():
+        convertedJson[key] = _LegacyConvertJsonToDynamoDBByTypeKey(value)
+
+    return convertedJson
+
+
+def _LegacyConvertJsonToDynamoDBByTypeKey(
+    value: Union[str, int, float, dict, list],
+) -> dict:
+    if isinstance(value, str):
+        return {"S": value}
+    elif isinstance(value, (int, float)):
+        return {"N": str(value)}
+    elif isinstance(value, dict):
+        return {"M": LegacyConvertJsonToDynamoDB(value)}
+    elif isinstance(value, list):
+        return {
+            "L": list(
+                map(lambda x: _LegacyConvertJsonToDynamoDBByTypeKey(x), value)
+            )
+        }
+    else:
+        raise Exception("未対応の型です")
+
+
+def MakePlayers() -> "list[dict]":
+    """
+
+    1シーズン分のプレイヤーを作成する
+
+    Returns:
+        list[dict]: プレイヤー
+    """
+
+    return [
+        {
+            "season_id": 1,
+            "id": i,
+            "name": f"PL{i}",
+            "ytsheet_ids": [f"sheet{i}-{j}" for j in range(CHARACTER_COUNT)],
+            "characters": [
+                {
+                    "ytsheet_id": f"sheet{i}-{j}",
+                    "name": f"キャラクター{i}-{j}",
+                    "level": 7,
+                    "exp": 12000 + i,
+                    "skills": {
+                        f"lv{name}": j + 3
+                        for name in ("Fig", "Sco", "Sag", "Ran", "Enh")
+                    },
+                    "history": [
+                        {"date": "2024-01-01", "exp": 1000, "honor": 30}
+                        for _ in range(HISTORY_COUNT)
+                    ],
+                }
+                for j in range(CHARACTER_COUNT)
+            ],
+            "update_time": "2024-01-01T00:00:00.000000Z",
+        }
+        for i in range(1, PLAYER_COUNT + 1)
+    ]
+
+
+def main() -> None:
+    players: list[dict] = MakePlayers()
+    items: list[dict] = [EncodeItem(x) for x in players]
+    deserializer: TypeDeserializer = TypeDeserializer()
+    serializer: TypeSerializer = TypeSerializer()
+
+    decoders: dict = {
+        "legacy": lambda: LegacyConvertDynamoDBToJson(items),
+        "DecodeItem": lambda: [DecodeItem(x) for x in items],
+        "TypeDeserializer": lambda: [
+            {k: deserializer.deserialize(v) for k, v in x.items()}
+            for x in items
+        ],
+    }
+    encoders: dict = {
+        "legacy": lambda: [LegacyConvertJsonToDynamoDB(x) for x in players],
+        "EncodeItem": lambda: [EncodeItem(x) for x in players],
+        "TypeSerializer": lambda: [
+            {k: serializer.serialize(v) for k, v in x.items()} for x in players
+        ],
+    }
+
+    rows: list[list] = []
+    for direction, functions in (("decode", decoders), ("encode", encoders)):
+        baseline: float = 0.0
+        for name, function in functions.items():
+            milliseconds: float = Measure(function, REPEAT)
+            baseline = baseline or milliseconds
+            rows.append(
+                [
+                    direction,
+                    name,
+                    milliseconds,
+                    f"{baseline / milliseconds:.2f}x",
+                ]
+            )
+
+    print(
+        f"{PLAYER_COUNT} players x {CHARACTER_COUNT} characters, "
+        f"{HISTORY_COUNT} history rows each"
+    )
+    PrintTable(["direction", "codec", "ms", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+from MyLibrary.Constant import SpreadSheet, SwordWorld
+from MyLibrary.FlagTable import ABYSS_CURSE_FLAGS, STYLE_FLAGS, CountFlags
+from MyLibrary.Player import Player
+
+from benchmarks.Support import MakeCharacterJson, Measure, PrintTable
+
+"""
+流派とアビスカースのシートの各行と合計行の作成速度
+以前の一覧の要素ごとにPCのリストを探す集計と、全ての流派とアビスカースで比べる
+
+python -m benchmarks.FlagTotals
+"""
+
+# PL数
+PLAYER_COUNTS: "tuple[int, ...]" = (300, 1000)
+
+# 1PLあたりのPC数
+CHARACTERS_PER_PLAYER: int = 3
+
+# 計測の実行回数
+REPEAT: int = 3
+
+
+def LegacyStyleTable(players: "list[Player]") -> "tuple[list, list]":
+    """以前の実装の流派の各行と合計行"""
+
+    rows: list[list] = []
+    for player in players:
+        for character in player.Characters:
+            learnedStyles: list[str] = []
+            for style in SwordWorld.STYLES:
+                learnedStyle: str = ""
+                if style in character.Styles:
+                    learnedStyle = SpreadSheet.TRUE_STRING
+
+                learnedStyles.append(learnedStyle)
+
+            rows.append([len(character.Styles)] + learnedStyles)
+
+    total: list = [
+        sum(len([z for z in y.Characters if x in z.Styles]) for y in players)
+        for x in SwordWorld.STYLES
+    ]
+
+    return rows, total
+
+
+def LegacyAbyssCurseTable(players: "list[Player]") -> "tuple[list, list]":
+    """以前の実装のアビスカースの各行と合計行"""
+
+    rows: list[list] = []
+    for player in players:
+        for character in player.Characters:
+            receivedCurses: list[str] = []
+            for abyssCurse in SwordWorld.ABYSS_CURSES:
+                receivedCurse: str = ""
+                if abyssCurse in character.AbyssCurses:
+                    receivedCurse = SpreadSheet.TRUE_STRING
+
+                receivedCurses.append(receivedCurse)
+
+            rows.append([len(character.AbyssCurses)] + receivedCurses)
+
+    total: list = [
+        sum(
+            len([z for z in y.Characters if x in z.AbyssCurses])
+            for y in players
+        )
+        for x in SwordWorld.ABYSS_CURSES
+    ]
+
+    return rows, total
+
+
+def StyleTable(players: "list[Player]") -> "tuple[list, list]":
+    """
+
+    流派のフラグから各行と合計行を作成する
+
+    Args:
+        players list[Player]: PL
+    Returns:
+        tuple[list, list]: 各行と合計行
+    """
+
+    flagsList: list[int] = [
+        y.StyleFlags for x in players for y in x.Characters
+    ]
+    rows: list[list] = [
+        [CountFlags(x)] + STYLE_FLAGS.ToCells(x, SpreadSheet.TRUE_STRING)
+        for x in flagsList
+    ]
+
+    return rows, STYLE_FLAGS.CountColumns(flagsList)
+
+
+def AbyssCurseTable(players: "list[Player]") -> "tuple[list, list]":
+    """
+
+    アビスカースのフラグから各行と合計行を作成する
+
+    Args:
+        players list[Player]: PL
+    Returns:
+        tuple[list, list]: 各行と合計行
+    """
+
+    flagsList: list[int] = [
+        y.AbyssCurseFlags for x in players for y in x.Characters
+    ]
+    rows: list[list] = [
+        [CountFlags(x)] + ABYSS_CURSE_FLAGS.ToCells(x, SpreadSheet.TRUE_STRING)
+        for x in flagsList
+    ]
+
+    return rows, ABYSS_CURSE_FLAGS.CountColumns(flagsList)
+
+
+def main() -> None:
+    rows: list[list] = []
+    for playerCount in PLAYER_COUNTS:
+        players: list[Player] = [
+            Player(
+                f"PL{i}",
+                "2024-01-01T00:00:00.000Z",
+                10000,
+                3000,
+                [
+                    MakeCharacterJson(i * CHARACTERS_PER_PLAYER + j)
+                    for j in range(CHARACTERS_PER_PLAYER)
+                ],
+            )
+            for i in range(playerCount)
+        ]
+
+        for name, keyCount, legacy, current in (
+            (
+                "styles",
+                len(SwordWorld.STYLES),
+                LegacyStyleTable,
+                StyleTable,
+            ),
+            (
+                "abyss curses",
+                len(SwordWorld.ABYSS_CURSES),
+                LegacyAbyssCurseTable,
+                AbyssCurseTable,
+            ),
+        ):
+            # 以前の実装と同じ結果になることを確認する
+            if legacy(players) != current(players):
+                raise Exception(f"{name}の集計結果が異なります")
+
+            legacyTime: float = Measure(lambda: legacy(players), REPEAT)
+            currentTime: float = Measure(lambda: current(players), REPEAT)
+            rows.append(
+                [
+                    playerCount * CHARACTERS_PER_PLAYER,
+                    name,
+                    keyCount,
+                    legacyTime,
+                    currentTime,
+                    f"{legacyTime / currentTime:.2f}x",
+                ]
+            )
+
+    PrintTable(
+        [
+            "characters",
+            "table",
+            "columns",
+            "legacy ms",
+            "current ms",
+            "speedup",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
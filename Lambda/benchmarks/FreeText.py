@@ -0,0 +1,211 @@
+# -*- coding: utf-8 -*-
+
+from re import Match, search, sub
+from typing import Union
+
+from MyLibrary.YtsheetText import (
+    ExtractHeightAndWeight,
+    ParseMajorRace,
+    ParseMinorRace,
+    RemoveFurigana,
+)
+
+from benchmarks.Support import (
+    FREE_NOTE_LINE,
+    FREE_NOTE_SEPARATOR,
+    RACES,
+    Measure,
+    PrintTable,
+)
+
+"""
+PC名、種族、経歴の身長と体重の読み取り速度
+以前の毎回コンパイルする正規表現と、数KBの経歴を持つPCで比べる
+経歴は改行で区切った場合と、1行に続けて書いた場合で計測する
+
+python -m benchmarks.FreeText
+"""
+
+# PC数
+CHARACTER_COUNT: int = 200
+
+# 以前の実装で計測するPC数、数値のない行の読み取りが遅いため減らす
+LEGACY_CHARACTER_COUNT: int = 1
+
+# 経歴のおおよその文字数
+FREE_NOTE_SIZES: "tuple[int, ...]" = (0, 2000, 8000)
+
+# 計測の実行回数
+REPEAT: int = 3
+
+# 以前の実装の計測の実行回数
+LEGACY_REPEAT: int = 1
+
+
+def LegacyExtractHeightAndWeight(freeNote: str) -> "tuple[str, str]":
+    """以前の実装の経歴からの身長と体重の読み取り"""
+
+    height: str = ""
+    weight: str = ""
+    for line in freeNote.split("&lt;br&gt;"):
+        if "身長" in line:
+            value: str = sub(
+                r".*身長[^\d\.\|]*\|*[^\d\.\|]*([\d\.]+).*", r"\1", line
+            )
+            if value != line:
+                height = value
+
+        if "背丈" in line:
+            value = sub(
+                r".*背丈[^\d\.\|]*\|*[^\d\.\|]*([\d\.]+).*", r"\1", line
+            )
+            if value != line:
+                height = value
+
+        if "体重" in line:
+            value = sub(
+                r".*体重[^\d\.\|]*\|*[^\d\.\|]*([\d\.]+).*", r"\1", line
+            )
+            if value != line:
+                weight = value
+
+    return height, weight
+
+
+def LegacyParseMinorRace(race: str) -> str:
+    """以前の実装のマイナー種族の読み取り"""
+
+    if "ナイトメア" in race or "ウィークリング" in race:
+        return race
+
+    minorRaceMatch: Union[Match[str], None] = search(
+        r"(?<=（)(.+)(?=）)", race
+    )
+    if minorRaceMatch is None:
+        return race
+
+    return minorRaceMatch.group()
+
+
+def LegacyParseMajorRace(race: str) -> str:
+    """以前の実装のメジャー種族の読み取り"""
+
+    return sub(r"（.+）", "", race)
+
+
+def MakeCharacters(
+    freeNoteSize: int, separator: str
+) -> "list[tuple[str, str, str]]":
+    """
+
+    PC名、種族、経歴の組み合わせを作成する
+
+    Args:
+        freeNoteSize int: 経歴のおおよその文字数
+        separator str: 経歴の行の区切り
+    Returns:
+        list[tuple[str, str, str]]: PC名、種族、経歴
+    """
+
+    lines: list[str] = [FREE_NOTE_LINE] * (freeNoteSize // len(FREE_NOTE_LINE))
+    lines.append("身長：165cm　体重：55kg")
+    freeNote: str = separator.join(lines)
+
+    return [
+        (
+            f"|キャラクター{i}《きゃらくたー》",
+            RACES[i % len(RACES)],
+            freeNote,
+        )
+        for i in range(CHARACTER_COUNT)
+    ]
+
+
+def ExtractLegacy(characters: "list[tuple[str, str, str]]") -> None:
+    """
+
+    以前の実装で読み取る
+
+    Args:
+        characters list[tuple[str, str, str]]: PC名、種族、経歴
+    """
+
+    for name, race, freeNote in characters:
+        sub(r"\|([^《]*)《[^》]*》", r"\1", name)
+        LegacyParseMinorRace(race)
+        LegacyParseMajorRace(race)
+        LegacyExtractHeightAndWeight(freeNote)
+
+
+def Extract(characters: "list[tuple[str, str, str]]") -> None:
+    """
+
+    現在の実装で読み取る
+    種族のキャッシュはLambdaの呼び出しごとに空の状態から計測する
+
+    Args:
+        characters list[tuple[str, str, str]]: PC名、種族、経歴
+    """
+
+    ParseMinorRace.cache_clear()
+    ParseMajorRace.cache_clear()
+    for name, race, freeNote in characters:
+        RemoveFurigana(name)
+        ParseMinorRace(race)
+        ParseMajorRace(race)
+        ExtractHeightAndWeight(freeNote)
+
+
+def main() -> None:
+    rows: list[list] = []
+    for freeNoteSize in FREE_NOTE_SIZES:
+        for layout, separator in (
+            ("lines", FREE_NOTE_SEPARATOR),
+            ("one line", ""),
+        ):
+            characters: list[tuple[str, str, str]] = MakeCharacters(
+                freeNoteSize, separator
+            )
+
+            # 読み取り結果が以前の実装と同じことを確認する
+            _, _, freeNote = characters[-1]
+            if LegacyExtractHeightAndWeight(freeNote) != (
+                ExtractHeightAndWeight(freeNote)
+            ):
+                raise Exception("身長と体重の読み取り結果が異なります")
+
+            # 1PCあたりの時間で比べる
+            legacyTime: float = (
+                Measure(
+                    lambda: ExtractLegacy(characters[:LEGACY_CHARACTER_COUNT]),
+                    LEGACY_REPEAT,
+                )
+                / LEGACY_CHARACTER_COUNT
+            )
+            currentTime: float = (
+                Measure(lambda: Extract(characters), REPEAT) / CHARACTER_COUNT
+            )
+            rows.append(
+                [
+                    len(freeNote),
+                    layout,
+                    f"{legacyTime:.3f}",
+                    f"{currentTime:.3f}",
+                    f"{legacyTime / currentTime:.0f}x",
+                ]
+            )
+
+    PrintTable(
+        [
+            "free note chars",
+            "layout",
+            "legacy ms/PC",
+            "current ms/PC",
+            "speedup",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+
+from MyLibrary.Player import Player
+
+from benchmarks.Support import MakeCharacterJson, Measure, PrintTable
+
+"""
+セッション履歴の集計速度
+セッション履歴の行数ごとにPLとPCを作成し、履歴なしの場合との差を集計時間とする
+集計時間には履歴の行のJSONの読み込みも含む
+4回に1回は自分でGMをした履歴にする
+
+python -m benchmarks.HistoryAggregation
+"""
+
+# PL数
+PLAYER_COUNT: int = 20
+
+# 1PLあたりのPC数
+CHARACTERS_PER_PLAYER: int = 3
+
+# セッション履歴の行数
+HISTORY_COUNTS: "tuple[int, ...]" = (100, 300, 1000)
+
+# 計測の実行回数
+REPEAT: int = 3
+
+
+def MakePlayers(historyCount: int) -> "list[list[dict]]":
+    """
+
+    PLごとのPC情報を作成する
+
+    Args:
+        historyCount int: セッション履歴の行数
+    Returns:
+        list[list[dict]]: PLごとのPC情報
+    """
+
+    return [
+        [
+            MakeCharacterJson(i * CHARACTERS_PER_PLAYER + j, historyCount)
+            for j in range(CHARACTERS_PER_PLAYER)
+        ]
+        for i in range(PLAYER_COUNT)
+    ]
+
+
+def BuildPlayers(players: "list[list[dict]]") -> "list[Player]":
+    """
+
+    PLを作成する
+    GMの名前が一致するよう、PL名は全て同じにする
+
+    Args:
+        players list[list[dict]]: PLごとのPC情報
+    Returns:
+        list[Player]: PL
+    """
+
+    return [
+        Player("PL", "2024-01-01T00:00:00.000Z", 10000, 3000, x)
+        for x in players
+    ]
+
+
+def main() -> None:
+    # 履歴以外の読み込み時間
+    emptyPlayers: list[list[dict]] = MakePlayers(0)
+    baseTime: float = Measure(lambda: BuildPlayers(emptyPlayers), REPEAT)
+
+    rows: list[list] = []
+    for historyCount in HISTORY_COUNTS:
+        players: list[list[dict]] = MakePlayers(historyCount)
+        buildTime: float = Measure(lambda: BuildPlayers(players), REPEAT)
+        historyTime: float = buildTime - baseTime
+        rows.append(
+            [
+                historyCount,
+                buildTime,
+                historyTime,
+                f"{historyTime / (PLAYER_COUNT * CHARACTERS_PER_PLAYER):.3f}",
+                BuildPlayers(players)[0].GameMasterTimes,
+            ]
+        )
+
+    print(
+        f"{PLAYER_COUNT} players x {CHARACTERS_PER_PLAYER} characters, "
+        f"build without history {baseTime:.1f} ms"
+    )
+    PrintTable(
+        [
+            "history rows",
+            "build ms",
+            "history ms",
+            "history ms/PC",
+            "GM times",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Callable
+
+from MyLibrary import YtsheetClient
+from MyLibrary.CommonFunction import MakeYtsheetUrl
+from MyLibrary.Constant import Ytsheet
+from requests import get
+
+from benchmarks.Support import MakeYtsheetJson, PrintTable
+from tests.Support import FakeYtsheetServer, ResetContainer
+
+"""
+ゆとシートへの接続の使い回しと圧縮の効果
+ローカルのHTTPサーバーで、受け付けた接続数と送信した本文のバイト数を数える
+使い回すSessionと、リクエストごとに接続するrequests.getを比べる
+
+python -m benchmarks.HttpSession
+"""
+
+# 取得するシート数
+SHEET_COUNT: int = 200
+
+# 同時ダウンロード数
+CONCURRENCIES: "tuple[int, ...]" = (1, 8)
+
+# 1シートあたりの応答時間(秒)
+RESPONSE_DELAY: float = 0.005
+
+# 経歴のおおよその文字数、実際のシートに近い大きさにする
+FREE_NOTE_SIZE: int = 2000
+
+
+def FetchWithoutSession(ytsheetId: str, baseUrl: str) -> None:
+    """
+
+    以前の実装のようにリクエストごとに接続して取得する
+
+    Args:
+        ytsheetId str: ゆとシートのID
+        baseUrl str: ゆとシートのURL
+    """
+
+    response = get(
+        f"{MakeYtsheetUrl(ytsheetId, baseUrl)}&mode=json",
+        timeout=(Ytsheet.HTTP_CONNECT_TIMEOUT, Ytsheet.HTTP_READ_TIMEOUT),
+    )
+    response.raise_for_status()
+    response.json()
+
+
+def FetchWithSession(ytsheetId: str, baseUrl: str) -> None:
+    """
+
+    コンテナ内で使い回すセッションで取得する
+
+    Args:
+        ytsheetId str: ゆとシートのID
+        baseUrl str: ゆとシートのURL
+    """
+
+    YtsheetClient.FetchYtsheet(ytsheetId, baseUrl)
+
+
+def Run(
+    server: FakeYtsheetServer,
+    fetch: Callable[[str, str], None],
+    concurrency: int,
+) -> "list":
+    """
+
+    全てのシートを取得して、接続数、本文のバイト数、処理時間を計測する
+
+    Args:
+        server FakeYtsheetServer: ゆとシートの代わりのサーバー
+        fetch Callable[[str, str], None]: 1シートを取得する処理
+        concurrency int: 同時ダウンロード数
+    Returns:
+        list: 接続数、本文のバイト数(KB)、処理時間(ミリ秒)
+    """
+
+    # 前の計測のセッションを使わない
+    YtsheetClient._session = None
+    server.ResetCounts()
+
+    ytsheetIds: list[str] = list(server.Sheets)
+    startTime: float = perf_counter()
+    with ThreadPoolExecutor(concurrency) as executor:
+        list(executor.map(lambda x: fetch(x, server.BaseUrl), ytsheetIds))
+    elapsed: float = perf_counter() - startTime
+
+    return [
+        server.ConnectionCount,
+        server.ResponseBytes / 1024,
+        elapsed * 1000,
+    ]
+
+
+def main() -> None:
+    ResetContainer()
+    rows: list[list] = []
+    for gzip in (False, True):
+        with FakeYtsheetServer(RESPONSE_DELAY, gzip) as server:
+            for i in range(SHEET_COUNT):
+                server.AddSheet(
+                    str(i), MakeYtsheetJson(i, freeNoteSize=FREE_NOTE_SIZE)
+                )
+
+            for concurrency in CONCURRENCIES:
+                for name, fetch in (
+                    ("requests.get", FetchWithoutSession),
+                    ("Session", FetchWithSession),
+                ):
+                    rows.append(
+                        [
+                            "on" if gzip else "off",
+                            concurrency,
+                            name,
+                        ]
+                        + Run(server, fetch, concurrency)
+                    )
+
+    print(f"{SHEET_COUNT} sheets")
+    PrintTable(
+        [
+            "gzip",
+            "concurrency",
+            "client",
+            "connections",
+            "body KB",
+            "ms",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
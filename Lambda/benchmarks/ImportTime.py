@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+
+import sys
+from subprocess import run
+
+from benchmarks.Support import PrintTable
+from tests.Support import LAMBDA_DIRECTORY
+
+"""
+各Lambdaの読み込み時間と常駐メモリ
+python -X importtimeで新しいプロセスごとにlambda_functionを読み込み、
+読み込みに時間のかかるモジュールを合わせて出力する
+引数でLambdaのディレクトリ名を指定した場合はそのLambdaのみ計測する
+
+python -m benchmarks.ImportTime [Lambda名 ...]
+"""
+
+# 計測するLambda
+HANDLERS: "tuple[str, ...]" = (
+    "GetYtsheetData",
+    "InsertLevelCaps",
+    "InsertPlayers",
+    "UpdateYtsheetSpreadSheet",
+)
+
+# 計測回数、最短の結果を使う
+REPEAT: int = 5
+
+# 出力する時間のかかるモジュールの数
+TOP_MODULE_COUNT: int = 5
+
+# -X importtimeの出力のうち、lambda_functionの読み込み開始を示す行
+IMPORT_START_MARKER: str = "-- lambda_function --"
+
+# 新しいプロセスでlambda_functionを読み込み、時間と常駐メモリを出力する処理
+# テスト用の処理の読み込みを含めないよう、ファイルから直接読み込む
+LOAD_SCRIPT: str = (
+    "import sys\n"
+    "from importlib.util import module_from_spec, spec_from_file_location\n"
+    "from resource import RUSAGE_SELF, getrusage\n"
+    "from time import perf_counter\n"
+    f"print({IMPORT_START_MARKER!r}, file=sys.stderr, flush=True)\n"
+    "startTime = perf_counter()\n"
+    "spec = spec_from_file_location(\n"
+    "    'lambda_function', sys.argv[1] + '/lambda_function.py'\n"
+    ")\n"
+    "spec.loader.exec_module(module_from_spec(spec))\n"
+    "elapsed = perf_counter() - startTime\n"
+    "print(elapsed, getrusage(RUSAGE_SELF).ru_maxrss)\n"
+)
+
+
+def MeasureHandler(
+    name: str,
+) -> "tuple[float, float, list[tuple[str, float]]]":
+    """
+
+    新しいプロセスでLambdaを読み込み、読み込み時間と常駐メモリを計測する
+
+    Args:
+        name str: Lambdaのディレクトリ名
+    Returns:
+        tuple[float, float, list[tuple[str, float]]]:
+            読み込み時間(ミリ秒)、常駐メモリ(MB)、
+            最上位で読み込んだモジュールごとの累計時間(ミリ秒)
+    """
+
+    results: list = []
+    for _ in range(REPEAT):
+        process = run(
+            [sys.executable, "-X", "importtime", "-c", LOAD_SCRIPT, name],
+            cwd=LAMBDA_DIRECTORY,
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+        elapsed, maxRss = process.stdout.split()
+        results.append(
+            (
+                float(elapsed) * 1000,
+                # Linuxのru_maxrssはKB単位
+                int(maxRss) / 1024,
+                ParseImportTime(process.stderr),
+            )
+        )
+
+    return min(results, key=lambda x: x[0])
+
+
+def ParseImportTime(log: str) -> "list[tuple[str, float]]":
+    """
+
+    -X importtimeの出力から最上位で読み込んだモジュールの累計時間を取得する
+
+    Args:
+        log str: -X importtimeの出力
+    Returns:
+        list[tuple[str, float]]: モジュール名と累計時間(ミリ秒)、時間の長い順
+    """
+
+    # インタープリターの起動時に読み込んだモジュールは含めない
+    _, _, log = log.partition(IMPORT_START_MARKER)
+    modules: list[tuple[str, float]] = []
+    for line in log.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        _, cumulative, module = line[len("import time:") :].split("|")
+        # 入れ子のモジュールは名前の前に空白が付く
+        if not cumulative.strip().isdigit() or module[1:2] == " ":
+            continue
+
+        modules.append((module.strip(), int(cumulative) / 1000))
+
+    return sorted(modules, key=lambda x: x[1], reverse=True)
+
+
+def main() -> None:
+    rows: list[list] = []
+    for name in sys.argv[1:] or HANDLERS:
+        elapsed, maxRss, modules = MeasureHandler(name)
+        rows.append(
+            [
+                name,
+                elapsed,
+                maxRss,
+                ", ".join(
+                    f"{module} {milliseconds:.1f}"
+                    for module, milliseconds in modules[:TOP_MODULE_COUNT]
+                ),
+            ]
+        )
+
+    PrintTable(
+        ["handler", "import ms", "max rss MB", "slowest imports ms"], rows
+    )
+
+
+if __name__ == "__main__":
+    main()
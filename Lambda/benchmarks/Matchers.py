@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+
+from re import search
+from typing import Callable, Union
+
+from MyLibrary.Constant import SwordWorld
+from MyLibrary.Style import Style
+from MyLibrary.SwordWorldMatcher import (
+    FindAbyssCurses,
+    FindGeneralSkillName,
+    FindStyle,
+    IsVagrantsCombatFeat,
+)
+
+from benchmarks.Support import MakeYtsheetJson, Measure, PrintTable
+
+"""
+流派、アビスカース、一般技能、ヴァグランツ戦闘特技の検索速度
+以前の定数を1つずつ調べる検索と、SwordWorldMatcherの作成済みの検索を比べる
+一般技能の検索は計測ごとにキャッシュを消してから実行する
+
+python -m benchmarks.Matchers
+"""
+
+# PC数
+CHARACTER_COUNTS: "tuple[int, ...]" = (1000, 3000)
+
+# 計測の実行回数
+REPEAT: int = 3
+
+# 流派を検索する項目
+STYLE_KEYS: "tuple[str, ...]" = (
+    "mysticArts1",
+    "mysticArts2",
+    "mysticArts3",
+    "honorItem1",
+    "honorItem2",
+)
+
+# アビスカースを検索する項目
+ABYSS_CURSE_KEYS: "tuple[str, ...]" = (
+    "weapon1Name",
+    "weapon1Note",
+    "weapon2Name",
+    "weapon2Note",
+    "armour1Name",
+    "armour1Note",
+    "items",
+)
+
+# 一般技能の項目
+GENERAL_SKILL_KEYS: "tuple[str, ...]" = ("commonClass1", "commonClass2")
+
+# 戦闘特技の項目
+COMBAT_FEAT_KEYS: "tuple[str, ...]" = (
+    "combatFeatsLv1",
+    "combatFeatsLv3",
+    "combatFeatsLv5",
+)
+
+
+def LegacyFindStyle(string: str) -> Union[Style, None]:
+    """以前の実装の流派ごとに正規表現で調べる検索"""
+
+    for style in SwordWorld.STYLES:
+        if search(style.GetKeywordsRegexp(), string):
+            return style
+
+    return None
+
+
+def LegacyFindAbyssCurses(string: str) -> "list[str]":
+    """以前の実装のアビスカースごとに調べる検索"""
+
+    result: list[str] = []
+    for abyssCurse in SwordWorld.ABYSS_CURSES:
+        if abyssCurse in string:
+            result.append(abyssCurse)
+
+    return result
+
+
+def LegacyFindGeneralSkillName(string: str) -> Union[str, None]:
+    """以前の実装の公式一般技能ごとに調べる検索"""
+
+    if string in SwordWorld.PROSTITUTE_SKILL_NAME:
+        return SwordWorld.PROSTITUTE_SKILL_NAME
+
+    return next(
+        filter(
+            lambda x: string in x,
+            SwordWorld.OFFICIAL_GENERAL_SKILL_NAMES,
+        ),
+        None,
+    )
+
+
+def LegacyIsVagrantsCombatFeat(string: str) -> bool:
+    """以前の実装のヴァグランツ戦闘特技ごとに調べる判定"""
+
+    return any(
+        list(
+            map(
+                lambda x: string.startswith(x),
+                SwordWorld.VAGRANTS_COMBAT_SKILLS,
+            )
+        )
+    )
+
+
+def RunMatcher(matcher: Callable[[str], object], strings: list) -> list:
+    """
+
+    全ての文字列を検索する
+    一般技能の検索は結果を使い回すため、コンテナの起動直後と同じく
+    キャッシュを消してから実行する
+
+    Args:
+        matcher Callable[[str], object]: 検索する処理
+        strings list: 検索する文字列
+    Returns:
+        list: 検索結果
+    """
+
+    FindGeneralSkillName.cache_clear()
+    return [matcher(x) for x in strings]
+
+
+def Collect(ytsheetJsons: "list[dict]", keys: "tuple[str, ...]") -> list:
+    """
+
+    全てのPCから検索する項目を集める
+
+    Args:
+        ytsheetJsons list[dict]: ゆとシートのデータ
+        keys tuple[str, ...]: 項目名
+    Returns:
+        list: 検索する文字列
+    """
+
+    return [x[y] for x in ytsheetJsons for y in keys]
+
+
+def main() -> None:
+    rows: list[list] = []
+    for characterCount in CHARACTER_COUNTS:
+        ytsheetJsons: list[dict] = [
+            MakeYtsheetJson(i, 0) for i in range(characterCount)
+        ]
+        generalSkills: list[str] = [
+            x.split("(")[0] for x in Collect(ytsheetJsons, GENERAL_SKILL_KEYS)
+        ]
+
+        for name, strings, legacy, current in (
+            (
+                "FindStyle",
+                Collect(ytsheetJsons, STYLE_KEYS),
+                LegacyFindStyle,
+                FindStyle,
+            ),
+            (
+                "FindAbyssCurses",
+                Collect(ytsheetJsons, ABYSS_CURSE_KEYS),
+                LegacyFindAbyssCurses,
+                FindAbyssCurses,
+            ),
+            (
+                "FindGeneralSkillName",
+                generalSkills,
+                LegacyFindGeneralSkillName,
+                FindGeneralSkillName,
+            ),
+            (
+                "IsVagrantsCombatFeat",
+                Collect(ytsheetJsons, COMBAT_FEAT_KEYS),
+                LegacyIsVagrantsCombatFeat,
+                IsVagrantsCombatFeat,
+            ),
+        ):
+            # 以前の実装と同じ結果になることを確認する
+            if RunMatcher(legacy, strings) != RunMatcher(current, strings):
+                raise Exception(f"{name}の検索結果が異なります")
+
+            legacyTime: float = Measure(
+                lambda: RunMatcher(legacy, strings), REPEAT
+            )
+            currentTime: float = Measure(
+                lambda: RunMatcher(current, strings), REPEAT
+            )
+            rows.append(
+                [
+                    characterCount,
+                    name,
+                    len(strings),
+                    legacyTime,
+                    currentTime,
+                    f"{legacyTime / currentTime:.2f}x",
+                ]
+            )
+
+    PrintTable(
+        [
+            "characters",
+            "matcher",
+            "fields",
+            "legacy ms",
+            "current ms",
+            "speedup",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
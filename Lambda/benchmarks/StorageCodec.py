@@ -0,0 +1,236 @@
+# -*- coding: utf-8 -*-
+
+from hashlib import sha256
+from importlib.util import find_spec
+from json import dumps
+from math import ceil
+from random import Random
+from time import perf_counter
+
+from MyLibrary.Constant import Ytsheet
+from MyLibrary.DynamoDBCodec import EncodeItem
+from MyLibrary.YtsheetCodec import (
+    CODEC_NONE,
+    CODEC_ZLIB,
+    CODEC_ZSTD,
+    EncodeCharacter,
+)
+from MyLibrary.YtsheetProjection import ProjectYtsheetData
+
+from benchmarks.Support import FREE_NOTE_SEPARATOR, MakeYtsheetJson, PrintTable
+
+"""
+ゆとシートのデータの保存形式ごとの項目サイズと読み込みキャパシティ
+日本語の経歴と履歴を持つ1シーズン分のPLの項目を作成し、
+圧縮しない文字列とzlib、zstdで圧縮したバイナリを比べる
+zstdはzstandardがインストールされている場合のみ計測する
+
+python -m benchmarks.StorageCodec
+"""
+
+# PL数
+PLAYER_COUNT: int = 300
+
+# 1PLあたりの最大PC数、PLごとに1から順に増やす
+MAX_CHARACTERS_PER_PLAYER: int = 3
+
+# 経歴の最大文字数、PCごとに変える
+MAX_FREE_NOTE_SIZE: int = 8000
+
+# セッション履歴の最大行数、PCごとに変える
+MAX_HISTORY_COUNT: int = 200
+
+# 経歴に使う語句、同じ文の繰り返しより実際の経歴に近い圧縮率にする
+FREE_NOTE_WORDS: "list[str]" = (
+    "冒険者 故郷 村 剣 魔法 神殿 蛮族 遺跡 仲間 師匠 兄 妹 旅 酒場 依頼 報酬 ルキスラ ハーヴェス "
+    "は が を に で と の から まで 守る 探す 戦った 失った 誓った 見つけた 目指している 。 、 ！ ……"
+).split()
+
+# 読み込みキャパシティ1単位あたりのバイト数
+READ_CAPACITY_UNIT_BYTES: int = 4 * 1024
+
+# 項目の最大サイズ
+MAX_ITEM_BYTES: int = 400 * 1024
+
+
+def AttributeSize(attribute: dict) -> int:
+    """
+
+    DynamoDBの属性値のおおよそのバイト数を返す
+    DynamoDBの項目サイズの計算方法に従う
+
+    Args:
+        attribute dict: DynamoDBの属性値
+    Returns:
+        int: バイト数
+    """
+
+    ((typeKey, value),) = attribute.items()
+    if typeKey == "S":
+        return len(value.encode())
+    elif typeKey == "N":
+        return len(value.lstrip("-").replace(".", "")) // 2 + 1
+    elif typeKey == "B":
+        return len(value)
+    elif typeKey == "M":
+        return 3 + sum(
+            len(x.encode()) + AttributeSize(y) + 1 for x, y in value.items()
+        )
+    elif typeKey == "L":
+        return 3 + sum(AttributeSize(x) + 1 for x in value)
+
+    return 1
+
+
+def ItemSize(item: dict) -> int:
+    """
+
+    DynamoDBの項目のおおよそのバイト数を返す
+
+    Args:
+        item dict: DynamoDBの項目
+    Returns:
+        int: バイト数
+    """
+
+    return sum(len(x.encode()) + AttributeSize(y) for x, y in item.items())
+
+
+def MakeFreeNote(index: int, size: int) -> str:
+    """
+
+    PCごとに異なる経歴を作成する
+
+    Args:
+        index int: PCの番号
+        size int: おおよその文字数
+    Returns:
+        str: 経歴
+    """
+
+    random: Random = Random(index)
+    lines: list[str] = []
+    length: int = 0
+    while length < size:
+        line: str = "".join(random.choices(FREE_NOTE_WORDS, k=40))
+        lines.append(line)
+        length += len(line)
+
+    lines.append("身長：165cm　体重：55kg")
+    return FREE_NOTE_SEPARATOR.join(lines)
+
+
+def MakeCharacters() -> "list[list[dict]]":
+    """
+
+    PLごとの圧縮前のPC情報を作成する
+    GetYtsheetDataと同じく集計に使うキーのみ保存する
+
+    Returns:
+        list[list[dict]]: PLごとのPC情報
+    """
+
+    players: list[list[dict]] = []
+    index: int = 0
+    for i in range(PLAYER_COUNT):
+        characters: list[dict] = []
+        for _ in range(i % MAX_CHARACTERS_PER_PLAYER + 1):
+            ytsheetData: dict = MakeYtsheetJson(
+                index, index * 37 % MAX_HISTORY_COUNT
+            )
+            ytsheetData["freeNote"] = MakeFreeNote(
+                index, index * 997 % MAX_FREE_NOTE_SIZE
+            )
+            ytsheetJson: str = dumps(
+                ProjectYtsheetData(ytsheetData), ensure_ascii=False
+            )
+            characters.append(
+                {
+                    "ytsheet_id": f"sheet{index}",
+                    "ytsheet_json": ytsheetJson,
+                    "ytsheet_hash": sha256(ytsheetJson.encode()).hexdigest(),
+                    "projection_version": Ytsheet.PROJECTION_VERSION,
+                    "etag": f'"{index:08x}"',
+                }
+            )
+            index += 1
+
+        players.append(characters)
+
+    return players
+
+
+def MakePlayerItems(players: "list[list[dict]]", codec: str) -> "list[dict]":
+    """
+
+    PLの項目を作成する
+
+    Args:
+        players list[list[dict]]: PLごとの圧縮前のPC情報
+        codec str: 圧縮形式
+    Returns:
+        list[dict]: DynamoDBの項目
+    """
+
+    return [
+        EncodeItem(
+            {
+                "season_id": 1,
+                "id": i,
+                "name": f"PL{i}",
+                "ytsheet_ids": [x["ytsheet_id"] for x in characters],
+                "characters": [EncodeCharacter(x, codec) for x in characters],
+                "update_time": "2024-01-01T00:00:00.000Z",
+            }
+        )
+        for i, characters in enumerate(players, 1)
+    ]
+
+
+def main() -> None:
+    codecs: list[str] = [CODEC_NONE, CODEC_ZLIB]
+    if find_spec("zstandard") is not None:
+        codecs.append(CODEC_ZSTD)
+
+    players: list[list[dict]] = MakeCharacters()
+    rows: list[list] = []
+    for codec in codecs:
+        startTime: float = perf_counter()
+        items: list[dict] = MakePlayerItems(players, codec)
+        elapsed: float = perf_counter() - startTime
+
+        sizes: list[int] = [ItemSize(x) for x in items]
+        rows.append(
+            [
+                codec,
+                sum(sizes) / len(sizes) / 1024,
+                max(sizes) / 1024,
+                sum(1 for x in sizes if x > MAX_ITEM_BYTES),
+                # PLごとに取得する場合と、シーズン全体をQueryする場合
+                sum(ceil(x / READ_CAPACITY_UNIT_BYTES) for x in sizes),
+                ceil(sum(sizes) / READ_CAPACITY_UNIT_BYTES),
+                elapsed * 1000,
+            ]
+        )
+
+    print(
+        f"{PLAYER_COUNT} players, "
+        f"{sum(len(x) for x in players)} characters, "
+        f"strongly consistent reads"
+    )
+    PrintTable(
+        [
+            "codec",
+            "avg item KB",
+            "max item KB",
+            "over 400 KB",
+            "GetItem RCU",
+            "Query RCU",
+            "encode ms",
+        ],
+        rows,
+    )
+
+
+if __name__ == "__main__":
+    main()
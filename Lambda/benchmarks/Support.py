@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+
+from gc import collect
+from json import dumps
+from threading import Lock
+from time import perf_counter, sleep
+from typing import Callable
+
+from MyLibrary.Constant import SwordWorld
+
+"""
+ベンチマークで共通して使う処理
+"""
+
+
+def Measure(function: Callable[[], object], repeat: int = 5) -> float:
+    """
+
+    処理時間を計測する
+    他の処理の影響を減らすため、複数回実行して最短の時間を返す
+
+    Args:
+        function Callable[[], object]: 計測する処理
+        repeat int: 実行回数
+    Returns:
+        float: 処理時間(ミリ秒)
+    """
+
+    best: float = float("inf")
+    for _ in range(repeat):
+        collect()
+        startTime: float = perf_counter()
+        function()
+        best = min(best, perf_counter() - startTime)
+
+    return best * 1000
+
+
+def PrintTable(headers: "list[str]", rows: "list[list]") -> None:
+    """
+
+    計測結果を表形式で出力する
+
+    Args:
+        headers list[str]: 列名
+        rows list[list]: 行ごとの値
+    """
+
+    cells: list[list[str]] = [headers] + [
+        [f"{x:.1f}" if isinstance(x, float) else str(x) for x in row]
+        for row in rows
+    ]
+    widths: list[int] = [
+        max(len(row[i]) for row in cells) for i in range(len(headers))
+    ]
+    for row in cells:
+        print("  ".join(x.rjust(width) for x, width in zip(row, widths)))
+
+
+# ゆとシートの経歴の改行
+FREE_NOTE_SEPARATOR: str = "&lt;br&gt;"
+
+# 経歴の1行、身長に触れるが数値を含まない
+FREE_NOTE_LINE: str = (
+    "幼い頃から身長の高い兄の背中を追いかけて、故郷の村を飛び出した。"
+    "剣の腕はまだ未熟だが、仲間を守るためなら身長差も気にせず前に出る。"
+) * 4
+
+# 種族
+RACES: "tuple[str, ...]" = (
+    "人間",
+    "エルフ",
+    "ドワーフ",
+    "リルドラケン（ブルー）",
+    "ナイトメア（人間）",
+    "ルーンフォーク（戦闘用ルーンフォーク）",
+)
+
+
+def MakeYtsheetJson(
+    index: int, historyCount: int = 20, freeNoteSize: int = 0
+) -> dict:
+    """
+
+    ゆとシートのデータを作成する
+    秘伝、アビスカース、一般技能はSwordWorldの定数から順番に選ぶ
+
+    Args:
+        index int: PCの番号
+        historyCount int: セッション履歴の行数
+        freeNoteSize int: 経歴のおおよその文字数
+    Returns:
+        dict: ゆとシートのデータ
+    """
+
+    styles: list = SwordWorld.STYLES
+    abyssCurses: list[str] = SwordWorld.ABYSS_CURSES
+    generalSkills: list[str] = SwordWorld.OFFICIAL_GENERAL_SKILL_NAMES
+    skillKeys: list[str] = list(SwordWorld.SKILLS)
+
+    ytsheetJson: dict = {
+        "characterName": f"キャラクター{index}|《きゃらくたー》",
+        "race": RACES[index % len(RACES)],
+        "age": str(15 + index % 30),
+        "gender": ("男", "女")[index % 2],
+        "birth": "冒険者",
+        "rank": "ハイペリオン",
+        "faith": "“始祖神”ライフォス",
+        "sin": "0",
+        "level": str(1 + index % 15),
+        "expTotal": str(3000 + index * 37 % 20000),
+        "historyGrowTotal": str(index % 20),
+        "historyHonorTotal": str(index * 13 % 500),
+        "historyMoneyTotal": str(index * 1000),
+        "hpTotal": "40",
+        "mpTotal": "30",
+        "combatFeatsLv1": SwordWorld.VAGRANTS_COMBAT_SKILLS[
+            index % len(SwordWorld.VAGRANTS_COMBAT_SKILLS)
+        ],
+        "combatFeatsLv3": "武器習熟A／ソード",
+        "combatFeatsLv5": "全力攻撃Ⅱ",
+        "combatFeatsAuto": "トレジャーハント,ファストアクション",
+        "mysticArtsNum": "3",
+        "honorItemsNum": "2",
+        "weaponNum": "2",
+        "armourNum": "1",
+        "commonClassNum": "2",
+        "historyNum": str(historyCount),
+    }
+
+    # 技能
+    for i in range(4):
+        ytsheetJson[skillKeys[(index + i * 5) % len(skillKeys)]] = str(i + 3)
+
+    # 能力値
+    for suffix, name in zip(
+        "ABCDEF", ("Dex", "Agi", "Str", "Vit", "Int", "Mnd")
+    ):
+        ytsheetJson[f"sttBase{suffix}"] = str(10 + index % 5)
+        ytsheetJson[f"stt{name}"] = str(20 + index % 7)
+
+    # 秘伝、名誉アイテム
+    for i in range(1, 4):
+        style = styles[(index + i) % len(styles)]
+        ytsheetJson[f"mysticArts{i}"] = f"【{style.Keywords[0]}流の技{i}】"
+    for i in range(1, 3):
+        style = styles[(index * 3 + i) % len(styles)]
+        ytsheetJson[f"honorItem{i}"] = f"{style.Name}への入門"
+
+    # 武器、鎧、所持品
+    for i in range(1, 3):
+        abyssCurse: str = abyssCurses[(index + i) % len(abyssCurses)]
+        ytsheetJson[f"weapon{i}Name"] = f"{abyssCurse}ロングソード"
+        ytsheetJson[f"weapon{i}Note"] = "アビス強化済み"
+    ytsheetJson["armour1Name"] = "ハードレザー"
+    ytsheetJson["armour1Note"] = ""
+    ytsheetJson["items"] = "冒険者セット\n救命草×5\n魔晶石5点×3"
+
+    # 一般技能
+    for i in range(1, 3):
+        generalSkill: str = generalSkills[(index + i) % len(generalSkills)]
+        ytsheetJson[f"commonClass{i}"] = f"{generalSkill}(趣味)"
+        ytsheetJson[f"lvCommon{i}"] = str(i)
+
+    # セッション履歴、4回に1回は自分でGMをする
+    for i in range(1, historyCount + 1):
+        ytsheetJson[f"history{i}Date"] = (
+            f"{2020 + i // 336}-{i // 28 % 12 + 1:02}-{i % 28 + 1:02}"
+        )
+        ytsheetJson[f"history{i}Gm"] = "PL" if i % 4 == 0 else f"GM{i % 7}"
+        ytsheetJson[f"history{i}Note"] = "死亡" if i % 50 == 0 else ""
+
+    # 経歴、最後の行に身長と体重を書く
+    freeNoteLines: list[str] = [FREE_NOTE_LINE] * (
+        freeNoteSize // len(FREE_NOTE_LINE)
+    )
+    freeNoteLines.append("身長：165cm　体重：55kg")
+    ytsheetJson["freeNote"] = FREE_NOTE_SEPARATOR.join(freeNoteLines)
+
+    return ytsheetJson
+
+
+def MakeCharacterJson(
+    index: int, historyCount: int = 20, freeNoteSize: int = 0
+) -> dict:
+    """
+
+    DynamoDBから取得した形式のPC情報を作成する
+
+    Args:
+        index int: PCの番号
+        historyCount int: セッション履歴の行数
+        freeNoteSize int: 経歴のおおよその文字数
+    Returns:
+        dict: PC情報
+    """
+
+    return {
+        "ytsheet_id": f"sheet{index}",
+        "ytsheet_json": dumps(
+            MakeYtsheetJson(index, historyCount, freeNoteSize),
+            ensure_ascii=False,
+        ),
+    }
+
+
+class RemoteClient:
+    """
+    通信の遅延とスロットリングを再現するDynamoDBクライアント
+    motoは同じプロセス内で処理するため、実際のDynamoDBとの往復時間を加える
+    """
+
+    def __init__(self, client, latency: float, unprocessedRatio: float = 0.0):
+        """
+        コンストラクタ
+
+        client: motoのDynamoDBクライアント
+        latency float: 1リクエストあたりの往復時間(秒)
+        unprocessedRatio float:
+            batch_write_itemで未処理として返す項目の割合、スロットリングの代わり
+        """
+
+        self._client = client
+        self._latency: float = latency
+        self._unprocessedRatio: float = unprocessedRatio
+
+        # リクエスト数
+        self.RequestCount: int = 0
+        self._lock: Lock = Lock()
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._client, name)
+        if not callable(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            with self._lock:
+                self.RequestCount += 1
+
+            sleep(self._latency)
+            if name == "batch_write_item":
+                return self._BatchWriteItem(**kwargs)
+
+            return attribute(*args, **kwargs)
+
+        return call
+
+    def _BatchWriteItem(self, RequestItems: dict, **kwargs) -> dict:
+        """
+
+        一部の項目を未処理として返すbatch_write_item
+
+        Args:
+            RequestItems dict: テーブルごとの書き込み内容
+        Returns:
+            dict: batch_write_itemの結果
+        """
+
+        processedItems: dict = {}
+        unprocessedItems: dict = {}
+        for tableName, requestItems in RequestItems.items():
+            unprocessedCount: int = int(
+                len(requestItems) * self._unprocessedRatio
+            )
+            processedCount: int = len(requestItems) - unprocessedCount
+            processedItems[tableName] = requestItems[:processedCount]
+            if unprocessedCount > 0:
+                unprocessedItems[tableName] = requestItems[processedCount:]
+
+        response: dict = self._client.batch_write_item(
+            RequestItems=processedItems, **kwargs
+        )
+        response["UnprocessedItems"] = unprocessedItems
+
+        return response
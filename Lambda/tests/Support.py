@@ -0,0 +1,336 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import annotations
+
+from gzip import compress
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from importlib.util import module_from_spec, spec_from_file_location
+from json import dumps
+from os import environ
+from pathlib import Path
+from threading import Lock, Thread
+from time import sleep
+from types import ModuleType
+from typing import TYPE_CHECKING, Union
+from urllib.parse import parse_qs, urlparse
+
+from MyLibrary import CircuitBreaker, ClientRegistry
+from MyLibrary.Constant import IndexName, TableName
+
+if TYPE_CHECKING:
+    from mypy_boto3_dynamodb.client import DynamoDBClient
+
+"""
+テストで共通して使う処理
+"""
+
+# Lambdaのディレクトリ
+LAMBDA_DIRECTORY: Path = Path(__file__).resolve().parent.parent
+
+
+def LoadHandler(name: str) -> ModuleType:
+    """
+
+    Lambdaのlambda_function.pyを読み込む
+    各Lambdaはパッケージではないため、ファイルから直接読み込む
+
+    Args:
+        name str: Lambdaのディレクトリ名
+    Returns:
+        ModuleType: lambda_functionモジュール
+    """
+
+    spec = spec_from_file_location(
+        f"{name}_lambda_function",
+        LAMBDA_DIRECTORY / name / "lambda_function.py",
+    )
+    if spec is None or spec.loader is None:
+        raise Exception(f"{name}が読み込めません")
+
+    module: ModuleType = module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+def ResetContainer() -> None:
+    """
+
+    コンテナ内で使い回す状態を初期化する
+    モック開始前に作成したクライアントや、前のテストのサーキットブレーカーを使わない
+    """
+
+    # motoは認証情報があれば実際のAWSに接続しない
+    environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+    environ.pop("AWS_PROFILE", None)
+
+    ClientRegistry._clients.clear()
+    CircuitBreaker._circuitBreakers.clear()
+
+
+def CreateTables(dynamoDb: DynamoDBClient) -> None:
+    """
+
+    Lambdaが使う全てのテーブルを作成する
+
+    Args:
+        dynamoDb DynamoDBClient: DynamoDBクライアント
+    """
+
+    def createTable(
+        tableName: str,
+        keys: "list[tuple[str, str]]",
+        indexKeys: "Union[list[tuple[str, str]], None]" = None,
+        indexName: str = "",
+    ) -> None:
+        attributes: dict[str, str] = dict(keys + (indexKeys or []))
+        arguments: dict = {}
+        if indexKeys is not None:
+            arguments["GlobalSecondaryIndexes"] = [
+                {
+                    "IndexName": indexName,
+                    "KeySchema": _MakeKeySchema(indexKeys),
+                    "Projection": {"ProjectionType": "ALL"},
+                }
+            ]
+
+        dynamoDb.create_table(
+            TableName=tableName,
+            KeySchema=_MakeKeySchema(keys),
+            AttributeDefinitions=[
+                {"AttributeName": name, "AttributeType": attributeType}
+                for name, attributeType in attributes.items()
+            ],
+            BillingMode="PAY_PER_REQUEST",
+            **arguments,
+        )
+
+    createTable(
+        TableName.PLAYERS,
+        [("season_id", "N"), ("id", "N")],
+        [("season_id", "N"), ("name", "S")],
+        IndexName.PLAYERS_SEASON_ID_NAME,
+    )
+    createTable(
+        TableName.CHARACTERS, [("season_id", "N"), ("ytsheet_id", "S")]
+    )
+    createTable(TableName.COUNTERS, [("id", "S")])
+    createTable(TableName.RATE_LIMITS, [("id", "S")])
+    createTable(
+        TableName.LEVEL_CAPS, [("season_id", "N"), ("start_datetime", "S")]
+    )
+
+
+def _MakeKeySchema(keys: "list[tuple[str, str]]") -> "list[dict]":
+    """
+
+    キーの定義を作成する
+
+    Args:
+        keys list[tuple[str, str]]: パーティションキーとソートキーの名前と型
+    Returns:
+        list[dict]: キーの定義
+    """
+
+    return [
+        {"AttributeName": name, "KeyType": keyType}
+        for (name, _), keyType in zip(keys, ("HASH", "RANGE"))
+    ]
+
+
+class _Server(ThreadingHTTPServer):
+    """
+    同時接続が多くても接続待ちで遅れないHTTPサーバー
+    """
+
+    request_queue_size = 128
+    daemon_threads = True
+
+
+class FakeYtsheetServer:
+    """
+    ゆとシートの代わりにJSONを返すローカルのHTTPサーバー
+    シートごとに返すデータか、失敗させるステータスコードを設定する
+    """
+
+    def __init__(self, delay: float = 0.0, gzip: bool = False):
+        """
+        コンストラクタ
+
+        delay float: 応答までの待ち時間(秒)、実際の通信の遅延の代わり
+        gzip bool: Accept-Encodingにgzipを含むリクエストに圧縮して返すか
+        """
+
+        self.Delay: float = delay
+        self.Gzip: bool = gzip
+
+        # シートごとのデータとETag
+        self.Sheets: dict[str, tuple[dict, str]] = {}
+
+        # シートごとに返すステータスコードの一覧、先頭から順に使う
+        self.Faults: dict[str, list[int]] = {}
+
+        # シートごとのリクエスト数
+        self.RequestCounts: dict[str, int] = {}
+
+        # シートごとに返したステータスコード
+        self.ResponseStatuses: dict[str, list[int]] = {}
+
+        # 受け付けた接続数
+        self.ConnectionCount: int = 0
+
+        # 送信した本文のバイト数
+        self.ResponseBytes: int = 0
+
+        self._lock: Lock = Lock()
+        self._server: ThreadingHTTPServer = _Server(
+            ("127.0.0.1", 0), self._MakeHandler()
+        )
+        self._thread: Thread = Thread(
+            target=self._server.serve_forever, daemon=True
+        )
+
+        host, port = self._server.server_address[:2]
+        self.BaseUrl: str = f"http://{host}:{port}/ytsheet/sw2.5/"
+
+    def __enter__(self) -> "FakeYtsheetServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+
+    def AddSheet(self, ytsheetId: str, data: dict, etag: str = "") -> None:
+        """
+
+        シートを追加する
+
+        Args:
+            ytsheetId str: ゆとシートのID
+            data dict: 返すデータ
+            etag str: 返すETag、空文字の場合は返さない
+        """
+
+        self.Sheets[ytsheetId] = (data, etag)
+
+    def AddFaults(self, ytsheetId: str, *statusCodes: int) -> None:
+        """
+
+        シートへのリクエストを指定したステータスコードで失敗させる
+        指定した回数だけ失敗した後は、通常どおり返す
+
+        Args:
+            ytsheetId str: ゆとシートのID
+            statusCodes int: 順に返すステータスコード
+        """
+
+        self.Faults.setdefault(ytsheetId, []).extend(statusCodes)
+
+    def ResetCounts(self) -> None:
+        """
+
+        リクエスト数、ステータスコード、接続数、送信したバイト数を初期化する
+        """
+
+        with self._lock:
+            self.RequestCounts.clear()
+            self.ResponseStatuses.clear()
+            self.ConnectionCount = 0
+            self.ResponseBytes = 0
+
+    def _Respond(
+        self, ytsheetId: str, etag: str, acceptEncoding: str
+    ) -> "tuple[int, dict, bytes]":
+        """
+
+        リクエストに対する応答を作成する
+
+        Args:
+            ytsheetId str: ゆとシートのID
+            etag str: If-None-Matchヘッダー
+            acceptEncoding str: Accept-Encodingヘッダー
+        Returns:
+            tuple[int, dict, bytes]: ステータスコード、ヘッダー、本文
+        """
+
+        with self._lock:
+            self.RequestCounts[ytsheetId] = (
+                self.RequestCounts.get(ytsheetId, 0) + 1
+            )
+            faults: list[int] = self.Faults.get(ytsheetId, [])
+            if len(faults) > 0:
+                return faults.pop(0), {}, b""
+
+        if self.Delay > 0:
+            sleep(self.Delay)
+
+        if ytsheetId not in self.Sheets:
+            return 404, {}, b""
+
+        data, sheetEtag = self.Sheets[ytsheetId]
+        headers: dict[str, str] = {"Content-Type": "application/json"}
+        if sheetEtag != "":
+            if etag == sheetEtag:
+                return 304, {"ETag": sheetEtag}, b""
+
+            headers["ETag"] = sheetEtag
+
+        body: bytes = dumps(data, ensure_ascii=False).encode()
+        if self.Gzip and "gzip" in acceptEncoding:
+            headers["Content-Encoding"] = "gzip"
+            body = compress(body)
+
+        return 200, headers, body
+
+    def _MakeHandler(self) -> type:
+        """
+
+        HTTPサーバーのリクエストハンドラーを作成する
+
+        Returns:
+            type: リクエストハンドラー
+        """
+
+        server: FakeYtsheetServer = self
+
+        class Handler(BaseHTTPRequestHandler):
+            # 接続を使い回せるようにする
+            protocol_version = "HTTP/1.1"
+
+            # ヘッダーと本文を分けて送るため、遅延ACKで待たないようにする
+            disable_nagle_algorithm = True
+
+            def setup(self):
+                super().setup()
+                with server._lock:
+                    server.ConnectionCount += 1
+
+            def do_GET(self):
+                query: dict = parse_qs(urlparse(self.path).query)
+                ytsheetId: str = query.get("id", [""])[0]
+                status, headers, body = server._Respond(
+                    ytsheetId,
+                    self.headers.get("If-None-Match", ""),
+                    self.headers.get("Accept-Encoding", ""),
+                )
+                with server._lock:
+                    server.ResponseStatuses.setdefault(ytsheetId, []).append(
+                        status
+                    )
+                    server.ResponseBytes += len(body)
+                self.send_response(status)
+                for key, value in headers.items():
+                    self.send_header(key, value)
+
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                # テストの出力にアクセスログを出さない
+                pass
+
+        return Handler
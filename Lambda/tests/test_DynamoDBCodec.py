@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+from unittest import TestCase, main
+from unittest.mock import patch
+
+from MyLibrary import DynamoDBCodec
+from MyLibrary.DynamoDBCodec import EncodeItem, LazyItem, LazyList
+
+"""
+DynamoDBCodecのテスト
+"""
+
+# DynamoDBから取得した形式の項目
+RAW_ITEM: dict = {
+    "id": {"N": "1"},
+    "name": {"S": "PL"},
+    "characters": {
+        "L": [
+            {"M": {"ytsheet_id": {"S": "a"}, "level": {"N": "3"}}},
+            {"M": {"ytsheet_id": {"S": "b"}, "level": {"N": "5"}}},
+            {"M": {"ytsheet_id": {"S": "c"}, "level": {"N": "7"}}},
+        ]
+    },
+}
+
+# 変換後の項目
+ITEM: dict = {
+    "id": 1,
+    "name": "PL",
+    "characters": [
+        {"ytsheet_id": "a", "level": 3},
+        {"ytsheet_id": "b", "level": 5},
+        {"ytsheet_id": "c", "level": 7},
+    ],
+}
+
+
+class DynamoDBCodecTest(TestCase):
+    def setUp(self):
+        patcher = patch.object(
+            DynamoDBCodec, "_DecodeLazy", wraps=DynamoDBCodec._DecodeLazy
+        )
+        self.decodeLazy = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def testLazyItemDecodesOnce(self):
+        # 読み込んだ属性のみ変換し、2回目以降は変換結果を使う
+        item: LazyItem = LazyItem(RAW_ITEM)
+        self.assertEqual(self.decodeLazy.call_count, 0)
+
+        self.assertEqual(item["name"], "PL")
+        self.assertEqual(item["name"], "PL")
+        self.assertEqual(self.decodeLazy.call_count, 1)
+
+        characters = item["characters"]
+        self.assertIsInstance(characters, LazyList)
+        self.assertIs(item["characters"], characters)
+        self.assertEqual(self.decodeLazy.call_count, 2)
+
+        self.assertEqual(characters[1]["level"], 5)
+        self.assertIs(characters[1], characters[1])
+        self.assertEqual(self.decodeLazy.call_count, 4)
+
+    def testContainsWithoutDecoding(self):
+        item: LazyItem = LazyItem(RAW_ITEM)
+        self.assertIn("characters", item)
+        self.assertNotIn("ytsheet_ids", item)
+        self.assertEqual(list(item), ["id", "name", "characters"])
+        self.assertEqual(len(item), 3)
+        self.assertEqual(self.decodeLazy.call_count, 0)
+
+    def testLazyListSlice(self):
+        characters: LazyList = LazyItem(RAW_ITEM)["characters"]
+        self.assertEqual(characters[1:], ITEM["characters"][1:])
+        self.assertEqual(characters[::-1], ITEM["characters"][::-1])
+        self.assertEqual(characters[5:], [])
+
+        # 切り出した要素も変換結果を使い回す
+        self.assertIs(characters[:2][1], characters[1])
+        self.assertEqual(characters[-1]["ytsheet_id"], "c")
+
+    def testEquality(self):
+        item: LazyItem = LazyItem(RAW_ITEM)
+        characters = item["characters"]
+
+        # 辞書、リストとの比較は両方向で同じ結果にする
+        self.assertTrue(item == ITEM)
+        self.assertTrue(ITEM == item)
+        self.assertTrue(characters == ITEM["characters"])
+        self.assertTrue(ITEM["characters"] == characters)
+        self.assertTrue(characters == tuple(ITEM["characters"]))
+        self.assertTrue(characters[0] == ITEM["characters"][0])
+        self.assertTrue(ITEM["characters"][0] == characters[0])
+
+        # 入れ子のビュー同士は変換前の値で比較する
+        self.assertTrue(item == LazyItem(RAW_ITEM))
+        self.assertTrue(characters == LazyItem(RAW_ITEM)["characters"])
+        self.assertTrue(LazyItem(RAW_ITEM)["characters"][2] == characters[2])
+
+        changed: dict = dict(ITEM, characters=ITEM["characters"][:2])
+        self.assertFalse(item == changed)
+        self.assertFalse(changed == item)
+        self.assertTrue(item != changed)
+        self.assertFalse(characters == ITEM["characters"][:2])
+        self.assertFalse(ITEM["characters"][:2] == characters)
+        self.assertFalse(characters == "abc")
+
+    def testEncodeItemPassesRawThrough(self):
+        item: LazyItem = LazyItem(RAW_ITEM)
+        self.assertIs(EncodeItem(item), RAW_ITEM)
+
+        # 入れ子のビューも変換前の値をそのまま使う
+        encoded: dict = EncodeItem(
+            {"player": item, "characters": item["characters"]}
+        )
+        self.assertIs(encoded["player"]["M"], RAW_ITEM)
+        self.assertIs(encoded["characters"]["L"], RAW_ITEM["characters"]["L"])
+        self.assertEqual(self.decodeLazy.call_count, 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,455 @@
+# -*- coding: utf-8 -*-
+
+from json import loads
+from types import ModuleType
+from unittest import TestCase, main
+from unittest.mock import patch
+
+from moto import mock_aws
+from MyLibrary.CommonFunction import (
+    ConvertDynamoDBToJson,
+    ConvertJsonToDynamoDB,
+    InitDb,
+    QueryItems,
+)
+from MyLibrary.Constant import TableName, Ytsheet
+from MyLibrary.YtsheetCodec import DecodeYtsheetJson
+
+from tests.Support import (
+    CreateTables,
+    FakeYtsheetServer,
+    LoadHandler,
+    ResetContainer,
+)
+
+"""
+GetYtsheetDataのテスト
+ゆとシートの代わりにローカルのHTTPサーバーから取得する
+"""
+
+# 待ち時間なしで取得する流量制限
+RATE_LIMIT: dict = {"Rate": 1000, "Capacity": 1000}
+
+# 待ち時間なしで取得するクローラーの設定
+CRAWLER: dict = {"HostInterval": 0}
+
+SEASON_ID: int = 1
+
+# PCを別項目で保存する場合の、1人のプレイヤーが持つシート数
+# BatchGetItemの1回の上限を超える数にする
+SEPARATED_SHEET_COUNT: int = 150
+
+
+class LambdaContext:
+    """
+    残り時間が十分あるコンテキスト
+    """
+
+    def get_remaining_time_in_millis(self) -> int:
+        return 900000
+
+
+def MakeSheet(name: str) -> dict:
+    """
+
+    ゆとシートのデータを作成する
+
+    Args:
+        name str: PC名
+    Returns:
+        dict: ゆとシートのデータ
+    """
+
+    return {"characterName": name, "level": "3", "playerName": "PL"}
+
+
+class GetYtsheetDataTest(TestCase):
+    def setUp(self):
+        self.mock = mock_aws()
+        self.mock.start()
+        ResetContainer()
+        CreateTables(InitDb())
+
+        self.server: FakeYtsheetServer = FakeYtsheetServer().__enter__()
+        self.handler: ModuleType = LoadHandler("GetYtsheetData")
+
+        # プレイヤー1はa,b、プレイヤー2はb,cを持つ
+        self.players: list[dict] = [
+            {"season_id": SEASON_ID, "id": 1, "ytsheet_ids": ["a", "b"]},
+            {"season_id": SEASON_ID, "id": 2, "ytsheet_ids": ["b", "c"]},
+        ]
+        for player in self.players:
+            InitDb().put_item(
+                TableName=TableName.PLAYERS,
+                Item=ConvertJsonToDynamoDB(
+                    {**player, "name": f"PL{player['id']}", "characters": []}
+                ),
+            )
+
+        for ytsheetId in ("a", "b", "c"):
+            self.server.AddSheet(ytsheetId, MakeSheet(ytsheetId), ytsheetId)
+
+    def tearDown(self):
+        self.server.__exit__()
+        self.mock.stop()
+
+    def Invoke(self, **event) -> dict:
+        """
+
+        Lambdaを実行する
+
+        Args:
+            event: Players、SeasonId、BaseUrl以外のイベント
+        Returns:
+            dict: 実行結果
+        """
+
+        return self.handler.lambda_handler(
+            {
+                "SeasonId": SEASON_ID,
+                "Players": list(map(ConvertJsonToDynamoDB, self.players)),
+                "BaseUrl": self.server.BaseUrl,
+                **event,
+            },
+            LambdaContext(),
+        )
+
+    def LoadPlayerItem(self, playerId: int, seasonId: int = SEASON_ID) -> dict:
+        """
+
+        DBに保存されたプレイヤーの項目を変換せずに取得する
+
+        Args:
+            playerId int: プレイヤーID
+            seasonId int: シーズンID
+        Returns:
+            dict: 変換前の項目
+        """
+
+        return InitDb().get_item(
+            TableName=TableName.PLAYERS,
+            Key=ConvertJsonToDynamoDB({"season_id": seasonId, "id": playerId}),
+        )["Item"]
+
+    def LoadCharacterNames(
+        self, playerId: int, seasonId: int = SEASON_ID
+    ) -> "list[str]":
+        """
+
+        DBに保存されたPC名を取得する
+
+        Args:
+            playerId int: プレイヤーID
+            seasonId int: シーズンID
+        Returns:
+            list[str]: PC名
+        """
+
+        item: dict = ConvertDynamoDBToJson(
+            self.LoadPlayerItem(playerId, seasonId)
+        )
+
+        return [
+            loads(DecodeYtsheetJson(x))["characterName"]
+            for x in item["characters"]
+        ]
+
+    def testCrawl(self):
+        result: dict = self.Invoke(Crawler=CRAWLER)
+
+        self.assertEqual(result["UpdatedPlayerCount"], 2)
+        self.assertEqual(result["DuplicateCount"], 1)
+        self.assertEqual(self.LoadCharacterNames(1), ["a", "b"])
+        self.assertEqual(self.LoadCharacterNames(2), ["b", "c"])
+
+        # 共有するシートも1回だけ取得する
+        self.assertEqual(self.server.RequestCounts, {"a": 1, "b": 1, "c": 1})
+
+        # 2回目はETagで未更新を確認するのみ
+        result = self.Invoke(Crawler=CRAWLER)
+        self.assertEqual(result["NotModifiedCount"], 3)
+        self.assertEqual(result["UpdatedPlayerCount"], 0)
+
+    def testSeasonsShareSheet(self):
+        # 別シーズンのプレイヤー1もbを持つ
+        otherPlayer: dict = {
+            "season_id": SEASON_ID + 1,
+            "id": 1,
+            "ytsheet_ids": ["b", "d"],
+        }
+        InitDb().put_item(
+            TableName=TableName.PLAYERS,
+            Item=ConvertJsonToDynamoDB(
+                {**otherPlayer, "name": "PL1", "characters": []}
+            ),
+        )
+        self.server.AddSheet("d", MakeSheet("d"), "d")
+
+        result: dict = self.handler.lambda_handler(
+            {
+                "Seasons": [
+                    {
+                        "SeasonId": SEASON_ID,
+                        "Players": list(
+                            map(ConvertJsonToDynamoDB, self.players)
+                        ),
+                    },
+                    {
+                        "SeasonId": SEASON_ID + 1,
+                        "Players": [ConvertJsonToDynamoDB(otherPlayer)],
+                    },
+                ],
+                "Crawler": CRAWLER,
+                "BaseUrl": self.server.BaseUrl,
+            },
+            LambdaContext(),
+        )
+
+        # シーズンをまたいで共有するシートも1回だけ取得する
+        self.assertEqual(self.server.RequestCounts["b"], 1)
+        self.assertEqual(
+            self.server.RequestCounts, {"a": 1, "b": 1, "c": 1, "d": 1}
+        )
+        self.assertEqual(result["DuplicateCount"], 2)
+        self.assertEqual(result["UpdatedPlayerCount"], 3)
+        self.assertEqual(self.LoadCharacterNames(2), ["b", "c"])
+        self.assertEqual(self.LoadCharacterNames(1, SEASON_ID + 1), ["b", "d"])
+
+    def testNotModifiedKeepsItem(self):
+        self.Invoke(PlayerIds=[1], RateLimit=RATE_LIMIT)
+        item: dict = self.LoadPlayerItem(1)
+
+        # 2回目は前回のETagで304が返り、項目を書き換えない
+        self.server.ResetCounts()
+        self.Invoke(PlayerIds=[1], RateLimit=RATE_LIMIT)
+
+        self.assertEqual(
+            self.server.ResponseStatuses, {"a": [304], "b": [304]}
+        )
+        self.assertEqual(self.LoadPlayerItem(1), item)
+
+    def testIndex(self):
+        self.Invoke(Index=1, RateLimit=RATE_LIMIT)
+
+        self.assertEqual(self.LoadCharacterNames(1), [])
+        self.assertEqual(self.LoadCharacterNames(2), ["b", "c"])
+
+    def testStartIndex(self):
+        result: dict = self.Invoke(StartIndex=0, Count=2, RateLimit=RATE_LIMIT)
+
+        self.assertEqual(result["NextIndex"], 2)
+        self.assertEqual(result["FailedPlayers"], [])
+        self.assertEqual(self.LoadCharacterNames(1), ["a", "b"])
+        self.assertEqual(self.LoadCharacterNames(2), ["b", "c"])
+
+        # 複数プレイヤーのシートは1回だけ取得する
+        self.assertEqual(self.server.RequestCounts["b"], 1)
+
+    def testPlayerIds(self):
+        result: dict = self.Invoke(PlayerIds=[1], RateLimit=RATE_LIMIT)
+
+        self.assertEqual(result["RemainingPlayerIds"], [])
+        self.assertEqual(self.LoadCharacterNames(1), ["a", "b"])
+        self.assertEqual(self.LoadCharacterNames(2), [])
+
+    def testRetryTransientError(self):
+        self.server.AddFaults("a", 503, 503)
+        result: dict = self.Invoke(Crawler=CRAWLER)
+
+        self.assertEqual(result["FailedSheets"], [])
+        self.assertEqual(self.server.RequestCounts["a"], 3)
+        self.assertEqual(self.LoadCharacterNames(1), ["a", "b"])
+
+    def testFullRefreshKeepsFailedSheet(self):
+        self.Invoke(Crawler=CRAWLER)
+
+        # 取得に失敗したシートは前回取得時のデータを残す
+        self.server.AddFaults("b", 404)
+        result: dict = self.Invoke(Crawler=CRAWLER, FullRefresh=True)
+
+        self.assertEqual(
+            [x["YtsheetId"] for x in result["FailedSheets"]], ["b"]
+        )
+        self.assertEqual(result["NotModifiedCount"], 0)
+        self.assertEqual(self.LoadCharacterNames(1), ["a", "b"])
+        self.assertEqual(self.LoadCharacterNames(2), ["b", "c"])
+
+    def testFullRefreshIndexKeepsFailedSheet(self):
+        self.Invoke(Index=1, RateLimit=RATE_LIMIT)
+
+        self.server.AddFaults("b", 404)
+        with self.assertRaises(Exception):
+            self.Invoke(Index=1, RateLimit=RATE_LIMIT, FullRefresh=True)
+
+        self.assertEqual(self.LoadCharacterNames(2), ["b", "c"])
+
+    def testFailedSheetSharedByPlayers(self):
+        # プレイヤー2のみ前回取得時のデータがある
+        self.Invoke(PlayerIds=[2], RateLimit=RATE_LIMIT)
+
+        self.server.AddFaults("b", 404)
+        result: dict = self.Invoke(StartIndex=0, RateLimit=RATE_LIMIT)
+
+        self.assertEqual(
+            [x["YtsheetId"] for x in result["FailedSheets"]], ["b"]
+        )
+        self.assertEqual(self.LoadCharacterNames(1), ["a"])
+        self.assertEqual(self.LoadCharacterNames(2), ["b", "c"])
+
+    def AddSeparatedPlayer(self) -> dict:
+        """
+
+        多くのシートを持つプレイヤー3を追加する
+
+        Returns:
+            dict: プレイヤー情報
+        """
+
+        player: dict = {
+            "season_id": SEASON_ID,
+            "id": 3,
+            "ytsheet_ids": [f"s{i}" for i in range(SEPARATED_SHEET_COUNT)],
+        }
+        self.players.append(player)
+        InitDb().put_item(
+            TableName=TableName.PLAYERS,
+            Item=ConvertJsonToDynamoDB(
+                {**player, "name": "PL3", "update_time": ""}
+            ),
+        )
+        for ytsheetId in player["ytsheet_ids"]:
+            self.server.AddSheet(ytsheetId, MakeSheet(ytsheetId), ytsheetId)
+
+        return player
+
+    def LoadSeparatedCharacters(self) -> "dict[str, dict]":
+        """
+
+        charactersテーブルに保存されたPC情報を取得する
+
+        Returns:
+            dict[str, dict]: ゆとシートのIDごとの変換前の項目
+        """
+
+        return {
+            x["ytsheet_id"]["S"]: x
+            for x in QueryItems(
+                InitDb(),
+                TableName=TableName.CHARACTERS,
+                KeyConditionExpression="season_id = :season_id",
+                ExpressionAttributeValues=ConvertJsonToDynamoDB(
+                    {":season_id": SEASON_ID}
+                ),
+            )
+        }
+
+    @patch.object(Ytsheet, "STORE_CHARACTERS_SEPARATELY", True)
+    def testSeparatedRoundTrip(self):
+        player: dict = self.AddSeparatedPlayer()
+
+        # シート数の多いプレイヤーは残り時間の見積もりで後回しになるため個別に取得
+        self.Invoke(StartIndex=0, Count=2, RateLimit=RATE_LIMIT)
+        self.Invoke(PlayerIds=[3], RateLimit=RATE_LIMIT)
+
+        # PCごとの項目に保存し、プレイヤーにはまとめて保存しない
+        self.assertEqual(
+            set(self.LoadSeparatedCharacters()),
+            {"a", "b", "c", *player["ytsheet_ids"]},
+        )
+        self.assertNotIn("characters", self.LoadPlayerItem(3))
+
+        characters: list[dict] = self.handler.loadCharacters(
+            InitDb(), SEASON_ID, player
+        )
+        self.assertEqual(
+            [loads(DecodeYtsheetJson(x))["characterName"] for x in characters],
+            player["ytsheet_ids"],
+        )
+
+        # スプレッドシートの更新でもプレイヤーの全てのPCを読み込む
+        players = LoadHandler("UpdateYtsheetSpreadSheet").LoadSeparatedPlayers(
+            InitDb(), SEASON_ID, 10000, 3000
+        )
+        self.assertEqual([x.Name for x in players], ["PL1", "PL2", "PL3"])
+        self.assertEqual(
+            [x.Name for x in players[2].Characters], player["ytsheet_ids"]
+        )
+
+    @patch.object(Ytsheet, "STORE_CHARACTERS_SEPARATELY", True)
+    def testSeparatedUnprocessedKeys(self):
+        player: dict = self.AddSeparatedPlayer()
+        self.Invoke(PlayerIds=[3], RateLimit=RATE_LIMIT)
+
+        # 1回目の応答では要求の半分を未処理として返す
+        dynamoDb = InitDb()
+        batchGetItem = dynamoDb.batch_get_item
+        requestedKeyCounts: list[int] = []
+
+        def BatchGetItemHalf(RequestItems: dict) -> dict:
+            keys: list[dict] = RequestItems[TableName.CHARACTERS]["Keys"]
+            requestedKeyCounts.append(len(keys))
+            if len(requestedKeyCounts) > 1:
+                return batchGetItem(RequestItems=RequestItems)
+
+            half: int = len(keys) // 2
+            response: dict = batchGetItem(
+                RequestItems={TableName.CHARACTERS: {"Keys": keys[:half]}}
+            )
+            response["UnprocessedKeys"] = {
+                TableName.CHARACTERS: {"Keys": keys[half:]}
+            }
+            return response
+
+        with patch.object(dynamoDb, "batch_get_item", BatchGetItemHalf):
+            characters: dict[str, dict] = self.handler.batchGetCharacters(
+                dynamoDb, SEASON_ID, player["ytsheet_ids"] + ["s0", "x"]
+            )
+
+        self.assertEqual(set(characters), set(player["ytsheet_ids"]))
+        self.assertEqual(
+            requestedKeyCounts,
+            [
+                self.handler.BATCH_GET_ITEM_MAX_KEYS,
+                self.handler.BATCH_GET_ITEM_MAX_KEYS // 2,
+                SEPARATED_SHEET_COUNT
+                + 1
+                - self.handler.BATCH_GET_ITEM_MAX_KEYS,
+            ],
+        )
+
+    @patch.object(Ytsheet, "STORE_CHARACTERS_SEPARATELY", True)
+    def testSeparatedRefreshOneSheet(self):
+        self.AddSeparatedPlayer()
+        self.Invoke(PlayerIds=[3], RateLimit=RATE_LIMIT)
+        storedItems: dict[str, dict] = self.LoadSeparatedCharacters()
+
+        # 更新されたシートの項目のみ書き込む
+        self.server.AddSheet("s7", MakeSheet("s7更新"), "s7-2")
+        dynamoDb = InitDb()
+        with patch.object(
+            dynamoDb, "put_item", wraps=dynamoDb.put_item
+        ) as putItem:
+            self.Invoke(PlayerIds=[3], RateLimit=RATE_LIMIT)
+
+        self.assertEqual(
+            [
+                x.kwargs["Item"]["ytsheet_id"]["S"]
+                for x in putItem.call_args_list
+                if x.kwargs["TableName"] == TableName.CHARACTERS
+            ],
+            ["s7"],
+        )
+
+        items: dict[str, dict] = self.LoadSeparatedCharacters()
+        self.assertEqual(
+            loads(DecodeYtsheetJson(ConvertDynamoDBToJson(items.pop("s7"))))[
+                "characterName"
+            ],
+            "s7更新",
+        )
+        del storedItems["s7"]
+        self.assertEqual(items, storedItems)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+# -*- coding: utf-8 -*-
+
+from types import ModuleType
+from unittest import TestCase, main
+from unittest.mock import patch
+
+from moto import mock_aws
+from MyLibrary.CommonFunction import (
+    ConvertDynamoDBToView,
+    ConvertJsonToDynamoDB,
+    InitDb,
+    QueryItems,
+)
+from MyLibrary.Constant import TableName
+from MyLibrary.IdAllocator import IdAllocator
+
+from tests.Support import CreateTables, LoadHandler, ResetContainer
+
+"""
+InsertPlayersのテスト
+"""
+
+SEASON_ID: int = 1
+
+
+class InsertPlayersTest(TestCase):
+    def setUp(self):
+        self.mock = mock_aws()
+        self.mock.start()
+        ResetContainer()
+        CreateTables(InitDb())
+        self.handler: ModuleType = LoadHandler("InsertPlayers")
+
+    def tearDown(self):
+        self.mock.stop()
+
+    def Invoke(self, players: "list[tuple[str, str]]", bulkSync: bool):
+        """
+
+        Lambdaを実行する
+
+        Args:
+            players list[tuple[str, str]]: プレイヤー名とゆとシートのID
+            bulkSync bool: True 一括で登録する
+        """
+
+        self.handler.lambda_handler(
+            {
+                "SeasonId": SEASON_ID,
+                "Players": [
+                    {"Name": name, "YtsheetId": ytsheetId}
+                    for name, ytsheetId in players
+                ],
+                "BulkSync": bulkSync,
+            },
+            None,
+        )
+
+    def LoadPlayers(self) -> "dict[str, tuple[int, list[str]]]":
+        """
+
+        登録されたプレイヤーを取得する
+
+        Returns:
+            dict[str, tuple[int, list[str]]]:
+                プレイヤー名ごとのIDとゆとシートのID
+        """
+
+        return {
+            x["name"]: (x["id"], list(x["ytsheet_ids"]))
+            for x in ConvertDynamoDBToView(
+                list(
+                    QueryItems(
+                        InitDb(),
+                        TableName=TableName.PLAYERS,
+                        KeyConditionExpression="season_id = :season_id",
+                        ExpressionAttributeValues=ConvertJsonToDynamoDB(
+                            {":season_id": SEASON_ID}
+                        ),
+                    )
+                )
+            )
+        }
+
+    def testBulkSync(self):
+        self.Invoke([("A", "a1"), ("B", "b1"), ("A", "a2")], True)
+        self.assertEqual(
+            self.LoadPlayers(), {"A": (1, ["a1", "a2"]), "B": (2, ["b1"])}
+        )
+
+        # 登録済みのシートは追加せず、新しいプレイヤーは続きのIDにする
+        self.Invoke([("B", "b1"), ("B", "b2"), ("C", "c1")], True)
+        self.assertEqual(
+            self.LoadPlayers(),
+            {
+                "A": (1, ["a1", "a2"]),
+                "B": (2, ["b1", "b2"]),
+                "C": (3, ["c1"]),
+            },
+        )
+
+    def testPutPlayers(self):
+        self.Invoke([("A", "a1"), ("B", "b1")], False)
+        self.Invoke([("A", "a2"), ("C", "c1")], False)
+
+        self.assertEqual(
+            self.LoadPlayers(),
+            {
+                "A": (1, ["a1", "a2"]),
+                "B": (2, ["b1"]),
+                "C": (3, ["c1"]),
+            },
+        )
+
+    def PutPlayer(self, playerId: int, name: str) -> None:
+        """
+
+        カウンターを使わずにプレイヤーを登録する
+
+        Args:
+            playerId int: プレイヤーID
+            name str: プレイヤー名
+        """
+
+        InitDb().put_item(
+            TableName=TableName.PLAYERS,
+            Item=ConvertJsonToDynamoDB(
+                {
+                    "season_id": SEASON_ID,
+                    "id": playerId,
+                    "name": name,
+                    "ytsheet_ids": [],
+                }
+            ),
+        )
+
+    def testReserveSeedsFromMaxId(self):
+        # カウンターがない場合は既存IDの最大値の続きから払い出す
+        self.PutPlayer(7, "A")
+        self.PutPlayer(42, "B")
+        self.handler.DynamoDb = InitDb()
+        allocator: IdAllocator = self.handler.makeIdAllocator(SEASON_ID)
+
+        self.assertEqual(allocator.Reserve(1), range(43, 44))
+        self.assertEqual(allocator.Reserve(1), range(44, 45))
+
+        counter: dict = ConvertDynamoDBToView(
+            InitDb().get_item(
+                TableName=TableName.COUNTERS,
+                Key=ConvertJsonToDynamoDB({"id": allocator.CounterId}),
+            )["Item"]
+        )
+        self.assertEqual(counter["last_id"], 44)
+
+    def testReserveBlockInOneAdd(self):
+        # まとめて確保するIDは1回の加算で連続した範囲になる
+        dynamoDb = InitDb()
+        allocator: IdAllocator = IdAllocator(dynamoDb, "test", lambda: 0)
+        self.assertEqual(allocator.Reserve(3), range(1, 4))
+
+        with patch.object(
+            dynamoDb, "update_item", wraps=dynamoDb.update_item
+        ) as updateItem:
+            reserved: range = allocator.Reserve(100)
+
+        self.assertEqual(updateItem.call_count, 1)
+        self.assertEqual(
+            updateItem.call_args.kwargs["UpdateExpression"],
+            "ADD last_id :count",
+        )
+        self.assertEqual(list(reserved), list(range(4, 104)))
+
+    def testReserveRace(self):
+        # カウンターの作成で負けた側も、勝った側と重ならない範囲を確保する
+        dynamoDb = InitDb()
+        winner: IdAllocator = IdAllocator(dynamoDb, "test", lambda: 5)
+        winnerReserved: list[range] = []
+
+        def LoadMaxIdAfterWinner() -> int:
+            # 負けた側が最大値を取得している間に、勝った側が先に作成する
+            winnerReserved.append(winner.Reserve(10))
+            return 5
+
+        loser: IdAllocator = IdAllocator(
+            dynamoDb, "test", LoadMaxIdAfterWinner
+        )
+        loserReserved: range = loser.Reserve(10)
+
+        self.assertEqual(winnerReserved, [range(6, 16)])
+        self.assertEqual(loserReserved, range(16, 26))
+        self.assertFalse(set(winnerReserved[0]) & set(loserReserved))
+
+
+if __name__ == "__main__":
+    main()
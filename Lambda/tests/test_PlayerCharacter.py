@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+from json import dumps
+from unittest import TestCase, main
+
+from MyLibrary.PlayerCharacter import PlayerCharacter
+from MyLibrary.SwordWorldMatcher import IsVagrantsCombatFeat
+
+"""
+PlayerCharacterのテスト
+"""
+
+
+def MakeCharacter(**ytsheetJson: str) -> PlayerCharacter:
+    """
+
+    PCを作成する
+
+    Args:
+        ytsheetJson dict[str, str]: ゆとシートのデータ
+    Returns:
+        PlayerCharacter: PC
+    """
+
+    return PlayerCharacter(
+        {"ytsheet_id": "sheet", "ytsheet_json": dumps(ytsheetJson)},
+        "PL",
+        10000,
+        3000,
+    )
+
+
+class PlayerCharacterTest(TestCase):
+    def testVagrantsLv1FeatIgnoresLevel(self):
+        # 1レベルの戦闘特技はレベルが0のシートでも確認する
+        self.assertTrue(
+            MakeCharacter(level="0", combatFeatsLv1="追い打ち").IsVagrants()
+        )
+        self.assertTrue(
+            MakeCharacter(level="1", combatFeatsLv1="追い打ち").IsVagrants()
+        )
+        self.assertFalse(
+            MakeCharacter(
+                level="0", combatFeatsLv1="武器習熟A／ソード"
+            ).IsVagrants()
+        )
+
+    def testIsVagrantsCombatFeat(self):
+        # 習得時の注記が付いていても先頭の名称で判定する
+        self.assertTrue(IsVagrantsCombatFeat("追い打ち"))
+        self.assertTrue(IsVagrantsCombatFeat("クイックキャスト（自動）"))
+        self.assertFalse(IsVagrantsCombatFeat("全力攻撃Ⅰ"))
+        self.assertFalse(IsVagrantsCombatFeat(""))
+
+    def testVagrantsLv1FeatWithLv3Feat(self):
+        # レベルが0のシートでは1レベルの戦闘特技のみ確認する
+        self.assertTrue(
+            MakeCharacter(
+                level="0",
+                combatFeatsLv1="追い打ち",
+                combatFeatsLv3="全力攻撃Ⅰ",
+            ).IsVagrants()
+        )
+        self.assertFalse(
+            MakeCharacter(
+                level="0",
+                combatFeatsLv1="全力攻撃Ⅰ",
+                combatFeatsLv3="追い打ち",
+            ).IsVagrants()
+        )
+
+    def testVagrantsBattleDancerFeat(self):
+        # バトルダンサーの戦闘特技はバトルダンサー技能がある場合のみ確認する
+        self.assertTrue(
+            MakeCharacter(
+                level="0", lvBat="1", combatFeatsLv1bat="追い打ち"
+            ).IsVagrants()
+        )
+        self.assertFalse(
+            MakeCharacter(level="1", combatFeatsLv1bat="追い打ち").IsVagrants()
+        )
+
+    def testVagrantsFeatNeedsLevel(self):
+        # 3レベル以降の戦闘特技は習得済みのレベルのみ確認する
+        self.assertFalse(
+            MakeCharacter(level="2", combatFeatsLv3="追い打ち").IsVagrants()
+        )
+        self.assertTrue(
+            MakeCharacter(level="3", combatFeatsLv3="追い打ち").IsVagrants()
+        )
+
+
+if __name__ == "__main__":
+    main()
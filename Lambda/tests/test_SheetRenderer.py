@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+
+from json import dumps
+from types import ModuleType
+from unittest import TestCase, main
+
+from gspread.utils import a1_to_rowcol
+from MyLibrary.Player import Player
+from MyLibrary.SheetRenderer import RenderSheets, Total
+
+from tests.Support import LoadHandler
+
+"""
+SheetRendererのテスト
+"""
+
+
+class FakeWorksheet:
+    """
+    書き込んだ内容を記録するシート
+    """
+
+    def __init__(self):
+        self.col_count: int = 26
+        self.BatchFormats: list[list[dict]] = []
+
+    def batch_format(self, formats: "list[dict]") -> None:
+        # 書き込み後に変更されても記録が変わらないよう複製する
+        self.BatchFormats.append(list(formats))
+
+    def __getattr__(self, name: str):
+        return lambda *args, **kwargs: None
+
+
+def MakePlayer(level: str) -> Player:
+    """
+
+    PCを1人持つPLを作成する
+
+    Args:
+        level str: PCのレベル
+    Returns:
+        Player: PL
+    """
+
+    return Player(
+        "PL",
+        "2024-01-01T00:00:00.000Z",
+        10000,
+        3000,
+        [
+            {
+                "ytsheet_id": "sheet",
+                "ytsheet_json": dumps(
+                    {
+                        "level": level,
+                        "combatFeatsLv1": "追い打ち",
+                        "combatFeatsLv3": "全力攻撃Ⅰ",
+                    }
+                ),
+            }
+        ],
+    )
+
+
+class SheetRendererTest(TestCase):
+    def setUp(self):
+        self.handler: ModuleType = LoadHandler("UpdateYtsheetSpreadSheet")
+
+    def testTotalIsAbstract(self):
+        with self.assertRaises(TypeError):
+            Total()
+
+    def testWriteTwice(self):
+        # 同じシートに2回書き込んでも書式が重複しない
+        renderer = self.handler.CreateAbilitySheet()
+        RenderSheets([MakePlayer("0")], [renderer])
+        worksheet: FakeWorksheet = FakeWorksheet()
+        renderer.Write(worksheet)
+        renderer.Write(worksheet)
+
+        first, second = worksheet.BatchFormats
+        self.assertEqual(first, second)
+
+    def testLv1CombatFeatNotGrayedOut(self):
+        # 1レベルの戦闘特技はレベルが0のPCでもグレーにしない
+        renderer = self.handler.CreateAbilitySheet()
+        RenderSheets([MakePlayer("0")], [renderer])
+        worksheet: FakeWorksheet = FakeWorksheet()
+        renderer.Write(worksheet)
+
+        grayOutColumns: list[int] = [
+            a1_to_rowcol(x["range"].split(":")[0])[1]
+            for x in worksheet.BatchFormats[0]
+            if x["format"] == self.handler.GRAY_OUT_FORMAT
+        ]
+        self.assertNotIn(renderer.Headers.index("Lv.1") + 1, grayOutColumns)
+        self.assertIn(renderer.Headers.index("Lv.3") + 1, grayOutColumns)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+from threading import Barrier, Lock, Thread
+from time import monotonic
+from unittest import TestCase, main
+
+from moto import mock_aws
+from MyLibrary.CommonFunction import ConvertJsonToDynamoDB, InitDb
+from MyLibrary.Constant import TableName
+from MyLibrary.TokenBucket import TokenBucket
+
+from tests.Support import CreateTables, ResetContainer
+
+"""
+TokenBucketのテスト
+"""
+
+# 1秒あたりに補充するトークン数
+RATE: float = 5.0
+
+# 貯められるトークン数の上限
+CAPACITY: float = 2.0
+
+# 計測時間(秒)
+DURATION: float = 3.0
+
+
+class SerializedClient:
+    """
+    1件ずつリクエストを処理するDynamoDBクライアント
+    motoは条件付き書き込みの確認と書き込みを別のスレッドと同時に行うことがあるため、
+    DynamoDBと同じく1件ずつ不可分に処理されるようにする
+    """
+
+    def __init__(self, client, lock: Lock):
+        """
+        コンストラクタ
+
+        client: DynamoDBクライアント
+        lock Lock: 全てのワーカーで共有するロック
+        """
+
+        self._client = client
+        self._lock: Lock = lock
+
+    def __getattr__(self, name: str):
+        attribute = getattr(self._client, name)
+        if not callable(attribute):
+            return attribute
+
+        def call(*args, **kwargs):
+            with self._lock:
+                return attribute(*args, **kwargs)
+
+        return call
+
+
+class TokenBucketTest(TestCase):
+    def setUp(self):
+        self.mock = mock_aws()
+        self.mock.start()
+        ResetContainer()
+        CreateTables(InitDb())
+
+    def tearDown(self):
+        self.mock.stop()
+
+    def RunWorkers(self, workerCount: int) -> "tuple[int, float]":
+        """
+
+        同じバケットを共有する複数のワーカーで、計測時間の間トークンを取得し続ける
+
+        Args:
+            workerCount int: ワーカー数
+        Returns:
+            tuple[int, float]: 取得できたトークン数と経過時間(秒)
+        """
+
+        acquiredCount: int = 0
+        lock: Lock = Lock()
+        requestLock: Lock = Lock()
+        barrier: Barrier = Barrier(workerCount + 1)
+        lastAcquireTime: float = 0.0
+
+        def work() -> None:
+            nonlocal acquiredCount, lastAcquireTime
+
+            # Lambdaごとに別のインスタンスを使う
+            bucket: TokenBucket = TokenBucket(
+                SerializedClient(InitDb(), requestLock),  # type: ignore
+                "ytsheet",
+                RATE,
+                CAPACITY,
+            )
+            barrier.wait()
+            while monotonic() < endTime:
+                bucket.Acquire()
+                with lock:
+                    acquiredCount += 1
+                    lastAcquireTime = monotonic()
+
+        startTime: float = monotonic()
+        endTime: float = startTime + DURATION
+        threads: list[Thread] = [
+            Thread(target=work) for _ in range(workerCount)
+        ]
+        for thread in threads:
+            thread.start()
+
+        barrier.wait()
+        for thread in threads:
+            thread.join()
+
+        return acquiredCount, lastAcquireTime - startTime
+
+    def testConcurrentWorkersStayUnderCeiling(self):
+        for workerCount in (1, 4, 8):
+            with self.subTest(workerCount=workerCount):
+                InitDb().delete_item(
+                    TableName=TableName.RATE_LIMITS,
+                    Key=ConvertJsonToDynamoDB({"id": "ytsheet"}),
+                )
+                acquiredCount, elapsed = self.RunWorkers(workerCount)
+
+                # 最初に貯まっている分と経過時間分の補充を超えない
+                self.assertLessEqual(acquiredCount, CAPACITY + RATE * elapsed)
+
+                # 競合しても上限近くまでは取得できる
+                self.assertGreaterEqual(acquiredCount, RATE * DURATION * 0.7)
+
+
+if __name__ == "__main__":
+    main()